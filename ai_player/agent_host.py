@@ -0,0 +1,266 @@
+# ai_player/agent_host.py
+
+import importlib
+import struct
+import time
+from multiprocessing import shared_memory
+from game_engine.grid_manager import Grid
+from game_engine.headless_game import ACTIONS
+from game_engine.processes import spawn_context
+from game_engine.tetromino_manager import Tetromino, SHAPE_NAMES
+
+# Host -> agent: sequence number of the state to move on (0 asks the agent to exit).
+COMMAND = struct.Struct('<I')
+# Agent -> host: sequence number answered and index into ACTIONS.
+REPLY = struct.Struct('<IB')
+READY = 0xFFFFFFFF  # Sequence number of the reply sent once the bot has loaded
+NO_SHAPE = 255
+AGENT_COLOR = (128, 128, 128)  # Agents see occupancy only
+
+
+def state_struct(grid_height, preview_size):
+    """Shared state layout: sequence, piece number, shape, rotation, x, y, preview shapes, row bitmasks."""
+    return struct.Struct(f'<IIBBhh{preview_size}B{grid_height}Q')
+
+
+def load_policy(spec, seed=None):
+    """
+    Build the bot an agent process runs.
+
+    Parameters:
+        spec (str): A name from POLICIES, or 'module:factory' for a bot that
+            is not registered; the factory is called with seed=seed.
+    """
+    if ':' in spec:
+        module, factory = spec.split(':', 1)
+        return getattr(importlib.import_module(module), factory)(seed=seed)
+    from ai_player.policies import create_policy
+    return create_policy(spec, seed=seed)
+
+
+class _PreviewQueue:
+    """The part of PieceGenerator a bot reads."""
+
+    def __init__(self):
+        self.shapes = ()
+
+    def preview(self, count=None):
+        return self.shapes if count is None else self.shapes[:count]
+
+
+class AgentView:
+    """
+    Read-only copy of the host's game inside an agent process.
+
+    Offers the attributes bots use on HeadlessGame (grid, tetromino,
+    piece_generator.preview(), get_next_shapes(), pieces_placed and the grid
+    size), rebuilt from the shared state. Only rows that changed are
+    rewritten, and the Tetromino object stays the same while the same
+    piece is in play, so bots that plan once per piece keep working.
+    """
+
+    def __init__(self, grid_width, grid_height):
+        self.grid_width = grid_width
+        self.grid_height = grid_height
+        self.grid = Grid(grid_width, grid_height)
+        self.tetromino = None
+        self.piece_generator = _PreviewQueue()
+        self.pieces_placed = -1
+        self.game_over = False
+
+    def load(self, values):
+        """Apply the unpacked shared state, minus its sequence number."""
+        piece, shape, rotation, x, y = values[:5]
+        preview_size = len(values) - 5 - self.grid_height
+        self.piece_generator.shapes = tuple(
+            SHAPE_NAMES[index] for index in values[5:5 + preview_size] if index != NO_SHAPE
+        )
+        for y_row, bits in enumerate(values[5 + preview_size:]):
+            if self.grid.get_row(y_row) != bits:
+                self.grid.set_row(y_row, [(1, AGENT_COLOR) if bits >> column & 1 else (0, None)
+                                          for column in range(self.grid_width)])
+        if piece != self.pieces_placed or self.tetromino is None:
+            self.pieces_placed = piece
+            self.tetromino = Tetromino(SHAPE_NAMES[shape])
+        tetromino = self.tetromino
+        tetromino.rotation = rotation
+        tetromino.position = (x, y)
+
+    def get_next_shapes(self, count=None):
+        return self.piece_generator.preview(count)
+
+
+def run_agent(spec, seed, shm_name, conn, grid_width, grid_height, preview_size):
+    """
+    Agent process main loop: wait for a sequence number, read the state, reply.
+
+    The sequence number in the block is checked again after the state is
+    copied, so a state the host started overwriting mid-copy is skipped
+    instead of read torn.
+    """
+    shm = shared_memory.SharedMemory(name=shm_name)
+    layout = state_struct(grid_height, preview_size)
+    try:
+        policy = load_policy(spec, seed)
+        view = AgentView(grid_width, grid_height)
+        conn.send_bytes(REPLY.pack(READY, 0))
+        while True:
+            (sequence,) = COMMAND.unpack(conn.recv_bytes())
+            # Skip straight to the newest state if the host moved on without us.
+            while sequence and conn.poll(0):
+                (sequence,) = COMMAND.unpack(conn.recv_bytes())
+            if sequence == 0:
+                return
+            values = layout.unpack_from(shm.buf)
+            if values[0] != sequence or COMMAND.unpack_from(shm.buf)[0] != sequence:
+                continue
+            view.load(values[1:])
+            action = policy.choose_action(view)
+            conn.send_bytes(REPLY.pack(sequence, ACTIONS.index(action)))
+    except (EOFError, BrokenPipeError, KeyboardInterrupt):
+        return
+    finally:
+        shm.close()
+
+
+class AgentHost:
+    """
+    Runs a bot in its own process and asks it for one action per move.
+
+    The host writes the board as one bitmask per row, the current piece and
+    the preview queue into a shared memory block, then sends the agent a
+    4-byte sequence number; the agent answers with a 5-byte (sequence,
+    action) reply. Nothing is pickled per move, so a move costs one small
+    message each way. The host never reads the shared block back, so an
+    agent that scribbles on it only confuses itself.
+
+    An agent that does not answer within move_deadline_ms forfeits the move
+    and timeout_action is played instead ('down' acts like a gravity tick,
+    so the game keeps going). Its late answer is discarded. An agent that
+    exits, crashes or answers with an unknown action raises RuntimeError
+    from choose_action().
+
+    Plays through choose_action(game), like the policies, for Game and
+    HeadlessGame alike.
+    """
+
+    def __init__(self, spec, grid_width=10, grid_height=20, preview_size=5, move_deadline_ms=50.0,
+                 timeout_action='down', seed=None, start_timeout=10.0):
+        """
+        Parameters:
+            spec (str): Bot to run, as accepted by load_policy().
+            preview_size (int): Preview shapes shared with the agent.
+            start_timeout (float): Seconds the agent may take to load its bot.
+        """
+        if grid_width > 64:
+            raise ValueError("Shared rows are stored as 64-bit masks")
+        self.spec = spec
+        self.grid_width = grid_width
+        self.grid_height = grid_height
+        self.preview_size = preview_size
+        self.move_deadline_ms = move_deadline_ms
+        self.timeout_action = timeout_action
+        self.seed = seed
+        self.start_timeout = start_timeout
+        self.layout = state_struct(grid_height, preview_size)
+        self.shm = None
+        self.process = None
+        self.conn = None
+        self.sequence = 0
+        self.piece = None
+        self.pieces = 0
+        self.moves = 0
+        self.timeouts = 0
+
+    def start(self):
+        """Start the agent process and wait until its bot has loaded."""
+        self.shm = shared_memory.SharedMemory(create=True, size=self.layout.size)
+        context = spawn_context()
+        self.conn, child = context.Pipe()
+        self.process = context.Process(
+            target=run_agent,
+            args=(self.spec, self.seed, self.shm.name, child, self.grid_width, self.grid_height, self.preview_size),
+            daemon=True,
+        )
+        self.process.start()
+        child.close()
+        try:
+            if self._wait_for(READY, time.perf_counter() + self.start_timeout) is None:
+                raise RuntimeError(f"Agent {self.spec!r} did not start within {self.start_timeout} s")
+        except BaseException:
+            # __exit__ does not run when __enter__ raises, so free the shared block here.
+            self.close()
+            raise
+        return self
+
+    def choose_action(self, game):
+        """
+        Share the game state with the agent and return its action.
+
+        Returns:
+            str: The agent's action, or timeout_action if it missed the deadline.
+        """
+        deadline = time.perf_counter() + self.move_deadline_ms / 1000.0
+        if game.tetromino is not self.piece:
+            self.piece = game.tetromino
+            self.pieces += 1
+        tetromino = game.tetromino
+        preview = [SHAPE_NAMES.index(shape) for shape in game.piece_generator.preview()[:self.preview_size]]
+        preview += [NO_SHAPE] * (self.preview_size - len(preview))
+        self.sequence += 1
+        self.layout.pack_into(
+            self.shm.buf, 0, self.sequence, self.pieces, SHAPE_NAMES.index(tetromino.shape),
+            tetromino.rotation, *tetromino.position, *preview, *game.grid.rows,
+        )
+        self.conn.send_bytes(COMMAND.pack(self.sequence))
+        self.moves += 1
+        action = self._wait_for(self.sequence, deadline)
+        if action is None:
+            self.timeouts += 1
+            return self.timeout_action
+        return ACTIONS[action]
+
+    def _wait_for(self, sequence, deadline):
+        """
+        Return the action index of the reply to sequence, or None once the deadline passes.
+
+        A reply with an action index outside ACTIONS counts as a broken channel.
+        """
+        try:
+            while True:
+                remaining = deadline - time.perf_counter()
+                if remaining <= 0 or not self.conn.poll(remaining):
+                    if not self.process.is_alive():
+                        raise RuntimeError(f"Agent {self.spec!r} exited with code {self.process.exitcode}")
+                    return None
+                answered, action = REPLY.unpack(self.conn.recv_bytes())
+                if answered == sequence:
+                    if action >= len(ACTIONS):
+                        raise RuntimeError(f"Agent {self.spec!r} sent an invalid action {action}")
+                    return action
+        except (EOFError, ConnectionError, struct.error):
+            raise RuntimeError(f"Agent {self.spec!r} broke the command channel") from None
+
+    def close(self):
+        """Stop the agent and free the shared memory."""
+        if self.process is not None:
+            try:
+                self.conn.send_bytes(COMMAND.pack(0))
+            except (BrokenPipeError, OSError):
+                pass
+            self.process.join(1.0)
+            if self.process.is_alive():
+                self.process.terminate()
+                self.process.join()
+            self.conn.close()
+            self.process = None
+        if self.shm is not None:
+            self.shm.close()
+            self.shm.unlink()
+            self.shm = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.close()
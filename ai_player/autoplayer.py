@@ -0,0 +1,251 @@
+# ai_player/autoplayer.py
+
+import gc
+import time
+from ai_player.evaluation import Weights, DEFAULT_WEIGHTS, LOST, evaluate_placements
+from game_engine.placement_finder import find_placements, find_drop_placements
+from game_engine.tetromino_manager import Tetromino
+
+# Board cells scored per NumPy batch between deadline checks: a whole ply of
+# a standard board at once, a few placements at a time on very large ones.
+SCORE_CHUNK_CELLS = 1 << 15
+
+
+class _Blocks:
+    """A fixed set of cells in the shape Grid.place_tetromino() expects."""
+
+    __slots__ = ('blocks', 'color')
+
+    def __init__(self, blocks, color):
+        self.blocks = blocks
+        self.color = color
+
+    def get_blocks(self):
+        return self.blocks
+
+    def get_color(self):
+        return self.color
+
+
+class AutoPlayer:
+    """
+    Beam search over piece placements with a per-move time budget.
+
+    Each ply places one piece, the current one first and then the preview
+    pieces, at every landing find_drop_placements() reaches from where the
+    piece is. All the landings of one board are scored together by
+    evaluate_placements(), with the rows cleared along the way, and only
+    the boards that make the beam are built as Grids. The search deepens
+    one ply at a time, keeping the beam_width best boards of each ply, and
+    when the deadline passes mid-ply it answers with the deepest ply it
+    completed. Placements are scored in batches of about SCORE_CHUNK_CELLS
+    board cells with the deadline checked between them, and a first ply cut
+    short answers with the best of the lowest landings it scored, so a
+    decision never takes much longer than time_budget_ms on any board size
+    (finding the landings is not interrupted). search_tucks makes the
+    first ply use the full find_placements() search instead, which also
+    finds tucks and spins but takes a few milliseconds on its own, so it is
+    meant for untimed evaluation runs.
+
+    Plays through choose_action(game), like the policies, or through
+    AutoPlayerInput in place of KeyboardInput.
+    """
+
+    def __init__(self, weights=DEFAULT_WEIGHTS, time_budget_ms=2.0, beam_width=4, max_depth=3,
+                 search_tucks=False, clock=time.perf_counter, seed=None):
+        """
+        Parameters:
+            time_budget_ms (float): Search time per piece, or None to always
+                search max_depth plies (deterministic, for evaluation runs).
+            max_depth (int): Most plies searched: the current piece and up to
+                max_depth - 1 preview pieces.
+            seed: Accepted for create_policy(); the search is deterministic.
+        """
+        self.weights = Weights(*weights)
+        self.time_budget_ms = time_budget_ms
+        self.beam_width = beam_width
+        self.max_depth = max_depth
+        self.search_tucks = search_tucks
+        self.clock = clock
+        self.piece = None
+        self.target = None
+        self.plan = []
+        self.expected = None
+        self.last_depth = 0
+        self.last_nodes = 0
+
+    def choose_placement(self, grid, tetromino, next_shapes=()):
+        """
+        Pick where the current piece should go.
+
+        Parameters:
+            grid (Grid): The board; it is not changed.
+            tetromino (Tetromino): The current piece, wherever it is now.
+            next_shapes (sequence): Upcoming shapes, for lookahead.
+
+        Returns:
+            Placement: The chosen placement, or None if the piece has nowhere to go.
+        """
+        if self.time_budget_ms is None:
+            return self._search(grid, tetromino, next_shapes, None)
+        deadline = self.clock() + self.time_budget_ms / 1000.0
+        # A cyclic collection in the middle of a search can take longer than
+        # the whole budget; let it run after the decision instead.
+        collecting = gc.isenabled()
+        gc.disable()
+        try:
+            return self._search(grid, tetromino, next_shapes, deadline)
+        finally:
+            if collecting:
+                gc.enable()
+
+    def _search(self, grid, tetromino, next_shapes, deadline):
+        placements = self._placements(grid, tetromino)
+        if not placements:
+            return None
+
+        upcoming = tuple(next_shapes)[:self.max_depth - 1]
+        following = upcoming[0] if upcoming else None
+        # A scored entry is (value, rows cleared so far, parent grid, blocks,
+        # color, index of the first placement); only beam entries get a grid.
+        self.last_nodes = 0
+        scored, expired = self._score(grid, placements, tetromino.color, 0, following, None, deadline)
+        best = max(scored, key=lambda entry: entry[0])
+        self.last_depth = 1
+        if expired:
+            return placements[best[5]]
+
+        for depth, piece in enumerate(upcoming, start=2):
+            beam = self._beam(scored)
+            if not beam:
+                break
+            following = upcoming[depth - 1] if depth - 1 < len(upcoming) else None
+            color = Tetromino.COLORS[piece]
+            scored = []
+            expired = False
+            for rows_cleared, board, index in beam:
+                if deadline is not None and self.clock() > deadline:
+                    expired = True
+                    break
+                drops = find_drop_placements(board, Tetromino(piece))
+                entries, expired = self._score(board, drops, color, rows_cleared, following, index, deadline)
+                scored.extend(entries)
+                if expired:
+                    break
+            if expired or not scored:
+                break
+            best = max(scored, key=lambda entry: entry[0])
+            self.last_depth = depth
+        return placements[best[5]]
+
+    def _score(self, board, placements, color, rows_cleared, following, index, deadline=None):
+        """
+        Score the placements on one board, a chunk at a time, in order.
+
+        Index None means each placement is its own root. The first chunk is
+        always scored; after that the deadline is checked before each one.
+
+        Returns:
+            tuple: (scored entries, True if the deadline cut the list short).
+        """
+        chunk = max(1, SCORE_CHUNK_CELLS // (board.width * board.height))
+        bonus = self.weights.rows_cleared * rows_cleared
+        scored = []
+        for start in range(0, len(placements), chunk):
+            if start and deadline is not None and self.clock() > deadline:
+                return scored, True
+            batch = placements[start:start + chunk]
+            self.last_nodes += len(batch)
+            values, cleared = evaluate_placements(board, batch, self.weights, following)
+            scored.extend(
+                (value + bonus, rows_cleared + rows, board, placement.blocks, color,
+                 position if index is None else index)
+                for position, (placement, value, rows)
+                in enumerate(zip(batch, values.tolist(), cleared.tolist()), start=start)
+            )
+        return scored, False
+
+    def _beam(self, scored):
+        """Build grids for the beam_width best entries that are not lost."""
+        ranked = sorted(scored, key=lambda entry: entry[0], reverse=True)
+        beam = []
+        for value, rows_cleared, board, blocks, color, index in ranked[:self.beam_width]:
+            if value == LOST:
+                break
+            child = board.clone()
+            child.place_tetromino(_Blocks(blocks, color))
+            child.clear_rows()
+            beam.append((rows_cleared, child, index))
+        return beam
+
+    def _placements(self, grid, tetromino):
+        if self.search_tucks:
+            placements = find_placements(grid, tetromino.shape, start=(*tetromino.position, tetromino.rotation))
+        else:
+            placements = find_drop_placements(grid, tetromino)
+        # Lowest landings first, so ties between equal scores go to them.
+        return sorted(placements, key=lambda placement: -sum(y for _, y in placement.blocks))
+
+    def choose_action(self, game):
+        """
+        Return the next action for a Game or HeadlessGame.
+
+        Plans once per piece and then follows the plan. If the piece is not
+        where the plan expects (gravity moved it, or a move was blocked), the
+        path to the same landing is searched again from where the piece is,
+        and a new landing chosen if it is out of reach.
+        """
+        tetromino = game.tetromino
+        state = (*tetromino.position, tetromino.rotation)
+        if tetromino is not self.piece:
+            self.piece = tetromino
+            self.target = self.choose_placement(game.grid, tetromino, game.piece_generator.preview())
+            self.plan = list(self.target.path) if self.target is not None else []
+        elif state != self.expected and self.target is not None:
+            self.plan = self._reroute(game.grid, tetromino, game.piece_generator.preview())
+        action = self.plan.pop(0) if self.plan else 'drop'
+        piece = tetromino.clone()
+        if action == 'rotate':
+            piece.rotate(game.grid)
+        elif action != 'drop':
+            piece.move(action, game.grid)
+        self.expected = (*piece.position, piece.rotation)
+        return action
+
+    def _reroute(self, grid, tetromino, next_shapes):
+        for placement in self._placements(grid, tetromino):
+            if placement.blocks == self.target.blocks:
+                return list(placement.path)
+        self.target = self.choose_placement(grid, tetromino, next_shapes)
+        return list(self.target.path) if self.target is not None else []
+
+
+class AutoPlayerInput:
+    """
+    Drop-in replacement for KeyboardInput that lets an AutoPlayer play a Game.
+
+    Game.update() asks is_key_pressed() about each action in turn; this
+    answers True for the action the player wants next, so the game plays
+    exactly as if someone were pressing the keys.
+    """
+
+    def __init__(self, game, player=None):
+        self.game = game
+        self.player = player or AutoPlayer()
+        self.pending = None
+        self.piece = None
+
+    def handle_events(self, events):
+        """Ignore keyboard events, like KeyboardInput's interface expects."""
+
+    def is_key_pressed(self, action):
+        # An action chosen for a piece that has since locked is stale.
+        if self.game.tetromino is not self.piece:
+            self.piece = self.game.tetromino
+            self.pending = None
+        if self.pending is None:
+            self.pending = self.player.choose_action(self.game)
+        if action == self.pending:
+            self.pending = None
+            return True
+        return False
@@ -0,0 +1,125 @@
+# ai_player/evaluation.py
+
+from collections import namedtuple
+import numpy as np
+from game_engine.tetromino_manager import Tetromino
+
+# One weight per BoardFeatures.as_tuple() entry, plus a reward per cleared row.
+Weights = namedtuple('Weights', [
+    'aggregate_height', 'holes', 'bumpiness', 'row_transitions', 'column_transitions', 'well_sum',
+    'rows_cleared',
+])
+DEFAULT_WEIGHTS = Weights(-0.51, -0.36, -0.18, -0.1, -0.3, -0.05, 0.76)
+LOST = float('-inf')
+SPAWN_POSITION = Tetromino('I').position
+
+
+def evaluate(features, rows_cleared, weights=DEFAULT_WEIGHTS):
+    """
+    Score a board; higher is better.
+
+    Parameters:
+        features (BoardFeatures): Tracker of the board to score.
+        rows_cleared (int): Rows cleared on the way to this board.
+        weights (Weights): Feature weights.
+    """
+    value = weights.rows_cleared * rows_cleared
+    for weight, feature in zip(weights, features.as_tuple()):
+        value += weight * feature
+    return value
+
+
+def board_array(grid):
+    """Occupancy of a Grid as a (height, width) bool array."""
+    if grid.width > 63:
+        # Rows too wide for int64: unpack their little-endian bytes instead.
+        size = (grid.width + 7) // 8
+        data = np.frombuffer(b''.join(row.to_bytes(size, 'little') for row in grid.rows), dtype=np.uint8)
+        bits = np.unpackbits(data.reshape(grid.height, size), axis=1, bitorder='little')
+        return bits[:, :grid.width].astype(bool)
+    rows = np.array(grid.rows, dtype=np.int64)
+    return (rows[:, None] >> np.arange(grid.width)) & 1 == 1
+
+
+def batch_features(boards):
+    """
+    The BoardFeatures values of a stack of boards, all at once.
+
+    Parameters:
+        boards (array): (n, height, width) bool occupancy.
+
+    Returns:
+        array: (n, 6) features in BoardFeatures.as_tuple() order.
+    """
+    count, height, width = boards.shape
+    filled = boards.sum(axis=(1, 2))
+    tops = np.where(boards.any(axis=1), boards.argmax(axis=1), height)
+    heights = height - tops
+    aggregate_height = heights.sum(axis=1)
+    bumpiness = np.abs(np.diff(heights, axis=1)).sum(axis=1)
+
+    # Rows padded with filled walls; empty rows count no transitions.
+    walled = np.ones((count, height, width + 2), dtype=bool)
+    walled[:, :, 1:-1] = boards
+    row_transitions = ((walled[:, :, 1:] != walled[:, :, :-1]).sum(axis=2) * boards.any(axis=2)).sum(axis=1)
+    # Columns with a filled floor under the last row.
+    floored = np.ones((count, height + 1, width), dtype=bool)
+    floored[:, :-1] = boards
+    column_transitions = (floored[:, 1:] != floored[:, :-1]).sum(axis=(1, 2))
+
+    walls = np.full((count, 1), height)
+    left = np.concatenate([walls, heights[:, :-1]], axis=1)
+    right = np.concatenate([heights[:, 1:], walls], axis=1)
+    well_sum = np.maximum(0, np.minimum(left, right) - heights).sum(axis=1)
+
+    return np.stack([
+        aggregate_height, aggregate_height - filled, bumpiness, row_transitions, column_transitions, well_sum,
+    ], axis=1)
+
+
+def evaluate_placements(grid, placements, weights=DEFAULT_WEIGHTS, next_shape=None):
+    """
+    Score every placement of a piece on one board in a single NumPy pass.
+
+    The boards after each placement are built as one (n, height, width)
+    stack, rows are cleared and features computed across the whole stack,
+    so the result matches placing, clearing and evaluate() one by one
+    without the per-board Python overhead.
+
+    Parameters:
+        grid (Grid): The board before the piece; it is not changed.
+        placements (sequence): Block tuples, or anything with a `blocks`
+            attribute such as Placement entries.
+        weights (Weights): Feature weights.
+        next_shape (str): If given, placements that block this shape's
+            spawn score LOST, as do those that reach the top row.
+
+    Returns:
+        tuple: (scores, rows_cleared) arrays with one entry per placement.
+    """
+    blocks = np.array([getattr(placement, 'blocks', placement) for placement in placements], dtype=np.int64)
+    count = len(blocks)
+    if not count:
+        return np.zeros(0), np.zeros(0, dtype=np.int64)
+    height = grid.height
+    boards = np.repeat(board_array(grid)[None], count, axis=0)
+    boards[np.arange(count)[:, None], blocks[..., 1], blocks[..., 0]] = True
+
+    full = boards.all(axis=2)
+    rows_cleared = full.sum(axis=1)
+    clearing = np.nonzero(rows_cleared)[0]
+    if len(clearing):
+        # Stable sort moves full rows to the top and keeps the others in order.
+        order = np.argsort(~full[clearing], axis=1, kind='stable')
+        cleared = np.take_along_axis(boards[clearing], order[:, :, None], axis=1)
+        cleared[np.arange(height)[None, :] < rows_cleared[clearing, None]] = False
+        boards[clearing] = cleared
+
+    scores = batch_features(boards) @ np.array(weights[:6], dtype=float) + weights.rows_cleared * rows_cleared
+    lost = boards[:, 0].any(axis=1)
+    if next_shape is not None:
+        spawn_x, spawn_y = SPAWN_POSITION
+        cells = np.array(Tetromino.ROTATIONS[next_shape][0])
+        lost |= boards[:, spawn_y + cells[:, 1], spawn_x + cells[:, 0]].any(axis=1)
+    scores[lost] = LOST
+    return scores, rows_cleared
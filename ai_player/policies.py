@@ -0,0 +1,59 @@
+# ai_player/policies.py
+
+import random
+from game_engine.headless_game import ACTIONS
+from ai_player.autoplayer import AutoPlayer
+
+
+class RandomPolicy:
+    """Presses a uniformly random action every step."""
+
+    def __init__(self, seed=None):
+        self.random = random.Random(seed)
+
+    def choose_action(self, game):
+        return self.random.choice(ACTIONS)
+
+
+class RandomDropPolicy:
+    """Picks a random rotation and column for each piece, steers there and drops it."""
+
+    def __init__(self, seed=None):
+        self.random = random.Random(seed)
+        self.plan = []
+        self.planned_piece = None
+
+    def choose_action(self, game):
+        if self.planned_piece != game.pieces_placed:
+            self.planned_piece = game.pieces_placed
+            shift = self.random.randint(-game.grid_width // 2, game.grid_width // 2)
+            self.plan = ['rotate'] * self.random.randrange(4)
+            self.plan += ['left' if shift < 0 else 'right'] * abs(shift)
+            self.plan.append('drop')
+            self.plan.reverse()
+        return self.plan.pop() if self.plan else 'drop'
+
+
+# Policies selectable by name from the command-line tools.
+POLICIES = {
+    'random': RandomPolicy,
+    'random_drop': RandomDropPolicy,
+    'autoplayer': AutoPlayer,
+}
+
+
+def create_policy(name, seed=None):
+    """
+    Instantiate a registered policy.
+
+    Parameters:
+        name (str): A key of POLICIES.
+        seed: Seed for the policy's own random stream.
+
+    Returns:
+        object: A policy with a choose_action(game) method.
+    """
+    try:
+        return POLICIES[name](seed=seed)
+    except KeyError:
+        raise ValueError(f"Unknown policy: {name}") from None
@@ -0,0 +1,248 @@
+# game_engine/async_vector_env.py
+
+import os
+import struct
+import traceback
+from multiprocessing import connection, shared_memory
+import numpy as np
+from game_engine.processes import spawn_context
+from game_engine.vector_env import VectorEnv
+
+# Host -> worker: opcode, whether a seed follows, seed.
+COMMAND = struct.Struct('<BBQ')
+CLOSE, STEP, RESET = 0, 1, 2
+DONE = b'\x01'  # Worker -> host once its slice is written; anything else is an error report
+
+
+def shared_fields(grid_width, grid_height):
+    """Per-environment arrays kept in shared memory: (name, dtype, shape after the env axis)."""
+    return (
+        ('boards', np.uint8, (grid_height, grid_width)),
+        ('pieces', np.int64, ()),
+        ('rotations', np.int64, ()),
+        ('columns', np.int64, ()),
+        ('rewards', np.int64, ()),
+        ('dones', np.bool_, ()),
+        ('final_scores', np.int64, ()),
+        ('final_rows_cleared', np.int64, ()),
+        ('final_pieces_placed', np.int64, ()),
+    )
+
+
+def shared_size(num_envs, grid_width, grid_height):
+    """Bytes needed for shared_arrays(), with every array 8-byte aligned."""
+    size = 0
+    for _, dtype, shape in shared_fields(grid_width, grid_height):
+        size += -(-num_envs * int(np.prod(shape)) * np.dtype(dtype).itemsize // 8) * 8
+    return size
+
+
+def shared_arrays(buffer, num_envs, grid_width, grid_height):
+    """NumPy views of every shared field over one buffer, laid out back to back."""
+    arrays = {}
+    offset = 0
+    for name, dtype, shape in shared_fields(grid_width, grid_height):
+        array = np.ndarray((num_envs, *shape), dtype=dtype, buffer=buffer, offset=offset)
+        arrays[name] = array
+        offset += -(-array.nbytes // 8) * 8
+    return arrays
+
+
+def worker_seed(seed, worker_index):
+    """Seed of one worker's VectorEnv, independent of the other workers."""
+    return None if seed is None else np.random.SeedSequence([seed, worker_index])
+
+
+def run_worker(shm_name, conn, worker_index, start, stop, num_envs, grid_width, grid_height, points_per_level):
+    """
+    Worker main loop: step a VectorEnv over envs [start, stop) in shared memory.
+
+    The VectorEnv's boards array is the worker's slice of the shared boards,
+    so placing pieces and clearing rows write straight into it; the small
+    per-env results are copied into their shared slices after each step.
+    """
+    shm = shared_memory.SharedMemory(name=shm_name)
+    arrays = env = None
+    try:
+        arrays = {
+            name: array[start:stop]
+            for name, array in shared_arrays(shm.buf, num_envs, grid_width, grid_height).items()
+        }
+        env = VectorEnv(stop - start, grid_width, grid_height, points_per_level)
+        env.boards = arrays['boards']
+        while True:
+            opcode, seeded, seed = COMMAND.unpack(conn.recv_bytes())
+            if opcode == CLOSE:
+                return
+            try:
+                if opcode == RESET:
+                    env.reset(worker_seed(seed if seeded else None, worker_index))
+                    arrays['dones'][:] = False
+                else:
+                    _, _, rewards, dones, info = env.step(arrays['rotations'], arrays['columns'])
+                    arrays['rewards'][:] = rewards
+                    arrays['dones'][:] = dones
+                    arrays['final_scores'][dones] = info['scores']
+                    arrays['final_rows_cleared'][dones] = info['rows_cleared']
+                    arrays['final_pieces_placed'][dones] = info['pieces_placed']
+                arrays['pieces'][:] = env.pieces
+            except Exception:
+                conn.send_bytes(traceback.format_exc().encode())
+                continue
+            conn.send_bytes(DONE)
+    except (EOFError, BrokenPipeError, KeyboardInterrupt):
+        return
+    finally:
+        arrays = env = None
+        shm.close()
+
+
+class AsyncVectorEnv:
+    """
+    VectorEnv split across worker processes, sharing one memory block.
+
+    Each worker owns a contiguous slice of the environments and steps it
+    with its own VectorEnv. Boards, pieces, rewards and dones live in a
+    multiprocessing.shared_memory block, so step_wait() hands back NumPy
+    views the workers wrote into, with nothing pickled or copied. Commands
+    are 10-byte messages and replies a single byte.
+
+    step_async() starts a step and returns at once; step_wait() blocks
+    until every worker is done, so the caller can work in between. Like
+    VectorEnv, finished boards are reset automatically and the returned
+    arrays are overwritten by the next step.
+
+    Each worker draws pieces from its own generator seeded from (seed,
+    worker index), so seeded runs repeat for the same number of workers.
+    """
+
+    def __init__(self, num_envs, grid_width=10, grid_height=20, points_per_level=40, seed=None, workers=None):
+        """
+        Parameters:
+            seed (int): Base seed in [0, 2**64), or None for random pieces.
+            workers (int): Worker processes; defaults to one per CPU, at
+                most one per environment.
+        """
+        self.num_envs = num_envs
+        self.grid_width = grid_width
+        self.grid_height = grid_height
+        self.workers = max(1, min(workers or os.cpu_count() or 1, num_envs))
+        self.shm = shared_memory.SharedMemory(create=True, size=shared_size(num_envs, grid_width, grid_height))
+        self.arrays = shared_arrays(self.shm.buf, num_envs, grid_width, grid_height)
+        self.boards = self.arrays['boards']
+        self.pieces = self.arrays['pieces']
+        self.waiting = False
+        self.processes = []
+        self.conns = []
+        bounds = np.linspace(0, num_envs, self.workers + 1).astype(int)
+        context = spawn_context()
+        for index in range(self.workers):
+            conn, child = context.Pipe()
+            process = context.Process(
+                target=run_worker,
+                args=(self.shm.name, child, index, bounds[index], bounds[index + 1], num_envs,
+                      grid_width, grid_height, points_per_level),
+                daemon=True,
+            )
+            process.start()
+            child.close()
+            self.processes.append(process)
+            self.conns.append(conn)
+        self.reset(seed)
+
+    def _send(self, opcode, seed=None):
+        message = COMMAND.pack(opcode, seed is not None, seed or 0)
+        for conn in self.conns:
+            conn.send_bytes(message)
+
+    def _wait(self):
+        pending = list(self.conns)
+        errors = []
+        while pending:
+            for conn in connection.wait(pending):
+                try:
+                    reply = conn.recv_bytes()
+                except EOFError:
+                    raise RuntimeError("A vector env worker exited") from None
+                if reply != DONE:
+                    errors.append(reply.decode())
+                pending.remove(conn)
+        if errors:
+            raise RuntimeError("A vector env worker failed:\n" + errors[0])
+
+    def reset(self, seed=None):
+        """
+        Reset every board.
+
+        Returns:
+            tuple: (boards, pieces) shared arrays.
+        """
+        if self.waiting:
+            self.step_wait()
+        self._send(RESET, seed)
+        self._wait()
+        return self.boards, self.pieces
+
+    def step_async(self, rotations, columns):
+        """Hand every worker its actions and return without waiting; see VectorEnv.step()."""
+        if self.waiting:
+            raise RuntimeError("step_async() called again before step_wait()")
+        self.arrays['rotations'][:] = rotations
+        self.arrays['columns'][:] = columns
+        self._send(STEP)
+        self.waiting = True
+
+    def step_wait(self):
+        """
+        Wait for the step started by step_async().
+
+        Returns:
+            tuple: (boards, pieces, rewards, dones, info) as VectorEnv.step()
+            returns them; all but info are views of the shared memory.
+        """
+        if not self.waiting:
+            raise RuntimeError("step_wait() called without step_async()")
+        self.waiting = False
+        self._wait()
+        dones = self.arrays['dones']
+        info = {
+            'scores': self.arrays['final_scores'][dones],
+            'rows_cleared': self.arrays['final_rows_cleared'][dones],
+            'pieces_placed': self.arrays['final_pieces_placed'][dones],
+        }
+        return self.boards, self.pieces, self.arrays['rewards'], dones, info
+
+    def step(self, rotations, columns):
+        """Step every board and wait for the result."""
+        self.step_async(rotations, columns)
+        return self.step_wait()
+
+    def close(self):
+        """Stop the workers and free the shared memory."""
+        if self.shm is None:
+            return
+        for conn in self.conns:
+            try:
+                conn.send_bytes(COMMAND.pack(CLOSE, 0, 0))
+            except (BrokenPipeError, OSError):
+                pass
+        for process in self.processes:
+            process.join(1.0)
+            if process.is_alive():
+                process.terminate()
+                process.join()
+        for conn in self.conns:
+            conn.close()
+        self.arrays = self.boards = self.pieces = None
+        self.shm.unlink()
+        try:
+            self.shm.close()
+        except BufferError:
+            pass  # The caller still holds arrays from step(); the mapping goes with them
+        self.shm = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
@@ -0,0 +1,226 @@
+# game_engine/board_features.py
+
+
+class BoardFeatures:
+    """
+    Evaluation features of a Grid, kept up to date as the grid changes.
+
+    Once attached, the grid reports the rows and columns each placement
+    touches and which rows each clear removes, and only those rows and
+    columns are re-examined. Features:
+
+        aggregate_height: Sum of the column heights.
+        holes: Empty cells below the top of their column.
+        bumpiness: Sum of height differences between neighbouring columns.
+        row_transitions: Filled/empty changes along each non-empty row, with
+            the walls counted as filled.
+        column_transitions: Filled/empty changes down each column, with the
+            floor counted as filled.
+        wells: Depth of each column below both neighbours (walls count as
+            full height); well_sum is their total.
+    """
+
+    __slots__ = (
+        'grid', 'filled_cells', 'row_transitions', 'column_transitions', 'column_heights', 'aggregate_height',
+        'bumps', 'bumpiness', 'wells', 'well_sum',
+    )
+
+    def __init__(self, grid):
+        self.grid = grid
+        grid.features = self
+        self.recompute()
+
+    def recompute(self):
+        """Rebuild every feature from the grid contents."""
+        grid = self.grid
+        rows = grid.rows
+        self.filled_cells = sum(bits.bit_count() for bits in rows)
+        self.row_transitions = sum(self.count_row_transitions(bits) for bits in rows)
+        self.column_transitions = sum(self.count_pair_transitions(y) for y in range(grid.height))
+        self.column_heights = list(grid.heights)
+        self.aggregate_height = sum(self.column_heights)
+        self.bumps = [abs(grid.heights[x] - grid.heights[x + 1]) for x in range(grid.width - 1)]
+        self.bumpiness = sum(self.bumps)
+        self.wells = [self.well_depth(x) for x in range(grid.width)]
+        self.well_sum = sum(self.wells)
+
+    def copy_to(self, grid):
+        """Attach a copy of this tracker to a clone of its grid."""
+        copy = BoardFeatures.__new__(BoardFeatures)
+        copy.grid = grid
+        copy.filled_cells = self.filled_cells
+        copy.row_transitions = self.row_transitions
+        copy.column_transitions = self.column_transitions
+        copy.column_heights = list(self.column_heights)
+        copy.aggregate_height = self.aggregate_height
+        copy.bumps = list(self.bumps)
+        copy.bumpiness = self.bumpiness
+        copy.wells = list(self.wells)
+        copy.well_sum = self.well_sum
+        grid.features = copy
+        return copy
+
+    @property
+    def holes(self):
+        return self.aggregate_height - self.filled_cells
+
+    def count_row_transitions(self, bits):
+        if not bits:
+            return 0
+        width = self.grid.width
+        walled = (bits << 1) | 1 | (1 << (width + 1))
+        return ((walled ^ (walled >> 1)) & ((1 << (width + 1)) - 1)).bit_count()
+
+    def count_pair_transitions(self, y, old_rows=None):
+        """
+        Column transitions between row y and the row below it (or the floor).
+
+        Parameters:
+            y (int): The upper row of the pair.
+            old_rows (dict): Optional {row: bits} overriding the grid, to
+                count the pair as it was before a change.
+        """
+        grid = self.grid
+        upper = grid.get_row(y)
+        below = grid.get_row(y + 1) if y + 1 < grid.height else grid.full_row
+        if old_rows:
+            upper = old_rows.get(y, upper)
+            below = old_rows.get(y + 1, below)
+        return (upper ^ below).bit_count()
+
+    def well_depth(self, x):
+        heights = self.grid.heights
+        left = heights[x - 1] if x > 0 else self.grid.height
+        right = heights[x + 1] if x + 1 < self.grid.width else self.grid.height
+        return max(0, min(left, right) - heights[x])
+
+    def cells_changed(self, old_rows, columns, added=0):
+        """
+        Update the features after cells in the given rows and columns changed.
+
+        Parameters:
+            old_rows (dict): {row: bits before the change} for every row
+                that gained or lost cells.
+            columns (iterable): Columns that gained or lost cells.
+            added (int): Net number of cells filled.
+        """
+        grid = self.grid
+        self.filled_cells += added
+
+        # Bit-twiddling is inlined here: this runs for every placement a bot tries.
+        buffer = grid.buffer
+        base = grid.base
+        height = grid.height
+        walls = 1 | (1 << (grid.width + 1))
+        inner = (1 << (grid.width + 1)) - 1
+        row_transitions = self.row_transitions
+        pairs = set()
+        for y, old in old_rows.items():
+            new = buffer[base + y]
+            if new:
+                walled = (new << 1) | walls
+                row_transitions += ((walled ^ (walled >> 1)) & inner).bit_count()
+            if old:
+                walled = (old << 1) | walls
+                row_transitions -= ((walled ^ (walled >> 1)) & inner).bit_count()
+            pairs.add(y)
+            if y:
+                pairs.add(y - 1)
+        self.row_transitions = row_transitions
+
+        column_transitions = self.column_transitions
+        full = grid.full_row
+        for y in pairs:
+            upper = buffer[base + y]
+            lower = buffer[base + y + 1] if y + 1 < height else full
+            column_transitions += (
+                (upper ^ lower).bit_count()
+                - (old_rows.get(y, upper) ^ old_rows.get(y + 1, lower)).bit_count()
+            )
+        self.column_transitions = column_transitions
+
+        heights = grid.heights
+        column_heights = self.column_heights
+        touched = set()
+        for x in columns:
+            if heights[x] != column_heights[x]:
+                self.aggregate_height += heights[x] - column_heights[x]
+                column_heights[x] = heights[x]
+                touched.update((x - 1, x, x + 1))
+        touched.discard(-1)
+        touched.discard(grid.width)
+        self._update_columns(touched)
+
+    def rows_cleared(self, cleared_rows):
+        """
+        Update the features after clear_rows() removed the given rows.
+
+        Cleared rows were full, so they had no row transitions and the rows
+        that moved keep theirs. Column transitions only change where a run
+        of cleared rows closed up and above the old top row, so the cost
+        does not depend on the grid height. The per-column features are
+        recomputed for all columns, since every column lost cells.
+
+        Parameters:
+            cleared_rows (list): The removed rows, as indices before the clear, in order.
+        """
+        grid = self.grid
+        width = grid.width
+        cleared_count = len(cleared_rows)
+        self.filled_cells -= cleared_count * width
+
+        runs = []
+        for y in cleared_rows:
+            if runs and runs[-1][1] == y - 1:
+                runs[-1][1] = y
+            else:
+                runs.append([y, y])
+        below = cleared_count
+        for first, last in runs:
+            below -= last - first + 1
+            # The row that was under the run now sits `below` rows lower.
+            lower = last + 1 + below
+            lower_bits = grid.get_row(lower) if lower < grid.height else grid.full_row
+            if lower < grid.height:
+                self.column_transitions -= width - lower_bits.bit_count()
+            if first > 0:
+                upper_bits = grid.get_row(lower - 1)
+                self.column_transitions += (upper_bits ^ lower_bits).bit_count() - (width - upper_bits.bit_count())
+            else:
+                self.column_transitions += lower_bits.bit_count()
+        if cleared_rows[0] > 0:
+            # The old top row now has empty rows above it.
+            self.column_transitions += grid.get_row(cleared_count).bit_count()
+
+        self.column_heights = list(grid.heights)
+        self.aggregate_height = sum(self.column_heights)
+        self._update_columns(range(width))
+
+    def _update_columns(self, columns):
+        heights = self.grid.heights
+        width = self.grid.width
+        wall = self.grid.height
+        bumps = self.bumps
+        wells = self.wells
+        for x in columns:
+            height = heights[x]
+            right = heights[x + 1] if x + 1 < width else wall
+            if x + 1 < width:
+                bump = abs(height - right)
+                self.bumpiness += bump - bumps[x]
+                bumps[x] = bump
+            left = heights[x - 1] if x > 0 else wall
+            depth = max(0, min(left, right) - height)
+            self.well_sum += depth - wells[x]
+            wells[x] = depth
+
+    def as_tuple(self):
+        """Features in a fixed order, for weighted evaluation."""
+        return (
+            self.aggregate_height,
+            self.holes,
+            self.bumpiness,
+            self.row_transitions,
+            self.column_transitions,
+            self.well_sum,
+        )
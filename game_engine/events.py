@@ -0,0 +1,47 @@
+# game_engine/events.py
+
+from collections import namedtuple
+
+PieceLocked = namedtuple('PieceLocked', ['shape', 'score'])
+LinesCleared = namedtuple('LinesCleared', ['count', 'score'])
+LevelUp = namedtuple('LevelUp', ['level'])
+GameOver = namedtuple('GameOver', ['score'])
+Paused = namedtuple('Paused', ['paused'])
+GameStarted = namedtuple('GameStarted', ['seed'])
+
+EVENT_TYPES = (PieceLocked, LinesCleared, LevelUp, GameOver, Paused, GameStarted)
+
+
+class EventBus:
+    """
+    Synchronous publish/subscribe for game events.
+
+    Handlers subscribe to one event type and are called with the event
+    instance. emit() only builds the event when someone is listening, so a
+    game without subscribers pays a dictionary lookup per event.
+    """
+
+    def __init__(self):
+        self.handlers = {}
+
+    def subscribe(self, event_type, handler):
+        if event_type not in EVENT_TYPES:
+            raise ValueError(f"Unknown event type: {event_type}")
+        self.handlers.setdefault(event_type, []).append(handler)
+
+    def unsubscribe(self, event_type, handler):
+        self.handlers[event_type].remove(handler)
+
+    def emit(self, event_type, *fields):
+        """
+        Deliver an event to the handlers of its type.
+
+        Parameters:
+            event_type: One of EVENT_TYPES.
+            *fields: The event's fields, in order.
+        """
+        handlers = self.handlers.get(event_type)
+        if handlers:
+            event = event_type(*fields)
+            for handler in handlers:
+                handler(event)
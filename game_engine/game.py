@@ -1,18 +1,31 @@
 # game_engine/game.py
+import random
 from datetime import datetime
 from game_engine.grid_manager import Grid
 from game_engine.tetromino_manager import Tetromino
+from game_engine.piece_generator import PieceGenerator
+from game_engine.headless_game import GameState
+from game_engine.events import EventBus, PieceLocked, LinesCleared, LevelUp, GameOver, Paused, GameStarted
 from game_engine.score_manager import ScoreManager
 from game_engine.level_manager import LevelManager
 from game_engine.high_scores_manager import HighScoresManager
 from sound_manager.sound_effects import SoundEffectsManager
 
 class Game:
-    def __init__(self, grid_width, grid_height, control_panel, sound_effects_manager, high_scores_persistence_manager):
+    def __init__(self, grid_width, grid_height, control_panel, sound_effects_manager, high_scores_persistence_manager,
+                 seed=None, replay_recorder=None, gravity='classic'):
+        """
+        Parameters:
+            gravity (str): LevelManager gravity model; 'guideline' opts into
+                the 20G curve for competitive modes.
+        """
+        self.gravity = gravity
         self.grid = Grid(grid_width, grid_height)
-        self.tetromino = Tetromino()
+        self.events = EventBus()
+        self.replay_recorder = replay_recorder
+        self.seed_pieces(seed)
         self.score_manager = ScoreManager()
-        self.level_manager = LevelManager()
+        self.level_manager = LevelManager(gravity=self.gravity)
         self.high_scores_manager = HighScoresManager()
         self.sound_effects_manager = sound_effects_manager
         self.high_scores_persistence_manager = high_scores_persistence_manager
@@ -23,19 +36,54 @@ class Game:
         self.control_panel = control_panel
         self.score_added = False
 
+    def seed_pieces(self, seed=None):
+        """
+        Start this game's piece sequence, and its replay recording if any.
+
+        Parameters:
+            seed (int): Seed for the PieceGenerator; None picks a random one.
+                The seed is kept in self.seed so the game can be replayed.
+        """
+        self.seed = random.getrandbits(63) if seed is None else seed
+        self.piece_generator = PieceGenerator(self.seed)
+        self.tetromino = Tetromino(self.piece_generator.next())
+        if self.replay_recorder is not None:
+            self.replay_recorder.start(self.seed, self.grid.width, self.grid.height)
+
     def start_new_game(self):
         self.grid = Grid(self.grid.width, self.grid.height)
-        self.tetromino = Tetromino()
+        self.seed_pieces()
         self.score_manager = ScoreManager()
-        self.level_manager = LevelManager()
+        self.level_manager = LevelManager(gravity=self.gravity)
         self.is_paused = False
         self.game_over = False
-        self.control_panel.update()
         self.score_added = False
+        self.events.emit(GameStarted, self.seed)
+
+    def snapshot(self):
+        """
+        Capture the engine state, leaving out the UI, sound and persistence
+        references. The grid is shared copy-on-write, so this is O(1) and
+        the first change to either grid afterwards costs O(height).
+        HeadlessGame.from_state() turns the snapshot into a game for search.
+        """
+        return GameState(
+            self.grid.clone(), self.tetromino.clone(), self.piece_generator.clone(),
+            self.score_manager.get_score(), self.level_manager.get_level(), self.game_over,
+        )
+
+    def restore(self, state):
+        """Return to a snapshot; the snapshot itself stays reusable."""
+        self.grid = state.grid.clone()
+        self.tetromino = state.tetromino.clone()
+        self.piece_generator = state.piece_generator.clone()
+        self.score_manager.score = state.score
+        self.level_manager.level = state.level
+        self.game_over = state.game_over
 
     def toggle_pause(self):
         self.is_paused = not self.is_paused
-        self.control_panel.update()
+        self.events.emit(Paused, self.is_paused)
 
     def toggle_settings(self):
         self.is_settings_open = not self.is_settings_open
@@ -51,67 +99,93 @@ class Game:
             return
 
         # Handle keyboard input
-        if keyboard_input.is_key_pressed('left'):
-            self.tetromino.move('left', self.grid)
-        if keyboard_input.is_key_pressed('right'):
-            self.tetromino.move('right', self.grid)
-        if keyboard_input.is_key_pressed('down'):
+        for action in ('left', 'right', 'down', 'rotate', 'drop'):
+            if self.game_over:
+                break
+            if keyboard_input.is_key_pressed(action):
+                self.apply_action(action)
+
+        # Check for game over
+        if self.game_over or self.grid.is_game_over():
+            self.end_game()
+
+    def apply_action(self, action):
+        """Apply one player action ('left', 'right', 'down', 'rotate' or 'drop')."""
+        if self.replay_recorder is not None:
+            self.replay_recorder.record(action)
+        if action == 'left' or action == 'right':
+            self.tetromino.move(action, self.grid)
+        elif action == 'down':
             if not self.tetromino.move('down', self.grid):
-                self.grid.place_tetromino(self.tetromino)
-                self.sound_effects_manager.play_sound('block_placed')  # Play block placement sound
-                rows_cleared = self.grid.clear_rows()
-                if rows_cleared > 0:
-                    self.sound_effects_manager.play_sound('row_cleared')  # Play row cleared sound
-                self.score_manager.add_points(rows_cleared)
-                self.level_manager.update(self.score_manager.get_score())  # Update level based on score
-                self.control_panel.update()  # Update control panel
-                self.tetromino = Tetromino()
-
-        # Handle rotation
-        if keyboard_input.is_key_pressed('rotate'):
+                self.lock_tetromino()
+        elif action == 'rotate':
             self.tetromino.rotate(self.grid)  # Rotate the Tetromino
+        elif action == 'drop':
+            self.tetromino.hard_drop(self.grid)
+            self.lock_tetromino()
 
-        # Check for game over
-        if self.grid.is_game_over():
+    def end_game(self):
+        """Mark the game as over and record its score once."""
+        self.game_over = True
+        self.sound_effects_manager.play_sound('game_over')  # Play game over sound
+        if not self.score_added:
+            current_time = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+            self.high_scores_manager.add_score(self.get_score())
+            self.high_scores_persistence_manager.add_high_score(self.get_score(), current_time)
+            self.score_added = True  # Ensure score is only added once
+            self.events.emit(GameOver, self.get_score())
+            if self.replay_recorder is not None:
+                self.replay_recorder.finish(self.get_score(), self.grid.board_hash)
+
+    def lock_tetromino(self):
+        """Place the current Tetromino, clear and score rows, and spawn the next one."""
+        self.grid.place_tetromino(self.tetromino)
+        self.sound_effects_manager.play_sound('block_placed')  # Play block placement sound
+        rows_cleared = self.grid.clear_rows()
+        if rows_cleared > 0:
+            self.sound_effects_manager.play_sound('row_cleared')  # Play row cleared sound
+        self.score_manager.add_points(rows_cleared)
+        score = self.score_manager.get_score()
+        self.events.emit(PieceLocked, self.tetromino.shape, score)
+        if rows_cleared > 0:
+            self.events.emit(LinesCleared, rows_cleared, score)
+        if self.level_manager.update(score):  # Update level based on score
+            self.events.emit(LevelUp, self.level_manager.get_level())
+        self.tetromino = Tetromino(self.piece_generator.next())
+        # Stop at once when the stack reaches the top or the new piece cannot
+        # spawn, as HeadlessGame does, so recorded games replay exactly.
+        if self.grid.is_game_over() or not self.grid.fits(self.tetromino.mask, *self.tetromino.position):
             self.game_over = True
-            self.sound_effects_manager.play_sound('game_over')  # Play game over sound
-            if not self.score_added:
-                current_time = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-                self.high_scores_manager.add_score(self.get_score())
-                self.high_scores_persistence_manager.add_high_score(self.get_score(), current_time)
-                self.score_added = True  # Ensure score is only added once
-            # Handle rotation
-            if keyboard_input.is_key_pressed('rotate'):
-                self.tetromino.rotate(self.grid)  # Rotate the Tetromino
-
-            # Check for game over
-            if self.grid.is_game_over():
-                self.game_over = True
-                self.sound_effects_manager.play_sound('game_over')  # Play game over sound
-                if not self.score_added:
-                    self.high_scores_manager.add_score(self.get_score())
-                    self.high_scores_persistence_manager.add_high_score({"score": self.get_score()})
-                    self.score_added = True  # Ensure score is only added once
+
+    def fall(self, rows=1):
+        """
+        Let gravity move the Tetromino down by up to `rows` rows in one step.
+
+        The landing row comes from the grid skyline, so a high-gravity fall
+        costs the same as a one-row fall. Never locks the piece; see
+        GravityController for lock delay.
+
+        Returns:
+            bool: True if the Tetromino is resting on the stack or floor.
+        """
+        x, y = self.tetromino.position
+        landing = self.grid.drop_position(self.tetromino.mask, x, y)
+        new_y = min(y + rows, landing)
+        if new_y > y:
+            self.tetromino.position = (x, new_y)
+            if self.replay_recorder is not None:
+                # One gravity event per row, the same as that many natural falls.
+                for _ in range(new_y - y):
+                    self.replay_recorder.record_gravity()
+        return new_y == landing
 
     def handle_natural_falling(self):
         """Handle the natural falling of the Tetromino based on DROP_INTERVAL."""
+        if self.replay_recorder is not None:
+            self.replay_recorder.record_gravity()
         if not self.tetromino.move('down', self.grid):
-            self.grid.place_tetromino(self.tetromino)
-            self.sound_effects_manager.play_sound('block_placed')  # Play block placement sound
-            rows_cleared = self.grid.clear_rows()
-            if rows_cleared > 0:
-                self.sound_effects_manager.play_sound('row_cleared')  # Play row cleared sound
-            self.score_manager.add_points(rows_cleared)
-            self.level_manager.update(self.score_manager.get_score())  # Update level based on score
-            self.control_panel.update()  # Update control panel
-            self.tetromino = Tetromino()
+            self.lock_tetromino()
 
         # Check for game over
-        if self.grid.is_game_over():
-            self.game_over = True
-            self.sound_effects_manager.play_sound('game_over')  # Play game over sound
-            if not self.score_added:
-                current_time = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-                self.high_scores_manager.add_score(self.get_score())
-                self.high_scores_persistence_manager.add_high_score(self.get_score(), current_time)
-                self.score_added = True  # Ensure score is only added once
+        if self.game_over or self.grid.is_game_over():
+            self.end_game()
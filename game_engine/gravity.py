@@ -0,0 +1,99 @@
+# game_engine/gravity.py
+
+import time
+
+
+class GravityController:
+    """
+    Applies level-based gravity to a Game once per simulation tick.
+
+    Gravity comes from LevelManager.get_gravity() in rows per tick and is
+    accumulated, so slow levels move a row every few ticks while 20G (the
+    opt-in guideline model) moves the piece to the stack in a single
+    skyline lookup. A piece that comes to rest locks once it has stayed on
+    the stack for lock_delay_ms, measured on a monotonic high-resolution
+    clock. Moving or rotating the piece restarts the delay, at most
+    max_resets times per piece so it cannot be stalled forever.
+    """
+
+    def __init__(self, game, tick_rate=120, lock_delay_ms=500, max_resets=15, clock=time.perf_counter):
+        self.game = game
+        self.tick_rate = tick_rate
+        self.lock_delay = lock_delay_ms / 1000.0
+        self.max_resets = max_resets
+        self.clock = clock
+        self.reset()
+
+    def reset(self):
+        """Forget partial rows and any running lock delay, e.g. for a new game."""
+        self.rows = 0.0
+        self.piece = None
+        self.landed_at = None
+        self.rest_state = None
+        self.resets = 0
+        self.paused_at = None
+
+    def pause(self):
+        """
+        Stop the lock-delay clock, e.g. while the game is paused.
+
+        Drops partial rows but keeps the landed piece's delay and reset
+        count, so pausing neither locks it early nor grants a fresh delay.
+        Safe to call every paused frame.
+        """
+        self.rows = 0.0
+        if self.paused_at is None:
+            self.paused_at = self.clock()
+
+    def resume(self):
+        """Restart the lock-delay clock where pause() stopped it; no-op if not paused."""
+        if self.paused_at is None:
+            return
+        if self.landed_at is not None:
+            self.landed_at += self.clock() - self.paused_at
+        self.paused_at = None
+
+    @property
+    def progress(self):
+        """Fraction of a row accumulated toward the next fall, for render interpolation."""
+        return self.rows
+
+    def tick(self):
+        """
+        Advance gravity by one simulation tick.
+
+        Returns:
+            bool: True if a piece locked this tick.
+        """
+        game = self.game
+        if game.game_over:
+            return False
+        tetromino = game.tetromino
+        if tetromino is not self.piece:
+            self.piece = tetromino
+            self.landed_at = None
+            self.resets = 0
+
+        self.rows += game.level_manager.get_gravity(self.tick_rate)
+        whole = int(self.rows)
+        self.rows -= whole
+        if not game.fall(whole):
+            return False
+        self.rows = 0.0
+
+        now = self.clock()
+        rest_state = (tetromino.position, tetromino.rotation)
+        if self.landed_at is None:
+            self.landed_at = now
+            self.rest_state = rest_state
+            return False
+        if rest_state != self.rest_state and self.resets < self.max_resets:
+            self.resets += 1
+            self.landed_at = now
+            self.rest_state = rest_state
+            return False
+        if now - self.landed_at < self.lock_delay:
+            return False
+        # A natural fall of a resting piece locks it, exactly as it always has.
+        game.handle_natural_falling()
+        return True
@@ -1,15 +1,332 @@
 # game_engine/grid_manager.py
 
+import random
+from functools import lru_cache
+
+EMPTY_CELL = (0, None)
+
+
+# The board hash is a polynomial over rows, modulo a Mersenne prime:
+# sum(row_signature(rows[y]) * HASH_BASE ** y). Moving a block of rows down
+# by k multiplies its share of the hash by HASH_BASE ** k, so clear_rows()
+# never rehashes the rows it shifts as a block.
+HASH_MODULUS = (1 << 61) - 1
+HASH_BASE = random.Random('board-hash').randrange(2, HASH_MODULUS - 1)
+MASK64 = (1 << 64) - 1
+
+
+@lru_cache(maxsize=None)
+def hash_powers(height):
+    """
+    Powers of HASH_BASE for a grid height.
+
+    Returns:
+        tuple: powers[y] = HASH_BASE ** y mod HASH_MODULUS, for y in 0..height.
+    """
+    powers = [1]
+    for _ in range(height):
+        powers.append(powers[-1] * HASH_BASE % HASH_MODULUS)
+    return tuple(powers)
+
+
+def row_signature(bits):
+    """
+    Hash of a row's contents, independent of where the row is.
+
+    Rows are mixed 64 columns at a time with the splitmix64 finalizer, so
+    any width works. An empty row hashes to 0 and adds nothing to the board.
+    """
+    if not bits:
+        return 0
+    signature = 0x9E3779B97F4A7C15
+    while bits:
+        z = signature ^ (bits & MASK64)
+        z = (z ^ (z >> 30)) * 0xBF58476D1CE4E5B9 & MASK64
+        z = (z ^ (z >> 27)) * 0x94D049BB133111EB & MASK64
+        signature = z ^ (z >> 31)
+        bits >>= 64
+    return signature % HASH_MODULUS or 1
+
+
+def piece_mask(blocks):
+    """
+    Build the bitboard mask for a set of piece blocks.
+
+    Parameters:
+        blocks (iterable): The (x, y) offsets of the piece's blocks.
+
+    Returns:
+        tuple: (min_x, max_x, min_y, max_y, rows, columns) where rows holds
+        one (dy, bitmask) pair per occupied row, with bit 0 at min_x, and
+        columns one (dx, lowest dy) pair per occupied column.
+    """
+    blocks = list(blocks)
+    min_x = min(bx for bx, _ in blocks)
+    max_x = max(bx for bx, _ in blocks)
+    min_y = min(by for _, by in blocks)
+    max_y = max(by for _, by in blocks)
+    rows = {}
+    columns = {}
+    for bx, by in blocks:
+        rows[by] = rows.get(by, 0) | (1 << (bx - min_x))
+        columns[bx] = max(columns.get(bx, by), by)
+    return (min_x, max_x, min_y, max_y, tuple(sorted(rows.items())), tuple(sorted(columns.items())))
+
+
 class Grid:
-    def __init__(self, width, height):
+    """
+    The playing field, stored as one integer bitmask per row.
+
+    Bit x of rows[y] is set when cell (x, y) is occupied, and colors[y][x]
+    holds that cell's color. Color rows are tuples, replaced rather than
+    changed in place, so clone() can share them between grids. The list-of-lists `grid` attribute of earlier
+    versions is still available as a view over the two planes.
+
+    The rows live in a buffer twice the grid height, with logical row y at
+    buffer[base + y] and every slot outside the window empty. clear_rows()
+    either moves the stack above the cleared rows down or moves the base up
+    and shifts the rows below, whichever touches fewer rows, so a clear
+    costs O(k) plus the smaller side instead of O(height). `rows` and
+    `colors` return copies of the window; hot code reads the buffers.
+
+    board_hash is the polynomial board hash described at HASH_MODULUS, and
+    heights[x] the number of rows from the bottom up to the highest filled
+    cell of column x. Both are kept up to date by every method that changes
+    the cells, as is an attached BoardFeatures tracker, if any.
+
+    Given a palette, the grid stores colors as one byte per cell instead:
+    cells[y * width + x] is 0 for an empty cell and otherwise the index of
+    its color in the palette, and colors are looked up only when read.
+    `cells` is a bytearray that is never reallocated, laid out in logical
+    row order, so memoryview(grid.cells) and as_numpy() are zero-copy
+    views that always show the current board.
+    """
+
+    __slots__ = (
+        'width', 'height', 'full_row', 'empty_colors', 'buffer', 'color_buffer', 'base', 'powers',
+        'board_hash', 'heights', 'full_rows', 'features', '_shared', 'palette', 'palette_index', 'cells',
+    )
+
+    def __init__(self, width, height, palette=None):
+        """
+        Parameters:
+            palette (sequence): Colors to store cells as indexes into, with
+                None at index 0 for empty cells (e.g. tetromino_manager.PALETTE);
+                None keeps a color per cell.
+        """
         self.width = width
         self.height = height
-        self.grid = [[(0, None)] * width for _ in range(height)]
+        self.full_row = (1 << width) - 1
+        self.empty_colors = (None,) * width
+        self.buffer = [0] * (2 * height)
+        if palette is None:
+            self.palette = self.palette_index = self.cells = None
+            self.color_buffer = [self.empty_colors] * (2 * height)
+        else:
+            self.palette = tuple(palette)
+            self.palette_index = {color: index for index, color in enumerate(self.palette) if index}
+            self.cells = bytearray(width * height)
+            self.color_buffer = None
+        self.base = height
+        self.powers = hash_powers(height)
+        self.board_hash = 0
+        self.heights = [0] * width
+        self.full_rows = set()
+        self.features = None
+        self._shared = False
+
+    def clone(self):
+        """
+        Return a copy of the grid; the clone itself is O(1).
+
+        Copy-on-write is per grid, not per row: both grids share their
+        buffers until one of them changes a cell, and that first write
+        copies the row, color and height lists, which is O(height). Later
+        writes cost only the rows they touch, and color rows stay shared
+        until they are themselves rewritten. Palette cells are copied right
+        away, an O(width x height) memcpy, so views of either grid's cells
+        never change owner. An attached BoardFeatures tracker is copied.
+        """
+        copy = Grid.__new__(Grid)
+        copy.width = self.width
+        copy.height = self.height
+        copy.full_row = self.full_row
+        copy.empty_colors = self.empty_colors
+        copy.buffer = self.buffer
+        copy.color_buffer = self.color_buffer
+        copy.base = self.base
+        copy.powers = self.powers
+        copy.board_hash = self.board_hash
+        copy.heights = self.heights
+        copy.full_rows = self.full_rows
+        copy.palette = self.palette
+        copy.palette_index = self.palette_index
+        copy.cells = bytearray(self.cells) if self.cells is not None else None
+        copy.features = None
+        copy._shared = self._shared = True
+        if self.features is not None:
+            self.features.copy_to(copy)
+        return copy
+
+    def _unshare(self):
+        self.buffer = self.buffer[:]
+        if self.color_buffer is not None:
+            self.color_buffer = self.color_buffer[:]
+        self.heights = self.heights[:]
+        self.full_rows = set(self.full_rows)
+        self._shared = False
+
+    @property
+    def rows(self):
+        """Bitmask of every row, top to bottom (a copy)."""
+        return self.buffer[self.base:self.base + self.height]
+
+    @property
+    def colors(self):
+        """Color tuple of every row, top to bottom (a copy)."""
+        if self.cells is not None:
+            palette, width = self.palette, self.width
+            return [
+                tuple(palette[index] for index in self.cells[start:start + width])
+                for start in range(0, width * self.height, width)
+            ]
+        return self.color_buffer[self.base:self.base + self.height]
+
+    def as_numpy(self):
+        """
+        The palette cells as a read-only (height, width) uint8 array, without copying.
+
+        The array is a view of the live board: it changes as the grid does.
+        """
+        if self.cells is None:
+            raise ValueError("Only a grid with a palette stores cells as bytes")
+        # Imported here so the engine itself runs without NumPy.
+        import numpy as np
+        array = np.frombuffer(self.cells, dtype=np.uint8).reshape(self.height, self.width)
+        array.flags.writeable = False
+        return array
+
+    def __buffer__(self, flags):
+        """Buffer protocol (Python 3.12+): the palette cells, read-only."""
+        if self.cells is None:
+            raise TypeError("Only a grid with a palette stores cells as bytes")
+        return memoryview(self.cells).toreadonly()
+
+    def get_row(self, y):
+        """Return the bitmask of row y."""
+        return self.buffer[self.base + y]
+
+    @property
+    def grid(self):
+        """Row-major view of the cells as (occupied, color) tuples."""
+        return _GridView(self)
+
+    @grid.setter
+    def grid(self, cells):
+        for y, row in enumerate(cells):
+            self.set_row(y, row)
+
+    def get_cell(self, x, y):
+        """Return the (occupied, color) tuple for a single cell."""
+        if not 0 <= y < self.height:
+            raise IndexError("Row out of range")
+        if self.buffer[self.base + y] >> x & 1:
+            if self.cells is not None:
+                return (1, self.palette[self.cells[y * self.width + x]])
+            return (1, self.color_buffer[self.base + y][x])
+        return EMPTY_CELL
+
+    def set_cell(self, x, y, cell):
+        """Overwrite a single cell with an (occupied, color) tuple."""
+        if not 0 <= x < self.width:
+            raise IndexError("Column out of range")
+        if not 0 <= y < self.height:
+            raise IndexError("Row out of range")
+        occupied, color = cell
+        if self.cells is not None:
+            index = self.palette_color(color) if occupied else 0
+        if self._shared:
+            self._unshare()
+        slot = self.base + y
+        old = self.buffer[slot]
+        bits = old | 1 << x if occupied else old & ~(1 << x)
+        self._write_row(y, old, bits)
+        if self.cells is not None:
+            self.cells[y * self.width + x] = index
+        else:
+            colors = self.color_buffer[slot]
+            self.color_buffer[slot] = colors[:x] + (color if occupied else None,) + colors[x + 1:]
+        if occupied:
+            self.heights[x] = max(self.heights[x], self.height - y)
+        elif self.heights[x] == self.height - y:
+            self.heights[x] = self.column_height(x, y + 1)
+        if bits != old and self.features is not None:
+            self.features.cells_changed({y: old}, (x,), 1 if occupied else -1)
+
+    def palette_color(self, color):
+        """Palette index of a color; ValueError if the palette lacks it."""
+        index = self.palette_index.get(color)
+        if index is None:
+            raise ValueError(f"Color {color} is not in the grid's palette")
+        return index
+
+    def _write_row(self, y, old, bits):
+        """Store new bits for row y, updating the hash and the full-row set."""
+        self.buffer[self.base + y] = bits
+        if bits != old:
+            self.board_hash = (
+                self.board_hash + (row_signature(bits) - row_signature(old)) * self.powers[y]
+            ) % HASH_MODULUS
+            if bits == self.full_row:
+                self.full_rows.add(y)
+            else:
+                self.full_rows.discard(y)
+
+    def column_height(self, x, start=0):
+        """Height of column x found by scanning down from row start."""
+        bit = 1 << x
+        buffer = self.buffer
+        base = self.base
+        for y in range(start, self.height):
+            if buffer[base + y] & bit:
+                return self.height - y
+        return 0
+
+    def set_row(self, y, cells):
+        """Overwrite a whole row with a sequence of (occupied, color) tuples."""
+        cells = list(cells)
+        if len(cells) != self.width:
+            raise ValueError("Row width does not match the grid")
+        for x, cell in enumerate(cells):
+            self.set_cell(x, y, cell)
 
     def is_valid_position(self, x, y):
         if x < 0 or x >= self.width or y < 0 or y >= self.height:
             return False
-        return self.grid[y][x][0] == 0
+        return not self.buffer[self.base + y] >> x & 1
+
+    def fits(self, mask, x, y):
+        """
+        Check whether a piece mask can sit at the given offset.
+
+        Parameters:
+            mask (tuple): A mask built by piece_mask().
+            x (int): The horizontal offset of the piece.
+            y (int): The vertical offset of the piece.
+
+        Returns:
+            bool: True if every block is inside the grid and on an empty cell.
+        """
+        min_x, max_x, min_y, max_y, piece_rows, _ = mask
+        left = x + min_x
+        if left < 0 or x + max_x >= self.width or y + min_y < 0 or y + max_y >= self.height:
+            return False
+        rows = self.buffer
+        top = self.base + y
+        for dy, bits in piece_rows:
+            if rows[top + dy] & (bits << left):
+                return False
+        return True
 
     def place_tetromino(self, tetromino):
         blocks = tetromino.get_blocks()
@@ -17,14 +334,256 @@ class Grid:
         for x, y in blocks:
             if x < 0 or x >= self.width or y < 0 or y >= self.height:
                 raise ValueError("Position out of bounds")
-            self.grid[y][x] = (1, color)
+        cells = self.cells
+        if cells is not None:
+            index = self.palette_color(color)
+        if self._shared:
+            self._unshare()
+        buffer = self.buffer
+        base = self.base
+        new_rows = {}
+        color_rows = {}
+        for x, y in blocks:
+            new_rows[y] = new_rows.get(y, buffer[base + y]) | 1 << x
+            if cells is not None:
+                cells[y * self.width + x] = index
+            else:
+                row = color_rows.get(y)
+                if row is None:
+                    row = color_rows[y] = list(self.color_buffer[base + y])
+                row[x] = color
+            if self.heights[x] < self.height - y:
+                self.heights[x] = self.height - y
+        added = 0
+        old_rows = {}
+        for y, bits in new_rows.items():
+            old = old_rows[y] = buffer[base + y]
+            added += (bits ^ old).bit_count()
+            self._write_row(y, old, bits)
+            if cells is None:
+                self.color_buffer[base + y] = tuple(color_rows[y])
+        if self.features is not None:
+            self.features.cells_changed(old_rows, [x for x, _ in blocks], added)
+
+    def drop_position(self, mask, x, y):
+        """
+        Find the row a piece lands on when dropped straight down.
+
+        While the piece is above the skyline this only looks at the heights
+        of the columns it covers. A piece already tucked under an overhang
+        falls back to stepping down cell by cell.
+
+        Parameters:
+            mask (tuple): A mask built by piece_mask().
+            x (int): The horizontal offset of the piece.
+            y (int): The current vertical offset of the piece.
+
+        Returns:
+            int: The vertical offset the piece comes to rest at.
+        """
+        landing = self.height - 1 - mask[3]
+        heights = self.heights
+        for dx, bottom in mask[5]:
+            limit = self.height - heights[x + dx] - 1 - bottom
+            if limit < y:
+                while self.fits(mask, x, y + 1):
+                    y += 1
+                return y
+            if limit < landing:
+                landing = limit
+        return landing
 
     def clear_rows(self):
-        rows_to_clear = [i for i, row in enumerate(self.grid) if all(cell[0] == 1 for cell in row)]
-        for row in rows_to_clear:
-            del self.grid[row]
-            self.grid.insert(0, [(0, None)] * self.width)
+        if not self.full_rows:
+            return 0
+        if self._shared:
+            self._unshare()
+        rows_to_clear = sorted(self.full_rows)
+        self.full_rows = set()
+        # Every cleared row is full, so the stack reaches at least the first one.
+        top = self.height - max(self.heights)
+        if self.cells is not None:
+            self._clear_cells(rows_to_clear, top)
+        if rows_to_clear[-1] - top < self.height - rows_to_clear[0]:
+            self._move_stack_down(rows_to_clear, top)
+        else:
+            self._move_base(rows_to_clear)
+
+        # Cells only move down, so each column's new top is found by scanning
+        # down from its old top row.
+        for x, column_height in enumerate(self.heights):
+            self.heights[x] = self.column_height(x, self.height - column_height)
+        if self.features is not None:
+            self.features.rows_cleared(rows_to_clear)
         return len(rows_to_clear)
 
+    def _move_stack_down(self, rows_to_clear, top):
+        """Clear rows by moving the rows from top down to the lowest cleared row."""
+        buffer, colors, base, powers = self.buffer, self.color_buffer, self.base, self.powers
+        cleared = set(rows_to_clear)
+        board_hash = self.board_hash
+        target = rows_to_clear[-1]
+        for y in range(target, top - 1, -1):
+            bits = buffer[base + y]
+            signature = row_signature(bits)
+            board_hash -= signature * powers[y]
+            if y in cleared:
+                continue
+            buffer[base + target] = bits
+            if colors is not None:
+                colors[base + target] = colors[base + y]
+            board_hash += signature * powers[target]
+            target -= 1
+        for y in range(top, target + 1):
+            buffer[base + y] = 0
+            if colors is not None:
+                colors[base + y] = self.empty_colors
+        self.board_hash = board_hash % HASH_MODULUS
+
+    def _move_base(self, rows_to_clear):
+        """
+        Clear rows by moving the window k rows up the buffer.
+
+        Every row above the first cleared one then sits k rows lower without
+        being touched, and its share of the hash is multiplied by BASE**k.
+        Only the rows from the first cleared one down are copied.
+        """
+        cleared_count = len(rows_to_clear)
+        if self.base < cleared_count:
+            self._recenter()
+        buffer, colors, base, powers = self.buffer, self.color_buffer, self.base, self.powers
+        cleared = set(rows_to_clear)
+        first = rows_to_clear[0]
+        new_base = base - cleared_count
+        lower_hash = 0
+        moved_hash = 0
+        below = cleared_count
+        for y in range(first, self.height):
+            bits = buffer[base + y]
+            signature = row_signature(bits)
+            lower_hash += signature * powers[y]
+            if y in cleared:
+                below -= 1
+                continue
+            buffer[new_base + y + below] = bits
+            if colors is not None:
+                colors[new_base + y + below] = colors[base + y]
+            moved_hash += signature * powers[y + below]
+        for slot in range(base + self.height - cleared_count, base + self.height):
+            buffer[slot] = 0
+            if colors is not None:
+                colors[slot] = self.empty_colors
+        self.base = new_base
+        self.board_hash = ((self.board_hash - lower_hash) * powers[cleared_count] + moved_hash) % HASH_MODULUS
+
+    def _recenter(self):
+        """Move the window to the end of the buffer; amortised over height cleared rows."""
+        window = slice(self.base, self.base + self.height)
+        self.buffer = [0] * self.height + self.buffer[window]
+        if self.color_buffer is not None:
+            self.color_buffer = [self.empty_colors] * self.height + self.color_buffer[window]
+        self.base = self.height
+
+    def _clear_cells(self, rows_to_clear, top):
+        """
+        Remove cleared rows from the palette cells.
+
+        Each run of rows between two cleared ones moves down by the number
+        of cleared rows below it, lowest run first, as one slice copy; the
+        bytearray keeps its size, so views of it stay valid.
+        """
+        cells, width = self.cells, self.width
+        end = rows_to_clear[-1]
+        for shift in range(1, len(rows_to_clear) + 1):
+            start = rows_to_clear[-shift - 1] + 1 if shift < len(rows_to_clear) else top
+            if start < end:
+                cells[(start + shift) * width:(end + shift) * width] = cells[start * width:end * width]
+            end = start - 1
+        cells[top * width:(top + len(rows_to_clear)) * width] = bytes(len(rows_to_clear) * width)
+
+    def row_hash(self, y, bits):
+        """Share of the board hash of a row holding bits at height y."""
+        return row_signature(bits) * self.powers[y] % HASH_MODULUS
+
+    def compute_board_hash(self):
+        """Recompute the board hash from scratch (for checks, not hot paths)."""
+        board_hash = 0
+        for y, bits in enumerate(self.rows):
+            board_hash += self.row_hash(y, bits)
+        return board_hash % HASH_MODULUS
+
     def is_game_over(self):
-        return any(self.grid[0][x][0] == 1 for x in range(self.width))
+        return self.buffer[self.base] != 0
+
+
+class _GridView:
+    """Sequence of rows exposing the bitboard as (occupied, color) tuples."""
+
+    __slots__ = ('_owner',)
+
+    def __init__(self, owner):
+        self._owner = owner
+
+    def __len__(self):
+        return self._owner.height
+
+    def __getitem__(self, y):
+        if isinstance(y, slice):
+            return [_RowView(self._owner, row) for row in range(self._owner.height)[y]]
+        if y < 0:
+            y += self._owner.height
+        if not 0 <= y < self._owner.height:
+            raise IndexError("Row out of range")
+        return _RowView(self._owner, y)
+
+    def __setitem__(self, y, cells):
+        if y < 0:
+            y += self._owner.height
+        self._owner.set_row(y, cells)
+
+    def __iter__(self):
+        for y in range(self._owner.height):
+            yield _RowView(self._owner, y)
+
+    def __eq__(self, other):
+        return [list(row) for row in self] == [list(row) for row in other]
+
+    def __repr__(self):
+        return repr([list(row) for row in self])
+
+
+class _RowView:
+    """A single grid row exposed as a sequence of (occupied, color) tuples."""
+
+    __slots__ = ('_owner', '_y')
+
+    def __init__(self, owner, y):
+        self._owner = owner
+        self._y = y
+
+    def __len__(self):
+        return self._owner.width
+
+    def __getitem__(self, x):
+        if isinstance(x, slice):
+            return [self._owner.get_cell(col, self._y) for col in range(self._owner.width)[x]]
+        if x < 0:
+            x += self._owner.width
+        if not 0 <= x < self._owner.width:
+            raise IndexError("Column out of range")
+        return self._owner.get_cell(x, self._y)
+
+    def __setitem__(self, x, cell):
+        if x < 0:
+            x += self._owner.width
+        self._owner.set_cell(x, self._y, cell)
+
+    def __iter__(self):
+        for x in range(self._owner.width):
+            yield self._owner.get_cell(x, self._y)
+
+    def __eq__(self, other):
+        return list(self) == list(other)
+
+    def __repr__(self):
+        return repr(list(self))
@@ -3,6 +3,8 @@
 import datetime
 
 class HighScoresManager:
+    __slots__ = ('max_entries', 'high_scores')
+
     def __init__(self, max_entries=5):
         self.max_entries = max_entries
         self.high_scores = []
@@ -1,28 +1,67 @@
 # game_engine/level_manager.py
 
+MAX_GRAVITY_LEVEL = 30
+MAX_G = 20  # 20G: twenty rows per 1/60 s, i.e. an instant drop on a standard board
+
+
+def _gravity_g(level):
+    """Rows per 1/60 s at a level, from the usual (0.8 - (level - 1) * 0.007) ** (level - 1) seconds per row."""
+    seconds_per_row = (0.8 - (level - 1) * 0.007) ** (level - 1)
+    return min(MAX_G, 1 / (60 * seconds_per_row))
+
+
+# Gravity in G (rows per 1/60 s), indexed by level; levels past the end use the last entry.
+GRAVITY_TABLE = tuple(_gravity_g(level) for level in range(1, MAX_GRAVITY_LEVEL + 1))
+
+# 'classic': one row every get_current_speed() ms, as the game has always played.
+# 'guideline': GRAVITY_TABLE up to 20G, for competitive modes with fast level pacing.
+GRAVITY_MODELS = ('classic', 'guideline')
+
+
 class LevelManager:
-    def __init__(self, points_per_level=40, speed_increment=100, base_speed=750):
+    __slots__ = ('level', 'points_per_level', 'speed_increment', 'base_speed', 'gravity')
+
+    def __init__(self, points_per_level=40, speed_increment=100, base_speed=750, gravity='classic'):
+        if gravity not in GRAVITY_MODELS:
+            raise ValueError(f"Unknown gravity model: {gravity}")
         self.level = 1
         self.points_per_level = points_per_level
         self.speed_increment = speed_increment
         self.base_speed = base_speed
-        print("LevelManager initialized")  # Debugging print statement
+        self.gravity = gravity
 
     def update(self, current_points):
         """Update the level based on the player's current score."""
         new_level = (current_points // self.points_per_level) + 1
         if new_level > self.level:
             self.level = new_level
-            print(f"Level updated to {self.level}")
             return True
         return False
 
     def get_current_speed(self):
         """Get the current drop speed based on the level."""
         new_speed = max(self.base_speed - (self.level - 1) * self.speed_increment, 100)
-        print(f"speed: {new_speed}")
         return new_speed  # Minimum speed cap
 
+    def get_gravity(self, tick_rate=60):
+        """
+        Get the gravity for the current level.
+
+        The classic model falls one row per get_current_speed() ms, so it
+        never drops faster than a row per 100 ms; the guideline model reads
+        GRAVITY_TABLE and reaches 20G by level 20.
+
+        Parameters:
+            tick_rate (int): Simulation ticks per second.
+
+        Returns:
+            float: Rows the piece falls per simulation tick.
+        """
+        if self.gravity == 'classic':
+            return 1000 / (self.get_current_speed() * tick_rate)
+        g = GRAVITY_TABLE[min(self.level, MAX_GRAVITY_LEVEL) - 1]
+        return g * 60 / tick_rate
+
     def get_level(self):
         """Return the current level."""
         return self.level
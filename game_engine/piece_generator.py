@@ -0,0 +1,94 @@
+# game_engine/piece_generator.py
+
+import random
+from game_engine.tetromino_manager import SHAPE_NAMES
+
+RANDOMIZERS = ('random', 'bag')
+
+
+class PieceGenerator:
+    """
+    Seeded per-game source of Tetromino shapes with a preview queue.
+
+    In 'random' mode every shape is drawn independently; in 'bag' mode the
+    seven shapes are dealt from a shuffled bag that is refilled once empty.
+    Upcoming shapes sit in a fixed-size ring buffer, so looking ahead never
+    allocates or shifts a list.
+    """
+
+    __slots__ = ('mode', 'random', 'bag', 'capacity', 'shared_random', 'queue', 'head')
+
+    def __init__(self, seed=None, mode='random', preview_size=5):
+        if mode not in RANDOMIZERS:
+            raise ValueError(f"Unknown randomizer: {mode}")
+        self.mode = mode
+        self.random = random.Random(seed)
+        self.bag = []
+        self.capacity = max(1, preview_size)
+        self.shared_random = False
+        self.queue = [self._draw() for _ in range(self.capacity)]
+        self.head = 0
+
+    def _draw(self):
+        if self.shared_random:
+            # Copy the RNG shared with a clone before advancing it.
+            state = self.random.getstate()
+            self.random = random.Random(0)
+            self.random.setstate(state)
+            self.shared_random = False
+        if self.mode == 'random':
+            return self.random.choice(SHAPE_NAMES)
+        if not self.bag:
+            self.bag = list(SHAPE_NAMES)
+            self.random.shuffle(self.bag)
+        return self.bag.pop()
+
+    def next(self):
+        """Take the next shape and refill the queue."""
+        shape = self.queue[self.head]
+        self.queue[self.head] = self._draw()
+        self.head = (self.head + 1) % self.capacity
+        return shape
+
+    def peek(self, index=0):
+        """Return the shape that next() will give after `index` more calls."""
+        if not 0 <= index < self.capacity:
+            raise IndexError("Preview index out of range")
+        return self.queue[(self.head + index) % self.capacity]
+
+    def preview(self, count=None):
+        """Return the next `count` shapes (the whole queue by default)."""
+        count = self.capacity if count is None else count
+        return tuple(self.peek(index) for index in range(count))
+
+    def get_state(self):
+        """Return the generator state, for restoring the piece sequence later."""
+        return (self.random.getstate(), tuple(self.bag), tuple(self.queue), self.head)
+
+    def set_state(self, state):
+        """Restore a state returned by get_state()."""
+        random_state, bag, queue, head = state
+        if self.shared_random:
+            self.random = random.Random(0)
+            self.shared_random = False
+        self.random.setstate(random_state)
+        self.bag = list(bag)
+        self.queue = list(queue)
+        self.head = head
+
+    def clone(self):
+        """
+        Return an independent generator that will deal the same shapes.
+
+        The two share their RNG until either one draws, so cloning is cheap
+        for searches that never look past the preview queue.
+        """
+        copy = PieceGenerator.__new__(PieceGenerator)
+        copy.mode = self.mode
+        copy.capacity = self.capacity
+        copy.random = self.random
+        copy.shared_random = self.shared_random = True
+        copy.bag = list(self.bag)
+        copy.queue = list(self.queue)
+        copy.head = self.head
+        return copy
@@ -0,0 +1,172 @@
+# game_engine/placement_finder.py
+
+from collections import OrderedDict, deque, namedtuple
+from game_engine.tetromino_manager import Tetromino
+
+Placement = namedtuple('Placement', ['shape', 'rotation', 'x', 'y', 'blocks', 'path'])
+
+# (action, dx, dy) for the translations a player can make.
+MOVES = (('left', -1, 0), ('right', 1, 0), ('down', 0, 1))
+
+
+class PlacementCache:
+    """Bounded least-recently-used cache of placement searches."""
+
+    def __init__(self, max_entries=4096):
+        self.max_entries = max_entries
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key):
+        placements = self.entries.get(key)
+        if placements is None:
+            self.misses += 1
+            return None
+        self.entries.move_to_end(key)
+        self.hits += 1
+        return placements
+
+    def put(self, key, placements):
+        self.entries[key] = placements
+        self.entries.move_to_end(key)
+        if len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+
+    def clear(self):
+        self.entries.clear()
+
+
+default_cache = PlacementCache()
+
+
+def find_placements(grid, shape, cache=default_cache, start=None):
+    """
+    Find every distinct resting placement a piece can reach.
+
+    Runs a breadth-first search over (x, y, rotation) states from the spawn
+    position using the same left/right/down/rotate moves (and wall kicks)
+    as the player, so tucks and spins under overhangs are found too.
+
+    Parameters:
+        grid (Grid): The board to search on.
+        shape (str): A key of Tetromino.SHAPES.
+        cache (PlacementCache): Cache keyed by board contents and shape, or
+            None to always search.
+        start (tuple): (x, y, rotation) to search from instead of the spawn
+            state, e.g. for a piece that has already moved.
+
+    Returns:
+        tuple: Placement entries, one per distinct set of final cells. Each
+        carries the shortest action path from the start state; playing it
+        and then a 'down' locks the piece there.
+    """
+    key = (grid.width, grid.height, tuple(grid.rows), shape, start)
+    if cache is not None:
+        placements = cache.get(key)
+        if placements is not None:
+            return placements
+
+    placements = _search(grid, shape, start)
+    if cache is not None:
+        cache.put(key, placements)
+    return placements
+
+
+def _search(grid, shape, start=None):
+    masks = Tetromino.ROTATION_MASKS[shape]
+    rotations = Tetromino.ROTATIONS[shape]
+    kicks = Tetromino.KICKS[shape]
+    if start is None:
+        start = (*Tetromino(shape).position, 0)
+    if not grid.fits(masks[start[2]], start[0], start[1]):
+        return ()
+
+    parents = {start: None}
+    queue = deque([start])
+    resting = []
+    while queue:
+        state = queue.popleft()
+        x, y, rotation = state
+        mask = masks[rotation]
+        for action, dx, dy in MOVES:
+            following = (x + dx, y + dy, rotation)
+            if following not in parents and grid.fits(mask, x + dx, y + dy):
+                parents[following] = (state, action)
+                queue.append(following)
+        if not grid.fits(mask, x, y + 1):
+            resting.append(state)
+        if shape != 'O':
+            turned = (rotation + 1) % 4
+            for kx, ky in kicks[(rotation, turned)]:
+                if grid.fits(masks[turned], x + kx, y + ky):
+                    following = (x + kx, y + ky, turned)
+                    if following not in parents:
+                        parents[following] = (state, 'rotate')
+                        queue.append(following)
+                    break
+
+    placements = []
+    seen = set()
+    for x, y, rotation in resting:
+        blocks = tuple(sorted((x + bx, y + by) for bx, by in rotations[rotation]))
+        if blocks in seen:
+            continue
+        seen.add(blocks)
+        placements.append(Placement(shape, rotation, x, y, blocks, _path_to(parents, (x, y, rotation))))
+    return tuple(placements)
+
+
+def _path_to(parents, state):
+    path = []
+    while parents[state] is not None:
+        state, action = parents[state]
+        path.append(action)
+    path.reverse()
+    return tuple(path)
+
+
+def find_drop_placements(grid, tetromino):
+    """
+    Find the placements a piece reaches by rotating, sliding and hard dropping.
+
+    Much cheaper than find_placements(): each rotation is tried once, then
+    the piece slides left and right as far as it can, and every column it
+    passes is dropped straight down. Tucks and spins are not found.
+
+    Parameters:
+        grid (Grid): The board to search on.
+        tetromino (Tetromino): The piece, wherever it currently is.
+
+    Returns:
+        tuple: Placement entries, one per distinct set of final cells, each
+        with the actions that bring the piece above its landing column;
+        a 'drop' then locks it there.
+    """
+    if not grid.fits(tetromino.mask, *tetromino.position):
+        return ()
+    placements = []
+    seen = set()
+    turned = tetromino.clone()
+    rotate_path = ()
+    for _ in range(1 if tetromino.shape == 'O' else 4):
+        for direction in ('left', 'right'):
+            piece = turned.clone()
+            path = rotate_path
+            while True:
+                x, y = piece.position
+                landing = grid.drop_position(piece.mask, x, y)
+                blocks = tuple(sorted((x + bx, landing + by) for bx, by in piece.blocks))
+                if blocks not in seen:
+                    seen.add(blocks)
+                    placements.append(Placement(piece.shape, piece.rotation, x, landing, blocks, path))
+                if not grid.fits(piece.mask, x + (1 if direction == 'right' else -1), y):
+                    break
+                piece.move(direction, grid)
+                path += (direction,)
+        rotation = turned.rotation
+        turned.rotate(grid)
+        if turned.rotation == rotation:
+            break
+        rotate_path += ('rotate',)
+    return tuple(placements)
@@ -0,0 +1,14 @@
+# game_engine/processes.py
+
+import multiprocessing
+
+
+def spawn_context():
+    """
+    The multiprocessing context every worker and agent process is started from.
+
+    Spawned processes start from a fresh interpreter instead of forking the
+    parent, so they do not inherit its threads (e.g. SDL's) or any state
+    those threads hold locked, and they behave the same on every platform.
+    """
+    return multiprocessing.get_context('spawn')
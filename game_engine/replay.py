@@ -0,0 +1,358 @@
+# game_engine/replay.py
+
+import struct
+import time
+from collections import namedtuple
+from game_engine.headless_game import HeadlessGame, ACTIONS
+from game_engine.piece_generator import RANDOMIZERS
+from game_engine.tetromino_manager import Tetromino, SHAPE_NAMES
+
+REPLAY_MAGIC = b'TRP2'
+REPLAY_MAGIC_V1 = b'TRP1'  # Same layout with an unsigned seed; still readable
+INDEX_MAGIC = b'TRI1'
+# Event codes: the ACTIONS indices, then a gravity tick and the end marker.
+GRAVITY = len(ACTIONS)
+END = 7
+EVENT_NAMES = ACTIONS + ('gravity',)
+CODE_BITS = 3
+CODE_MASK = (1 << CODE_BITS) - 1
+SHAPE_BY_COLOR = {color: shape for shape, color in Tetromino.COLORS.items()}
+
+ReplayHeader = namedtuple('ReplayHeader', ['grid_width', 'grid_height', 'seed', 'randomizer'])
+ReplayResult = namedtuple('ReplayResult', ['score', 'board_hash'])
+Keyframe = namedtuple('Keyframe', [
+    'offset', 'elapsed', 'pieces_placed', 'rows_cleared', 'score', 'level',
+    'rows', 'cells', 'shape', 'rotation', 'x', 'y', 'generator_state',
+])
+
+
+def write_varint(buffer, value):
+    """Append a non-negative int to a bytearray as a LEB128 varint."""
+    while value > 0x7F:
+        buffer.append((value & 0x7F) | 0x80)
+        value >>= 7
+    buffer.append(value)
+
+
+def write_signed(buffer, value):
+    """Append a signed int as a zigzag varint."""
+    write_varint(buffer, value * 2 if value >= 0 else -value * 2 - 1)
+
+
+def read_signed(data, offset):
+    value, offset = read_varint(data, offset)
+    return (value >> 1) ^ -(value & 1), offset
+
+
+def read_varint(data, offset):
+    """
+    Read a varint from a bytes-like object.
+
+    Returns:
+        tuple: (value, offset just past the varint).
+    """
+    value = 0
+    shift = 0
+    while True:
+        byte = data[offset]
+        offset += 1
+        value |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return value, offset
+        shift += 7
+
+
+class ReplayRecorder:
+    """
+    Records a game as its seed plus a stream of timestamped events.
+
+    Each event is one varint holding the milliseconds since the previous
+    event shifted left by CODE_BITS, ORed with the event code, so a key
+    press or gravity tick usually costs one or two bytes. finish() appends
+    the final score and board hash so a replay can be checked against the
+    result it claims.
+    """
+
+    def __init__(self, clock=time.monotonic):
+        self.clock = clock
+        self.buffer = bytearray()
+        self.finished = False
+
+    def start(self, seed, grid_width, grid_height, randomizer='random'):
+        """Begin a new recording, discarding any previous one."""
+        self.buffer = bytearray(REPLAY_MAGIC)
+        write_varint(self.buffer, grid_width)
+        write_varint(self.buffer, grid_height)
+        # Game and HeadlessGame accept any int seed, so it is zigzag-encoded.
+        write_signed(self.buffer, seed)
+        write_varint(self.buffer, RANDOMIZERS.index(randomizer))
+        self.last_time = self._now()
+        self.finished = False
+
+    def _now(self):
+        return int(self.clock() * 1000)
+
+    def _write_event(self, code):
+        now = self._now()
+        write_varint(self.buffer, (max(0, now - self.last_time) << CODE_BITS) | code)
+        self.last_time = now
+
+    def record(self, action):
+        """Record a player action (one of ACTIONS)."""
+        if not self.finished:
+            self._write_event(ACTIONS.index(action))
+
+    def record_gravity(self):
+        """Record a natural falling tick."""
+        if not self.finished:
+            self._write_event(GRAVITY)
+
+    def finish(self, score, board_hash):
+        """
+        Close the recording with the final result.
+
+        Returns:
+            bytes: The complete replay.
+        """
+        if not self.finished:
+            self._write_event(END)
+            write_varint(self.buffer, score)
+            write_varint(self.buffer, board_hash)
+            self.finished = True
+        return self.getvalue()
+
+    def getvalue(self):
+        return bytes(self.buffer)
+
+
+def read_header(data):
+    """
+    Parse the header of a replay.
+
+    Returns:
+        tuple: (ReplayHeader, offset of the first event).
+    """
+    magic = data[:len(REPLAY_MAGIC)]
+    if magic not in (REPLAY_MAGIC, REPLAY_MAGIC_V1):
+        raise ValueError("Not a replay")
+    width, offset = read_varint(data, len(REPLAY_MAGIC))
+    height, offset = read_varint(data, offset)
+    seed, offset = (read_signed if magic == REPLAY_MAGIC else read_varint)(data, offset)
+    randomizer, offset = read_varint(data, offset)
+    return ReplayHeader(width, height, seed, RANDOMIZERS[randomizer]), offset
+
+
+def iter_events(data):
+    """
+    Yield (time_ms, event) pairs, where event is an action or 'gravity' and
+    time_ms counts from the start of the recording.
+    """
+    _, offset = read_header(data)
+    elapsed = 0
+    while offset < len(data):
+        value, offset = read_varint(data, offset)
+        code = value & CODE_MASK
+        if code == END:
+            return
+        elapsed += value >> CODE_BITS
+        yield elapsed, EVENT_NAMES[code]
+
+
+def play_replay(data):
+    """
+    Re-run a replay headless, as fast as possible.
+
+    Parameters:
+        data (bytes): A recording made by ReplayRecorder.
+
+    Returns:
+        tuple: (HeadlessGame in its final state, ReplayResult claimed by the
+        recording or None if it was never finished).
+    """
+    header, offset = read_header(data)
+    game = HeadlessGame(header.grid_width, header.grid_height, header.seed, header.randomizer)
+    return _run(game, data, offset)
+
+
+def _run(game, data, offset, stop_at_piece=None, on_lock=None):
+    """Step game through the events from offset, see play_replay()."""
+    step = game.step
+    end = len(data)
+    elapsed = 0
+    while offset < end:
+        # Inline single-byte varints, which are most events.
+        value = data[offset]
+        if value < 0x80:
+            offset += 1
+        else:
+            value, offset = read_varint(data, offset)
+        code = value & CODE_MASK
+        if code == END:
+            score, offset = read_varint(data, offset)
+            board_hash, offset = read_varint(data, offset)
+            return game, ReplayResult(score, board_hash)
+        elapsed += value >> CODE_BITS
+        # Gravity ticks are 'down' steps, exactly as in Game.handle_natural_falling.
+        if step(ACTIONS[code] if code != GRAVITY else 'down').piece_locked:
+            if on_lock is not None:
+                on_lock(game, offset, elapsed)
+            if game.pieces_placed == stop_at_piece:
+                break
+    return game, None
+
+
+def verify_replay(data):
+    """Return True if a finished replay reproduces the score and board it claims."""
+    game, claimed = play_replay(data)
+    if claimed is None:
+        return False
+    return claimed == (game.get_score(), game.grid.board_hash)
+
+
+def take_keyframe(game, offset, elapsed):
+    """Capture the state of a HeadlessGame at a point in a replay's event stream."""
+    grid = game.grid
+    cells = tuple(
+        SHAPE_NAMES.index(SHAPE_BY_COLOR[color])
+        for row in grid.colors for color in row if color is not None
+    )
+    tetromino = game.tetromino
+    return Keyframe(
+        offset, elapsed, game.pieces_placed, game.rows_cleared, game.get_score(),
+        game.level_manager.get_level(), tuple(grid.rows), cells, tetromino.shape,
+        tetromino.rotation, tetromino.position[0], tetromino.position[1],
+        game.piece_generator.get_state(),
+    )
+
+
+def restore_keyframe(header, keyframe):
+    """Build a HeadlessGame in the state captured by take_keyframe()."""
+    game = HeadlessGame(header.grid_width, header.grid_height, 0, header.randomizer)
+    game.piece_generator.set_state(keyframe.generator_state)
+    game.score_manager.score = keyframe.score
+    game.level_manager.level = keyframe.level
+    game.pieces_placed = keyframe.pieces_placed
+    game.rows_cleared = keyframe.rows_cleared
+
+    cells = iter(keyframe.cells)
+    grid = game.grid
+    for y, bits in enumerate(keyframe.rows):
+        if bits:
+            grid.set_row(y, [
+                (1, Tetromino.COLORS[SHAPE_NAMES[next(cells)]]) if bits >> x & 1 else (0, None)
+                for x in range(grid.width)
+            ])
+
+    tetromino = Tetromino(keyframe.shape)
+    tetromino.rotation = keyframe.rotation
+    tetromino.position = (keyframe.x, keyframe.y)
+    game.tetromino = tetromino
+    game.game_over = grid.is_game_over() or not grid.fits(tetromino.mask, *tetromino.position)
+    return game
+
+
+def build_index(data, interval=1000):
+    """
+    Play a replay once and take a keyframe every `interval` locked pieces.
+
+    Returns:
+        list: Keyframes in replay order, to pass to seek() or encode_index().
+    """
+    header, offset = read_header(data)
+    game = HeadlessGame(header.grid_width, header.grid_height, header.seed, header.randomizer)
+    keyframes = []
+
+    def on_lock(game, offset, elapsed):
+        if game.pieces_placed % interval == 0:
+            keyframes.append(take_keyframe(game, offset, elapsed))
+
+    _run(game, data, offset, on_lock=on_lock)
+    return keyframes
+
+
+def seek(data, keyframes, pieces_placed):
+    """
+    Return a HeadlessGame as it was right after `pieces_placed` pieces locked.
+
+    Restores the last keyframe at or before that piece and replays only the
+    events after it. Stops at the end of the replay if the game is shorter.
+    """
+    header, offset = read_header(data)
+    start = None
+    for keyframe in keyframes:
+        if keyframe.pieces_placed > pieces_placed:
+            break
+        start = keyframe
+    if start is None:
+        game = HeadlessGame(header.grid_width, header.grid_height, header.seed, header.randomizer)
+    else:
+        game = restore_keyframe(header, start)
+        offset = start.offset
+    if game.pieces_placed < pieces_placed:
+        _run(game, data, offset, stop_at_piece=pieces_placed)
+    return game
+
+
+def encode_index(keyframes):
+    """Serialize keyframes to bytes, to be stored next to the replay."""
+    buffer = bytearray(INDEX_MAGIC)
+    write_varint(buffer, len(keyframes))
+    for keyframe in keyframes:
+        for value in keyframe[:6]:
+            write_varint(buffer, value)
+        for bits in keyframe.rows:
+            write_varint(buffer, bits)
+        write_varint(buffer, len(keyframe.cells))
+        buffer += bytes(keyframe.cells)
+        buffer.append(SHAPE_NAMES.index(keyframe.shape))
+        buffer.append(keyframe.rotation)
+        write_signed(buffer, keyframe.x)
+        write_signed(buffer, keyframe.y)
+
+        (version, words, gauss), bag, queue, head = keyframe.generator_state
+        write_varint(buffer, version)
+        write_varint(buffer, len(words))
+        buffer += struct.pack(f'<{len(words)}I', *words)
+        buffer += struct.pack('<?d', gauss is not None, gauss or 0.0)
+        for shapes in (bag, queue):
+            write_varint(buffer, len(shapes))
+            buffer += bytes(SHAPE_NAMES.index(shape) for shape in shapes)
+        write_varint(buffer, head)
+    return bytes(buffer)
+
+
+def decode_index(data, grid_height):
+    """Parse bytes written by encode_index() for a replay of the given grid height."""
+    if data[:len(INDEX_MAGIC)] != INDEX_MAGIC:
+        raise ValueError("Not a replay index")
+    count, offset = read_varint(data, len(INDEX_MAGIC))
+    keyframes = []
+    for _ in range(count):
+        values = []
+        for _ in range(6 + grid_height):
+            value, offset = read_varint(data, offset)
+            values.append(value)
+        length, offset = read_varint(data, offset)
+        cells = tuple(data[offset:offset + length])
+        shape, rotation = SHAPE_NAMES[data[offset + length]], data[offset + length + 1]
+        x, offset = read_signed(data, offset + length + 2)
+        y, offset = read_signed(data, offset)
+
+        version, offset = read_varint(data, offset)
+        length, offset = read_varint(data, offset)
+        words = struct.unpack_from(f'<{length}I', data, offset)
+        offset += 4 * length
+        has_gauss, gauss = struct.unpack_from('<?d', data, offset)
+        offset += struct.calcsize('<?d')
+        shapes = []
+        for _ in range(2):
+            length, offset = read_varint(data, offset)
+            shapes.append(tuple(SHAPE_NAMES[index] for index in data[offset:offset + length]))
+            offset += length
+        head, offset = read_varint(data, offset)
+        generator_state = ((version, words, gauss if has_gauss else None), shapes[0], shapes[1], head)
+
+        keyframes.append(Keyframe(
+            *values[:6], tuple(values[6:]), cells, shape, rotation, x, y, generator_state,
+        ))
+    return keyframes
@@ -0,0 +1,57 @@
+# game_engine/scheduler.py
+
+import time
+
+
+class FixedTimestepScheduler:
+    """
+    Accumulator that turns wall-clock frame times into fixed simulation ticks.
+
+    Each rendered frame calls advance(), runs the number of ticks it returns
+    and draws with `alpha`, the fraction of a tick left in the accumulator,
+    to interpolate between simulation states. Time beyond max_ticks_per_frame
+    ticks is dropped, so a long hitch slows the game down instead of making
+    every later frame try to catch up (the "spiral of death").
+    """
+
+    def __init__(self, tick_rate=120, max_ticks_per_frame=10, clock=time.perf_counter):
+        self.tick_rate = tick_rate
+        self.tick_seconds = 1.0 / tick_rate
+        self.tick_ms = 1000.0 / tick_rate
+        self.max_ticks_per_frame = max_ticks_per_frame
+        self.clock = clock
+        self.reset()
+
+    def reset(self):
+        """Forget accumulated time, e.g. after a pause or a new game."""
+        self.last_time = self.clock()
+        self.accumulator = 0.0
+        self.ticks = 0
+        self.dropped_ticks = 0
+
+    def advance(self):
+        """
+        Account for the time since the previous call.
+
+        Returns:
+            int: Number of simulation ticks to run this frame (0 or more).
+        """
+        now = self.clock()
+        self.accumulator += now - self.last_time
+        self.last_time = now
+
+        # The small epsilon keeps float rounding from losing a whole tick.
+        ticks = int(self.accumulator / self.tick_seconds + 1e-9)
+        if ticks > self.max_ticks_per_frame:
+            self.dropped_ticks += ticks - self.max_ticks_per_frame
+            ticks = self.max_ticks_per_frame
+            self.accumulator = 0.0
+        else:
+            self.accumulator -= ticks * self.tick_seconds
+        self.ticks += ticks
+        return ticks
+
+    @property
+    def alpha(self):
+        """How far the render time is between the last tick and the next one (0-1)."""
+        return max(0.0, min(1.0, self.accumulator / self.tick_seconds))
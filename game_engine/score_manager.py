@@ -1,6 +1,8 @@
 # game_engine/score_manager.py
 
 class ScoreManager:
+    __slots__ = ('score',)
+
     def __init__(self):
         """
         Initialize the score manager.
@@ -1,6 +1,70 @@
 # game_engine/tetromino_manager.py
 
 import random
+from game_engine.grid_manager import piece_mask
+
+# Side of the square each shape rotates inside (SRS bounding boxes).
+BOX_SIZES = {'I': 4, 'T': 3, 'S': 3, 'Z': 3, 'J': 3, 'L': 3}
+
+# Clockwise SRS wall kicks, written with y pointing down like the grid.
+# Entry r holds the offsets tried when rotating from state r to r + 1.
+JLSTZ_KICKS = (
+    ((0, 0), (-1, 0), (-1, -1), (0, 2), (-1, 2)),
+    ((0, 0), (1, 0), (1, 1), (0, -2), (1, -2)),
+    ((0, 0), (1, 0), (1, -1), (0, 2), (1, 2)),
+    ((0, 0), (-1, 0), (-1, 1), (0, -2), (-1, -2)),
+)
+I_KICKS = (
+    ((0, 0), (-2, 0), (1, 0), (-2, 1), (1, -2)),
+    ((0, 0), (-1, 0), (2, 0), (-1, -2), (2, 1)),
+    ((0, 0), (2, 0), (-1, 0), (2, -1), (-1, 2)),
+    ((0, 0), (1, 0), (-2, 0), (1, 2), (-2, -1)),
+)
+O_KICKS = (((0, 0),),) * 4
+
+
+def build_rotations(shapes):
+    """
+    Generate the four rotation states of every shape.
+
+    Each state is the previous one turned clockwise inside the shape's
+    bounding box, so pieces stay in place instead of drifting around the
+    origin. The O piece keeps its spawn blocks in every state.
+
+    Returns:
+        dict: Shape name -> tuple of four block tuples.
+    """
+    rotations = {}
+    for shape, blocks in shapes.items():
+        states = [tuple(blocks)]
+        for _ in range(3):
+            if shape == 'O':
+                states.append(states[-1])
+            else:
+                size = BOX_SIZES[shape]
+                states.append(tuple((size - 1 - y, x) for x, y in states[-1]))
+        rotations[shape] = tuple(states)
+    return rotations
+
+
+def build_kicks(shapes):
+    """
+    Build the kick table for both rotation directions.
+
+    Returns:
+        dict: Shape name -> {(from_state, to_state): offsets to try in order}.
+    """
+    kicks = {}
+    for shape in shapes:
+        clockwise = I_KICKS if shape == 'I' else O_KICKS if shape == 'O' else JLSTZ_KICKS
+        table = {}
+        for state, offsets in enumerate(clockwise):
+            following = (state + 1) % 4
+            table[(state, following)] = offsets
+            table[(following, state)] = tuple((-dx, -dy) for dx, dy in offsets)
+        kicks[shape] = table
+    return kicks
+
 
 class Tetromino:
     SHAPES = {
@@ -23,32 +87,133 @@ class Tetromino:
         'L': (255, 165, 0)
     }
 
+    ROTATIONS = build_rotations(SHAPES)
+    ROTATION_MASKS = {shape: tuple(piece_mask(state) for state in states) for shape, states in ROTATIONS.items()}
+    KICKS = build_kicks(SHAPES)
+
+    __slots__ = ('prototype', 'rotation', 'position')
+
     def __init__(self, shape=None):
-        self.shape = shape or random.choice(list(self.SHAPES.keys()))
-        self.blocks = self.SHAPES[self.shape]
-        self.color = self.COLORS[self.shape]
+        self.prototype = PROTOTYPES[shape or random.choice(SHAPE_NAMES)]
+        self.rotation = 0
         self.position = (3, 0)
 
+    @property
+    def shape(self):
+        return self.prototype.shape
+
+    @property
+    def color(self):
+        return self.prototype.color
+
+    @property
+    def blocks(self):
+        """Block offsets of the current rotation state."""
+        return self.prototype.rotations[self.rotation]
+
+    @property
+    def mask(self):
+        """piece_mask() of the current rotation state."""
+        return self.prototype.masks[self.rotation]
+
     def move(self, direction, grid):
         x, y = self.position
-        if direction == 'left' and all(grid.is_valid_position(bx + x - 1, by + y) for bx, by in self.blocks):
+        mask = self.prototype.masks[self.rotation]
+        if direction == 'left' and grid.fits(mask, x - 1, y):
             self.position = (x - 1, y)
-        elif direction == 'right' and all(grid.is_valid_position(bx + x + 1, by + y) for bx, by in self.blocks):
+        elif direction == 'right' and grid.fits(mask, x + 1, y):
             self.position = (x + 1, y)
-        elif direction == 'down' and all(grid.is_valid_position(bx + x, by + y + 1) for bx, by in self.blocks):
+        elif direction == 'down' and grid.fits(mask, x, y + 1):
             self.position = (x, y + 1)
             return True
         return False
 
-    def rotate(self, grid):
-        if self.shape != 'O':
-            new_blocks = [(-y, x) for x, y in self.blocks]
-            if all(grid.is_valid_position(bx + self.position[0], by + self.position[1]) for bx, by in new_blocks):
-                self.blocks = new_blocks
+    def rotate(self, grid, direction=1):
+        """
+        Rotate the Tetromino using the precomputed states and wall kicks.
+
+        Parameters:
+            grid (Grid): The grid to check the new position against.
+            direction (int): 1 for clockwise, -1 for counter-clockwise.
+
+        Returns:
+            bool: True if the rotation (possibly kicked) succeeded.
+        """
+        prototype = self.prototype
+        if prototype.shape == 'O':
+            return False
+        rotation = (self.rotation + direction) % 4
+        mask = prototype.masks[rotation]
+        x, y = self.position
+        for dx, dy in prototype.kicks[(self.rotation, rotation)]:
+            if grid.fits(mask, x + dx, y + dy):
+                self.rotation = rotation
+                self.position = (x + dx, y + dy)
+                return True
+        return False
+
+    def hard_drop(self, grid):
+        """
+        Move the Tetromino straight down to where it lands.
+
+        Returns:
+            int: The number of rows the Tetromino fell.
+        """
+        x, y = self.position
+        landing = grid.drop_position(self.mask, x, y)
+        self.position = (x, landing)
+        return landing - y
+
+    def get_ghost_blocks(self, grid):
+        """Return the blocks of the Tetromino at its landing position, for the ghost preview."""
+        x, y = self.position
+        landing = grid.drop_position(self.mask, x, y)
+        return [(x + bx, landing + by) for bx, by in self.blocks]
+
+    def clone(self):
+        """Return a copy of this Tetromino; the prototype is shared."""
+        copy = Tetromino.__new__(Tetromino)
+        copy.prototype = self.prototype
+        copy.rotation = self.rotation
+        copy.position = self.position
+        return copy
 
     def get_blocks(self):
         x, y = self.position
         return [(x + bx, y + by) for bx, by in self.blocks]
 
     def get_color(self):
-        return self.color
+        return self.prototype.color
+
+
+class PiecePrototype:
+    """
+    The read-only data of one shape, shared by every Tetromino of it.
+
+    A live Tetromino only holds its prototype, rotation and position, so
+    spawning a piece allocates one small object. Pickling a prototype
+    stores its shape name and unpickling looks the shared one up again.
+    """
+
+    __slots__ = ('shape', 'color', 'rotations', 'masks', 'kicks')
+
+    def __init__(self, shape):
+        self.shape = shape
+        self.color = Tetromino.COLORS[shape]
+        self.rotations = Tetromino.ROTATIONS[shape]
+        self.masks = Tetromino.ROTATION_MASKS[shape]
+        self.kicks = Tetromino.KICKS[shape]
+
+    def __reduce__(self):
+        return (prototype, (self.shape,))
+
+
+def prototype(shape):
+    """Return the shared PiecePrototype of a shape."""
+    return PROTOTYPES[shape]
+
+
+SHAPE_NAMES = tuple(Tetromino.SHAPES)
+# Grid palette: 0 is an empty cell and 1-7 the shapes in SHAPE_NAMES order, as on VectorEnv boards.
+PALETTE = (None,) + tuple(Tetromino.COLORS[shape] for shape in SHAPE_NAMES)
+PROTOTYPES = {shape: PiecePrototype(shape) for shape in SHAPE_NAMES}
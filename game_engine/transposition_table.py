@@ -0,0 +1,60 @@
+# game_engine/transposition_table.py
+
+import random
+from game_engine.tetromino_manager import Tetromino
+
+_rng = random.Random('transposition-pieces')
+# Keys mixed into the board hash so the same board with other pieces gets another slot.
+CURRENT_PIECE_KEYS = {shape: _rng.getrandbits(64) for shape in Tetromino.SHAPES}
+NEXT_PIECE_KEYS = {shape: _rng.getrandbits(64) for shape in Tetromino.SHAPES}
+NEXT_PIECE_KEYS[None] = 0
+
+
+class TranspositionTable:
+    """
+    Fixed-size table of search results keyed on (board hash, piece, next piece).
+
+    Entries live in 2 ** size_bits slots indexed by the low bits of the
+    combined hash. A colliding store replaces the existing entry unless that
+    entry was searched deeper, so memory never grows past the slot count.
+    """
+
+    def __init__(self, size_bits=16):
+        self.size = 1 << size_bits
+        self.mask = self.size - 1
+        self.slots = [None] * self.size
+        self.hits = 0
+        self.misses = 0
+
+    def _index(self, board_hash, piece, next_piece):
+        return (board_hash ^ CURRENT_PIECE_KEYS[piece] ^ NEXT_PIECE_KEYS[next_piece]) & self.mask
+
+    def lookup(self, board_hash, piece, next_piece=None, depth=0):
+        """
+        Return the stored value for a position, or None.
+
+        Parameters:
+            board_hash (int): Grid.board_hash of the board.
+            piece (str): Shape of the piece to place.
+            next_piece (str): Shape of the following piece, if known.
+            depth (int): Minimum search depth the stored value must have.
+        """
+        entry = self.slots[self._index(board_hash, piece, next_piece)]
+        if entry is not None and entry[0] == (board_hash, piece, next_piece) and entry[1] >= depth:
+            self.hits += 1
+            return entry[2]
+        self.misses += 1
+        return None
+
+    def store(self, board_hash, piece, next_piece, value, depth=0):
+        """Store a value for a position, keeping a deeper entry that collides with it."""
+        index = self._index(board_hash, piece, next_piece)
+        key = (board_hash, piece, next_piece)
+        entry = self.slots[index]
+        if entry is None or entry[1] <= depth:
+            self.slots[index] = (key, depth, value)
+
+    def clear(self):
+        self.slots = [None] * self.size
+        self.hits = 0
+        self.misses = 0
@@ -0,0 +1,147 @@
+# game_engine/vector_env.py
+
+import numpy as np
+from game_engine.tetromino_manager import Tetromino, SHAPE_NAMES
+
+# Cell offsets of every (shape, rotation), indexed [shape, rotation, block] -> (x, y).
+PIECE_CELLS = np.array(
+    [[Tetromino.ROTATIONS[shape][rotation] for rotation in range(4)] for shape in SHAPE_NAMES],
+    dtype=np.int64,
+)
+# Lowest and highest legal piece x offset for every (shape, rotation).
+COLUMN_RANGES = np.stack(
+    [-PIECE_CELLS[..., 0].min(axis=2), PIECE_CELLS[..., 0].max(axis=2)],
+    axis=-1,
+)
+# Same points table as ScoreManager.add_points, indexed by rows cleared.
+POINTS = np.array([0, 40, 100, 300, 1200], dtype=np.int64)
+SPAWN_POSITION = (3, 0)
+
+
+class VectorEnv:
+    """
+    Many games stepped in lockstep with NumPy.
+
+    Boards live in one (num_envs, height, width) uint8 array where 0 is an
+    empty cell and 1-7 is the index + 1 of the shape in SHAPE_NAMES. Each
+    step places one piece per board at a chosen rotation and column (a hard
+    drop), then clears rows and scores them with the Grid.clear_rows and
+    ScoreManager.add_points rules. Boards that top out are reset
+    automatically.
+    """
+
+    def __init__(self, num_envs, grid_width=10, grid_height=20, points_per_level=40, seed=None):
+        self.num_envs = num_envs
+        self.grid_width = grid_width
+        self.grid_height = grid_height
+        self.points_per_level = points_per_level
+        self.boards = np.zeros((num_envs, grid_height, grid_width), dtype=np.uint8)
+        self.pieces = np.zeros(num_envs, dtype=np.int64)
+        self.scores = np.zeros(num_envs, dtype=np.int64)
+        self.levels = np.ones(num_envs, dtype=np.int64)
+        self.rows_cleared = np.zeros(num_envs, dtype=np.int64)
+        self.pieces_placed = np.zeros(num_envs, dtype=np.int64)
+        self._env_index = np.arange(num_envs)
+        self._row_index = np.arange(grid_height)
+        self.reset(seed)
+
+    def reset(self, seed=None):
+        """
+        Reset every board.
+
+        Parameters:
+            seed: Seed for the shared piece generator; None for a random one.
+
+        Returns:
+            tuple: (boards, pieces) arrays.
+        """
+        self.random = np.random.default_rng(seed)
+        self._reset_envs(self._env_index)
+        return self.boards, self.pieces
+
+    def _reset_envs(self, envs):
+        self.boards[envs] = 0
+        self.scores[envs] = 0
+        self.levels[envs] = 1
+        self.rows_cleared[envs] = 0
+        self.pieces_placed[envs] = 0
+        self.pieces[envs] = self.random.integers(0, len(SHAPE_NAMES), size=len(envs))
+
+    def step(self, rotations, columns):
+        """
+        Hard-drop the current piece of every board.
+
+        Parameters:
+            rotations (array): Rotation state (0-3) for each board.
+            columns (array): Piece x offset for each board, clipped to the
+                legal range of its shape and rotation (see COLUMN_RANGES).
+
+        Returns:
+            tuple: (boards, pieces, rewards, dones, info). boards and pieces
+            are the environment's own arrays, already reset where a game
+            ended. info holds the final 'scores', 'rows_cleared' and
+            'pieces_placed' of the boards that finished this step.
+        """
+        envs = self._env_index
+        pieces = self.pieces
+        rotations = np.asarray(rotations, dtype=np.int64) % 4
+        columns = np.clip(
+            np.asarray(columns, dtype=np.int64),
+            COLUMN_RANGES[pieces, rotations, 0],
+            self.grid_width - 1 - COLUMN_RANGES[pieces, rotations, 1],
+        )
+
+        cells = PIECE_CELLS[pieces, rotations]
+        cell_x = columns[:, None] + cells[..., 0]
+        cell_dy = cells[..., 1]
+
+        # Drop position: the first row at which any block would hit the stack.
+        occupied = self.boards != 0
+        tops = np.where(occupied.any(axis=1), occupied.argmax(axis=1), self.grid_height)
+        landing = (tops[envs[:, None], cell_x] - 1 - cell_dy).min(axis=1)
+        cell_y = landing[:, None] + cell_dy
+        overflow = cell_y.min(axis=1) < 0
+
+        placed = ~overflow
+        self.boards[
+            np.repeat(envs[placed], cells.shape[1]),
+            cell_y[placed].ravel(),
+            cell_x[placed].ravel(),
+        ] = np.repeat(pieces[placed] + 1, cells.shape[1]).astype(np.uint8)
+
+        cleared = self._clear_rows()
+        rewards = POINTS[cleared]
+        self.scores += rewards
+        self.levels = np.maximum(self.levels, self.scores // self.points_per_level + 1)
+        self.rows_cleared += cleared
+        self.pieces_placed += placed
+
+        self.pieces = self.random.integers(0, len(SHAPE_NAMES), size=self.num_envs)
+        dones = overflow | self.boards[:, 0, :].any(axis=1) | self._spawn_blocked()
+
+        finished = np.nonzero(dones)[0]
+        info = {
+            'scores': self.scores[finished].copy(),
+            'rows_cleared': self.rows_cleared[finished].copy(),
+            'pieces_placed': self.pieces_placed[finished].copy(),
+        }
+        if len(finished):
+            self._reset_envs(finished)
+        return self.boards, self.pieces, rewards, dones, info
+
+    def _clear_rows(self):
+        full = (self.boards != 0).all(axis=2)
+        cleared = full.sum(axis=1)
+        envs = np.nonzero(cleared)[0]
+        if len(envs):
+            # Stable sort puts full rows on top and keeps the others in order.
+            order = np.argsort(~full[envs], axis=1, kind='stable')
+            boards = np.take_along_axis(self.boards[envs], order[:, :, None], axis=1)
+            boards[self._row_index[None, :] < cleared[envs, None]] = 0
+            self.boards[envs] = boards
+        return cleared
+
+    def _spawn_blocked(self):
+        cells = PIECE_CELLS[self.pieces, 0]
+        x, y = SPAWN_POSITION
+        return (self.boards[self._env_index[:, None], y + cells[..., 1], x + cells[..., 0]] != 0).any(axis=1)
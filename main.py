@@ -12,6 +12,8 @@ from sound_manager.background_music import BackgroundMusicManager
 from sound_manager.sound_effects import SoundEffectsManager
 from game_engine.score_manager import ScoreManager
 from game_engine.game import Game
+from game_engine.scheduler import FixedTimestepScheduler
+from game_engine.gravity import GravityController
 from game_engine.high_scores_manager import HighScoresManager
 from persistence_manager.high_scores import HighScoresPersistenceManager
 
@@ -32,7 +34,11 @@ GRID_WIDTH = 10
 GRID_HEIGHT = 20
 CELL_SIZE = 30
 FPS = 60
+SIM_TICK_RATE = 120  # Simulation ticks per second, independent of FPS
+MAX_TICKS_PER_FRAME = 10  # Cap on catch-up ticks after a slow frame
+LOCK_DELAY_MS = 500  # How long a landed piece can still be moved before it locks
 CONTROL_PANEL_WIDTH = 250
+AUTOPLAY_BUDGET_MS = 2.0  # Search time per piece when the AutoPlayer drives the game
 
 def main():
     try:
@@ -76,16 +82,23 @@ def main():
         high_scores_manager = HighScoresManager()
         game.high_scores_manager = high_scores_manager
         control_panel.game = game
+        control_panel.subscribe(game.events)
         
         game_over_screen = GameOverScreen(total_window_width, total_window_height)
-        keyboard_input = KeyboardInput()
+        # `python main.py --autoplay` lets the AutoPlayer play (attract mode)
+        autoplay = '--autoplay' in sys.argv[1:]
+        if autoplay:
+            # Imported here: the AutoPlayer needs NumPy, which plain games and the binary do without
+            from ai_player.autoplayer import AutoPlayer, AutoPlayerInput
+            keyboard_input = AutoPlayerInput(game, AutoPlayer(time_budget_ms=AUTOPLAY_BUDGET_MS))
+        else:
+            keyboard_input = KeyboardInput()
 
         settings_menu = SettingsMenu(game, background_music_manager, CELL_SIZE, CONTROL_PANEL_WIDTH)
 
         clock = pygame.time.Clock()
-        last_drop_time = pygame.time.get_ticks()
-
-        DROP_INTERVAL = game.level_manager.get_current_speed()
+        scheduler = FixedTimestepScheduler(SIM_TICK_RATE, MAX_TICKS_PER_FRAME)
+        gravity = GravityController(game, SIM_TICK_RATE, LOCK_DELAY_MS)
 
         while True:
             try:
@@ -114,11 +127,19 @@ def main():
 
                 # Always draw the game grid and tetromino, even if paused
                 game_screen.update(game.grid, game.tetromino)
-                control_panel.update()
+                control_panel.refresh()
                 game_screen.draw_grid(game.grid)
-                game_screen.draw_tetromino(game.tetromino)
+                game_screen.draw_ghost(game.tetromino, game.grid)
+                # Interpolate the fall between gravity steps when the piece can still move down
+                x, y = game.tetromino.position
+                fall = 0.0
+                if not game.is_paused and game.grid.fits(game.tetromino.mask, x, y + 1):
+                    rows_per_tick = game.level_manager.get_gravity(SIM_TICK_RATE)
+                    fall = min(1.0, gravity.progress + scheduler.alpha * rows_per_tick)
+                game_screen.draw_tetromino(game.tetromino, fall)
                 control_panel.draw(screen)
 
+                simulating = False
                 # If settings menu is open, draw the semi-transparent overlay and the settings menu
                 if game.is_settings_open:
                     overlay = pygame.Surface(screen.get_size(), pygame.SRCALPHA)
@@ -139,11 +160,12 @@ def main():
                         if not game.score_added:
                             game.high_scores_manager.add_score(game.get_score())
                             game.score_added = True
-                        action = game_over_screen.handle_events(event)
+                        action = 'restart' if autoplay else game_over_screen.handle_events(event)
                         if action == 'restart':
                             game.start_new_game()
                             game.game_over = False
-                            DROP_INTERVAL = game.level_manager.get_current_speed()
+                            gravity.reset()
+                            scheduler.reset()
                         elif action == 'exit':
                             pygame.quit()
                             sys.exit()
@@ -154,18 +176,22 @@ def main():
                         keyboard_input.handle_events(events)
 
                         if not game.is_paused:
-                            current_time = pygame.time.get_ticks()
-
-                            if game.level_manager.update(game.score_manager.get_score()):
-                                DROP_INTERVAL = game.level_manager.get_current_speed()
-                                control_panel.update()
-
-                            # Handle natural falling of Tetromino based on time
-                            if current_time - last_drop_time > DROP_INTERVAL:
-                                game.handle_natural_falling()
-                                last_drop_time = current_time
-
-                            game.update(keyboard_input)
+                            simulating = True
+                            gravity.resume()
+                            # Run as many fixed simulation ticks as the elapsed time calls for,
+                            # so gravity and input do not depend on the frame rate.
+                            for _ in range(scheduler.advance()):
+                                # Gravity for the current level, in rows per tick, with lock delay
+                                gravity.tick()
+                                game.update(keyboard_input)
+                                if game.game_over:
+                                    break
+
+                if not simulating:
+                    # Time spent paused, behind an overlay or on the game over
+                    # screen counts neither as ticks nor as lock delay
+                    scheduler.reset()
+                    gravity.pause()
 
                 pygame.display.flip()  # Only one call to flip at the end of the loop
                 clock.tick(FPS)
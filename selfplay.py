@@ -0,0 +1,144 @@
+import argparse
+import os
+import random
+import struct
+import sys
+from game_engine.headless_game import HeadlessGame, ACTIONS
+from game_engine.tetromino_manager import SHAPE_NAMES
+from game_engine.processes import spawn_context
+from ai_player.policies import POLICIES, create_policy
+
+SHARD_MAGIC = b'TSP1'
+HEADER = struct.Struct('<4sHH')
+WRITE_BUFFER_SIZE = 1 << 16  # Bytes a worker holds before blocking on the disk
+
+
+def record_struct(grid_height):
+    """Record layout: one row bitmask per row, shape, rotation, x, y, action, reward."""
+    return struct.Struct(f'<{grid_height}IBBbbBi')
+
+
+def shard_seed(base_seed, shard_index):
+    """Deterministic seed for a shard, independent of worker scheduling."""
+    return random.Random(f'{base_seed}:{shard_index}').getrandbits(64)
+
+
+def shard_path(output_dir, shard_index):
+    return os.path.join(output_dir, f'shard-{shard_index:05d}.bin')
+
+
+def generate_shard(config):
+    """
+    Play one shard's games and stream their records to its file.
+
+    Records are written as they are produced through a fixed-size buffer,
+    so a slow disk blocks the worker instead of growing its memory.
+
+    Returns:
+        tuple: (shard index, games played, records written, total score).
+    """
+    shard_index = config['shard_index']
+    rng = random.Random(shard_seed(config['seed'], shard_index))
+    record = record_struct(config['grid_height'])
+    records = 0
+    total_score = 0
+    with open(shard_path(config['output_dir'], shard_index), 'wb', buffering=WRITE_BUFFER_SIZE) as shard:
+        shard.write(HEADER.pack(SHARD_MAGIC, config['grid_width'], config['grid_height']))
+        for _ in range(config['games_per_shard']):
+            game = HeadlessGame(config['grid_width'], config['grid_height'], seed=rng.getrandbits(64))
+            policy = create_policy(config['policy'], seed=rng.getrandbits(64))
+            for _ in range(config['max_steps']):
+                tetromino = game.tetromino
+                state = (
+                    *game.grid.rows,
+                    SHAPE_NAMES.index(tetromino.shape),
+                    tetromino.rotation,
+                    *tetromino.position,
+                )
+                action = policy.choose_action(game)
+                result = game.step(action)
+                shard.write(record.pack(*state, ACTIONS.index(action), result.reward))
+                records += 1
+                if result.game_over:
+                    break
+            total_score += game.get_score()
+    return shard_index, config['games_per_shard'], records, total_score
+
+
+def read_shard(path):
+    """
+    Iterate over the records of a shard file.
+
+    Yields:
+        tuple: (rows, shape, rotation, x, y, action, reward) where rows is a
+        tuple of row bitmasks and shape/action are names.
+    """
+    with open(path, 'rb') as shard:
+        magic, grid_width, grid_height = HEADER.unpack(shard.read(HEADER.size))
+        if magic != SHARD_MAGIC:
+            raise ValueError(f"Not a self-play shard: {path}")
+        record = record_struct(grid_height)
+        while True:
+            data = shard.read(record.size)
+            if len(data) < record.size:
+                return
+            values = record.unpack(data)
+            shape, rotation, x, y, action, reward = values[grid_height:]
+            yield values[:grid_height], SHAPE_NAMES[shape], rotation, x, y, ACTIONS[action], reward
+
+
+def generate(output_dir, shards, games_per_shard, policy='random_drop', seed=0, workers=None,
+             grid_width=10, grid_height=20, max_steps=10000):
+    """
+    Generate self-play shards across a process pool.
+
+    Each shard is one task with its own deterministic seed, so the output
+    does not depend on the number of workers. Tasks are handed out one at a
+    time and each worker streams its shard to disk.
+
+    Returns:
+        list: (shard index, games, records, total score) per shard, in shard order.
+    """
+    if grid_width > 32:
+        raise ValueError("Shard records store rows as 32-bit masks")
+    if grid_height > 128:
+        raise ValueError("Shard records store piece positions as signed bytes")
+    os.makedirs(output_dir, exist_ok=True)
+    configs = [
+        {
+            'shard_index': index,
+            'output_dir': output_dir,
+            'games_per_shard': games_per_shard,
+            'policy': policy,
+            'seed': seed,
+            'grid_width': grid_width,
+            'grid_height': grid_height,
+            'max_steps': max_steps,
+        }
+        for index in range(shards)
+    ]
+    with spawn_context().Pool(workers) as pool:
+        results = list(pool.imap_unordered(generate_shard, configs, chunksize=1))
+    return sorted(results)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Generate self-play training data.')
+    parser.add_argument('output_dir')
+    parser.add_argument('--shards', type=int, default=8)
+    parser.add_argument('--games-per-shard', type=int, default=100)
+    parser.add_argument('--policy', choices=sorted(POLICIES), default='random_drop')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--workers', type=int, default=None)
+    parser.add_argument('--max-steps', type=int, default=10000)
+    args = parser.parse_args(argv)
+
+    results = generate(
+        args.output_dir, args.shards, args.games_per_shard, policy=args.policy,
+        seed=args.seed, workers=args.workers, max_steps=args.max_steps,
+    )
+    for shard_index, games, records, total_score in results:
+        print(f"shard {shard_index}: {games} games, {records} records, mean score {total_score / games:.1f}")
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,118 @@
+import argparse
+import random
+import sys
+import time
+from game_engine.board_features import BoardFeatures
+from game_engine.grid_manager import Grid
+from game_engine.tetromino_manager import Tetromino
+
+GARBAGE_COLOR = (128, 128, 128)
+
+
+def vertical_i(column, top):
+    """An I piece standing in `column` with its top block on row `top`."""
+    tetromino = Tetromino('I')
+    tetromino.rotation = 1
+    tetromino.position = (column - tetromino.blocks[0][0], top)
+    return tetromino
+
+
+def build_board(width, height, depth, rng, features=False):
+    """
+    Fill the bottom `depth` rows with garbage in bands of four rows.
+
+    Every row of a band is full except one shared hole column, so a vertical
+    I piece dropped into the hole clears the whole band.
+
+    Returns:
+        tuple: (grid, list of (top row, hole column) per band, top band first).
+    """
+    grid = Grid(width, height)
+    if features:
+        BoardFeatures(grid)
+    bands = []
+    for top in range(height - depth, height - 3, 4):
+        hole = rng.randrange(width)
+        row = [(1, GARBAGE_COLOR)] * width
+        row[hole] = (0, None)
+        for y in range(top, top + 4):
+            grid.set_row(y, row)
+        bands.append((top, hole))
+    return grid, bands
+
+
+def run_stress(width=64, height=10000, depth=None, clears=1000, seed=0, check=False):
+    """
+    Time line clears on a large board.
+
+    Builds a board whose lower half (or `depth` rows) is garbage and clears
+    it four rows at a time, alternating between the band on top of the
+    stack and the band at the very bottom, so both ends of the row buffer
+    are exercised.
+
+    Parameters:
+        check (bool): Attach a BoardFeatures tracker and compare the hash and
+            the features against a recomputation after every clear.
+
+    Returns:
+        dict: Clear count, rows cleared, and total, mean and worst clear
+        time in microseconds.
+    """
+    rng = random.Random(seed)
+    depth = depth if depth is not None else height // 2
+    grid, bands = build_board(width, height, depth, rng, features=check)
+    times = []
+    rows_cleared = 0
+    while bands and len(times) < clears:
+        if len(times) % 2:
+            # Clearing the bottom band drops every band above it by four rows.
+            top, hole = bands.pop()
+            bands = [(band_top + 4, band_hole) for band_top, band_hole in bands]
+        else:
+            top, hole = bands.pop(0)
+        grid.place_tetromino(vertical_i(hole, top))
+        start = time.perf_counter()
+        rows_cleared += grid.clear_rows()
+        times.append(time.perf_counter() - start)
+        if check:
+            verify(grid)
+    return {
+        'clears': len(times),
+        'rows_cleared': rows_cleared,
+        'total_us': sum(times) * 1e6,
+        'mean_us': sum(times) / len(times) * 1e6 if times else 0.0,
+        'max_us': max(times, default=0.0) * 1e6,
+    }
+
+
+def verify(grid):
+    """Raise AssertionError if the grid's incremental state has drifted."""
+    if grid.board_hash != grid.compute_board_hash():
+        raise AssertionError("Board hash does not match a recomputation")
+    if grid.heights != [grid.column_height(x) for x in range(grid.width)]:
+        raise AssertionError("Column heights do not match the board")
+    if grid.features is not None:
+        features = grid.features.as_tuple()
+        grid.features.recompute()
+        if features != grid.features.as_tuple():
+            raise AssertionError("Board features do not match a recomputation")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Time line clears on a large board.')
+    parser.add_argument('--width', type=int, default=64)
+    parser.add_argument('--height', type=int, default=10000)
+    parser.add_argument('--depth', type=int, default=None, help='Garbage rows (default: half the height)')
+    parser.add_argument('--clears', type=int, default=1000)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--check', action='store_true', help='Verify the board after every clear')
+    args = parser.parse_args(argv)
+
+    result = run_stress(args.width, args.height, args.depth, args.clears, args.seed, args.check)
+    print(
+        f"{args.width}x{args.height}: {result['clears']} clears, {result['rows_cleared']} rows, "
+        f"mean {result['mean_us']:.1f} us, worst {result['max_us']:.1f} us"
+    )
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,102 @@
+import sys
+import os
+import time
+
+# Ensure the base directory is in the Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+import unittest
+import multiprocessing
+from ai_player.agent_host import AgentHost, AgentView, state_struct, NO_SHAPE, REPLY
+from ai_player.policies import RandomDropPolicy
+from game_engine.headless_game import HeadlessGame
+
+
+class SlowPolicy:
+    """Sleeps through its first move, then answers at once."""
+
+    def __init__(self, seed=None):
+        self.moves = 0
+
+    def choose_action(self, game):
+        self.moves += 1
+        if self.moves == 1:
+            time.sleep(0.3)
+            return 'left'
+        return 'right'
+
+
+class CrashingPolicy:
+    def __init__(self, seed=None):
+        pass
+
+    def choose_action(self, game):
+        os._exit(3)
+
+
+class TestAgentHost(unittest.TestCase):
+    def test_agent_plays_like_the_policy_in_process(self):
+        game, reference = HeadlessGame(seed=4), HeadlessGame(seed=4)
+        policy = RandomDropPolicy(seed=9)
+        with AgentHost('random_drop', seed=9, move_deadline_ms=5000) as host:
+            for _ in range(150):
+                action = host.choose_action(game)
+                reference_action = policy.choose_action(reference)
+                self.assertEqual(action, reference_action)
+                game.step(action)
+                reference.step(reference_action)
+                if game.game_over:
+                    break
+            self.assertEqual(host.timeouts, 0)
+        self.assertEqual(game.grid.rows, reference.grid.rows)
+
+    def test_missed_deadline_plays_the_timeout_action(self):
+        game = HeadlessGame(seed=1)
+        with AgentHost(f'{__name__}:SlowPolicy', move_deadline_ms=100) as host:
+            self.assertEqual(host.choose_action(game), 'down')
+            # The late 'left' for the first move is dropped, not taken as this answer.
+            host.move_deadline_ms = 5000
+            self.assertEqual(host.choose_action(game), 'right')
+            self.assertEqual((host.moves, host.timeouts), (2, 1))
+
+    def test_crashed_agent_raises(self):
+        with AgentHost(f'{__name__}:CrashingPolicy', move_deadline_ms=5000) as host:
+            with self.assertRaises(RuntimeError):
+                host.choose_action(HeadlessGame(seed=1))
+
+    def test_invalid_action_raises(self):
+        with AgentHost('random_drop', move_deadline_ms=5000) as host:
+            agent_conn = host.conn
+            # Stand in for a rogue agent that answers with an action index out of range.
+            host.conn, rogue = multiprocessing.Pipe()
+            rogue.send_bytes(REPLY.pack(host.sequence + 1, 200))
+            try:
+                with self.assertRaises(RuntimeError):
+                    host.choose_action(HeadlessGame(seed=1))
+            finally:
+                host.conn.close()
+                host.conn = agent_conn
+
+    def test_agent_that_fails_to_load_frees_shared_memory(self):
+        host = AgentHost('no_such_module:Bot')
+        with self.assertRaises(RuntimeError):
+            host.start()
+        self.assertIsNone(host.shm)
+        self.assertIsNone(host.process)
+
+    def test_view_loads_shared_state(self):
+        layout = state_struct(4, 3)
+        rows = (0, 0, 0b1001, 0b1111)
+        values = layout.unpack(layout.pack(7, 2, 1, 0, 1, 0, 0, 6, NO_SHAPE, *rows))
+        view = AgentView(4, 4)
+        view.load(values[1:])
+        self.assertEqual(view.grid.rows, list(rows))
+        self.assertEqual(view.grid.heights, [2, 1, 1, 2])
+        self.assertEqual((view.tetromino.shape, view.tetromino.position), ('O', (1, 0)))
+        self.assertEqual(view.get_next_shapes(), ('I', 'L'))
+        piece = view.tetromino
+        view.load(values[1:5] + (1,) + values[6:])
+        self.assertIs(view.tetromino, piece)
+
+
+if __name__ == '__main__':
+    unittest.main()
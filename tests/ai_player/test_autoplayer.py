@@ -0,0 +1,85 @@
+import sys
+import os
+
+# Ensure the base directory is in the Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+import unittest
+from unittest.mock import Mock
+from ai_player.autoplayer import AutoPlayer, AutoPlayerInput
+from ai_player.evaluation import evaluate, DEFAULT_WEIGHTS
+from game_engine.board_features import BoardFeatures
+from game_engine.game import Game
+from game_engine.grid_manager import Grid
+from game_engine.headless_game import HeadlessGame
+from game_engine.tetromino_manager import Tetromino
+
+
+class SteppingClock:
+    """A clock that moves forward by a fixed step every time it is read."""
+
+    def __init__(self, step):
+        self.step = step
+        self.now = 0.0
+
+    def __call__(self):
+        self.now += self.step
+        return self.now
+
+
+class TestAutoPlayer(unittest.TestCase):
+    def test_plays_headless_games(self):
+        game = HeadlessGame(seed=6)
+        player = AutoPlayer(time_budget_ms=None, max_depth=2)
+        while game.pieces_placed < 100 and not game.game_over:
+            game.step(player.choose_action(game))
+        self.assertFalse(game.game_over)
+        self.assertGreater(game.rows_cleared, 30)
+        self.assertEqual(player.last_depth, 2)
+
+    def test_prefers_clearing_a_row(self):
+        grid = Grid(10, 20)
+        grid.grid[19] = [(1, (255, 255, 255))] * 6 + [(0, None)] * 4
+        placement = AutoPlayer(time_budget_ms=None).choose_placement(grid, Tetromino('I'))
+        self.assertEqual(placement.blocks, ((6, 19), (7, 19), (8, 19), (9, 19)))
+
+    def test_deadline_stops_the_search(self):
+        # Every clock read takes 1 ms, so a 0.5 ms budget runs out after the
+        # first ply, which is scored as a single batch.
+        player = AutoPlayer(time_budget_ms=0.5, max_depth=3, clock=SteppingClock(0.001))
+        game = HeadlessGame(seed=1)
+        placement = player.choose_placement(game.grid, game.tetromino, game.get_next_shapes())
+        self.assertIsNotNone(placement)
+        self.assertEqual(player.last_depth, 1)
+        root_count = len(player._placements(game.grid, game.tetromino))
+        self.assertEqual(player.last_nodes, root_count)
+
+    def test_deadline_cuts_the_first_ply_on_huge_boards(self):
+        # A 10x2000 board is scored one placement per batch, so the first
+        # deadline check stops after the lowest landing.
+        player = AutoPlayer(time_budget_ms=0.5, max_depth=3, clock=SteppingClock(0.001))
+        grid = Grid(10, 2000)
+        tetromino = Tetromino('T')
+        placement = player.choose_placement(grid, tetromino, ('I', 'O'))
+        self.assertEqual(player.last_nodes, 1)
+        self.assertEqual(placement, player._placements(grid, tetromino)[0])
+
+    def test_evaluate_weights_features(self):
+        grid = Grid(4, 4)
+        grid.grid[3][0] = (1, (255, 255, 255))
+        features = BoardFeatures(grid)
+        expected = sum(w * f for w, f in zip(DEFAULT_WEIGHTS, features.as_tuple())) + DEFAULT_WEIGHTS.rows_cleared * 2
+        self.assertAlmostEqual(evaluate(features, 2), expected)
+
+    def test_drives_game_through_key_presses(self):
+        game = Game(10, 20, Mock(), Mock(), Mock(), seed=3)
+        keys = AutoPlayerInput(game, AutoPlayer(time_budget_ms=None, max_depth=2))
+        for frame in range(400):
+            # Gravity moves the piece under the plan now and then, forcing a reroute.
+            if frame % 4 == 0:
+                game.handle_natural_falling()
+            game.update(keys)
+        self.assertFalse(game.game_over)
+        self.assertGreater(game.get_score(), 0)
+
+if __name__ == '__main__':
+    unittest.main()
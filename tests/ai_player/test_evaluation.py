@@ -0,0 +1,82 @@
+import sys
+import os
+
+# Ensure the base directory is in the Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+import random
+import unittest
+from ai_player.autoplayer import _Blocks
+from ai_player.evaluation import evaluate, evaluate_placements, board_array, LOST, SPAWN_POSITION
+from game_engine.board_features import BoardFeatures
+from game_engine.grid_manager import Grid
+from game_engine.placement_finder import find_drop_placements
+from game_engine.tetromino_manager import Tetromino
+
+
+class TestEvaluatePlacements(unittest.TestCase):
+    def scalar_scores(self, grid, placements, next_shape):
+        scores = []
+        for placement in placements:
+            child = grid.clone()
+            BoardFeatures(child)
+            child.place_tetromino(_Blocks(placement.blocks, (255, 255, 255)))
+            rows_cleared = child.clear_rows()
+            if child.is_game_over() or not child.fits(Tetromino.ROTATION_MASKS[next_shape][0], *SPAWN_POSITION):
+                scores.append((LOST, rows_cleared))
+            else:
+                scores.append((evaluate(child.features, rows_cleared), rows_cleared))
+        return scores
+
+    def test_matches_placing_each_piece(self):
+        rng = random.Random(4)
+        for _ in range(40):
+            grid = Grid(10, 20)
+            for y in range(rng.randrange(4, 20), 20):
+                for x in range(10):
+                    if rng.random() < 0.8:
+                        grid.set_cell(x, y, (1, (128, 128, 128)))
+            shape, next_shape = rng.choice('IJLOSTZ'), rng.choice('IJLOSTZ')
+            placements = find_drop_placements(grid, Tetromino(shape))
+            scores, rows_cleared = evaluate_placements(grid, placements, next_shape=next_shape)
+            for (expected, expected_rows), score, rows in zip(
+                self.scalar_scores(grid, placements, next_shape), scores, rows_cleared
+            ):
+                self.assertEqual(rows, expected_rows)
+                if expected == LOST:
+                    self.assertEqual(score, LOST)
+                else:
+                    self.assertAlmostEqual(score, expected)
+
+    def test_blocked_spawn_is_lost(self):
+        grid = Grid(5, 6)
+        for y in range(2, 6):
+            grid.set_row(y, [(1, (1, 1, 1))] * 4 + [(0, None)])
+        # A vertical I in the last column clears every row; the flat one tops out.
+        placements = [((4, 2), (4, 3), (4, 4), (4, 5)), ((0, 0), (1, 0), (2, 0), (3, 0))]
+        scores, rows_cleared = evaluate_placements(grid, placements)
+        self.assertEqual(list(rows_cleared), [4, 0])
+        self.assertNotEqual(scores[0], LOST)
+        self.assertEqual(scores[1], LOST)
+
+    def test_board_array(self):
+        grid = Grid(3, 2)
+        grid.set_cell(2, 1, (1, (1, 1, 1)))
+        self.assertEqual(board_array(grid).tolist(), [[False, False, False], [False, False, True]])
+
+    def test_board_array_of_wide_grids(self):
+        for width in (63, 64, 70):
+            grid = Grid(width, 4)
+            grid.set_cell(0, 2, (1, (1, 1, 1)))
+            grid.set_cell(width - 1, 3, (1, (1, 1, 1)))
+            expected = [[bool(bits >> x & 1) for x in range(width)] for bits in grid.rows]
+            self.assertEqual(board_array(grid).tolist(), expected)
+            self.assertTrue(board_array(grid)[3, width - 1])
+
+    def test_no_placements(self):
+        scores, rows_cleared = evaluate_placements(Grid(4, 4), [])
+        self.assertEqual(len(scores), 0)
+        self.assertEqual(len(rows_cleared), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
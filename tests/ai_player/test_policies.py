@@ -0,0 +1,33 @@
+import sys
+import os
+
+# Ensure the base directory is in the Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+import unittest
+from ai_player.policies import create_policy, POLICIES
+from game_engine.headless_game import HeadlessGame, ACTIONS
+
+
+class TestPolicies(unittest.TestCase):
+    def test_policies_return_valid_actions(self):
+        for name in POLICIES:
+            with self.subTest(policy=name):
+                game = HeadlessGame(seed=2)
+                policy = create_policy(name, seed=2)
+                for _ in range(200):
+                    action = policy.choose_action(game)
+                    self.assertIn(action, ACTIONS)
+                    if game.step(action).game_over:
+                        break
+
+    def test_random_drop_places_every_piece(self):
+        game = HeadlessGame(seed=4)
+        policy = create_policy('random_drop', seed=4)
+        steps = 0
+        while game.pieces_placed < 10 and not game.game_over:
+            game.step(policy.choose_action(game))
+            steps += 1
+        self.assertLessEqual(steps, 10 * (3 + game.grid_width // 2 + 1))
+
+if __name__ == '__main__':
+    unittest.main()
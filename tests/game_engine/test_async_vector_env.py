@@ -0,0 +1,58 @@
+import sys
+import os
+
+# Ensure the base directory is in the Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+import unittest
+import numpy as np
+from game_engine.async_vector_env import AsyncVectorEnv, worker_seed
+from game_engine.vector_env import VectorEnv
+
+
+class TestAsyncVectorEnv(unittest.TestCase):
+    def test_matches_vector_env_slices(self):
+        rng = np.random.default_rng(2)
+        with AsyncVectorEnv(6, seed=5, workers=2) as env:
+            slices = [VectorEnv(3, seed=worker_seed(5, index)) for index in range(2)]
+            self.assertTrue((env.pieces == np.concatenate([part.pieces for part in slices])).all())
+            finished = 0
+            for _ in range(80):
+                rotations = rng.integers(0, 4, size=6)
+                columns = rng.integers(0, 10, size=6)
+                env.step_async(rotations, columns)
+                expected = [part.step(rotations[3 * n:3 * n + 3], columns[3 * n:3 * n + 3]) for n, part in enumerate(slices)]
+                boards, pieces, rewards, dones, info = env.step_wait()
+                self.assertTrue((boards == np.concatenate([result[0] for result in expected])).all())
+                self.assertTrue((pieces == np.concatenate([result[1] for result in expected])).all())
+                self.assertTrue((rewards == np.concatenate([result[2] for result in expected])).all())
+                self.assertTrue((dones == np.concatenate([result[3] for result in expected])).all())
+                self.assertEqual(list(info['scores']), [s for result in expected for s in result[4]['scores']])
+                finished += dones.sum()
+            self.assertGreater(finished, 0)
+
+    def test_results_are_shared_views(self):
+        with AsyncVectorEnv(4, seed=1, workers=2) as env:
+            boards, pieces = env.reset(seed=1)
+            stepped = env.step([0] * 4, [4] * 4)
+            self.assertIs(stepped[0], boards)
+            self.assertIs(stepped[1], pieces)
+            self.assertTrue(boards.any())
+
+    def test_reset_repeats_seeded_games(self):
+        with AsyncVectorEnv(4, seed=3, workers=2) as env:
+            first = [env.step([1] * 4, [2] * 4)[0].copy() for _ in range(5)]
+            env.reset(seed=3)
+            second = [env.step([1] * 4, [2] * 4)[0].copy() for _ in range(5)]
+        self.assertTrue(all((a == b).all() for a, b in zip(first, second)))
+
+    def test_step_wait_needs_step_async(self):
+        with AsyncVectorEnv(2, workers=1) as env:
+            with self.assertRaises(RuntimeError):
+                env.step_wait()
+            env.step_async([0, 0], [0, 0])
+            with self.assertRaises(RuntimeError):
+                env.step_async([0, 0], [0, 0])
+            env.step_wait()
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,73 @@
+import sys
+import os
+
+# Ensure the base directory is in the Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+import unittest
+from game_engine.board_features import BoardFeatures
+from game_engine.grid_manager import Grid
+from game_engine.headless_game import HeadlessGame
+from game_engine.placement_finder import find_placements
+
+
+def features_from_scratch(grid):
+    copy = Grid(grid.width, grid.height)
+    copy.grid = grid.grid
+    return BoardFeatures(copy).as_tuple()
+
+
+class TestBoardFeatures(unittest.TestCase):
+    def test_known_board(self):
+        grid = Grid(4, 4)
+        # . . . .
+        # X . . .
+        # X . X .
+        # X X . X
+        for x, y in [(0, 1), (0, 2), (2, 2), (0, 3), (1, 3), (3, 3)]:
+            grid.grid[y][x] = (1, (255, 255, 255))
+        features = BoardFeatures(grid)
+        self.assertEqual(features.aggregate_height, 3 + 1 + 2 + 1)
+        self.assertEqual(features.holes, 1)
+        self.assertEqual(features.bumpiness, 2 + 1 + 1)
+        self.assertEqual(features.row_transitions, 2 + 4 + 2)
+        self.assertEqual(features.column_transitions, 1 + 1 + 3 + 1)
+        self.assertEqual(features.wells, [0, 1, 0, 1])
+        self.assertEqual(features.well_sum, 2)
+
+    def test_incremental_matches_recompute(self):
+        game = HeadlessGame(seed=12)
+        features = BoardFeatures(game.grid)
+        cleared = 0
+        for _ in range(150):
+            # Always take the lowest placement so rows fill up and clear.
+            placements = find_placements(game.grid, game.tetromino.shape, cache=None)
+            lowest = max(placements, key=lambda placement: sum(y for _, y in placement.blocks))
+            for action in lowest.path + ('down',):
+                cleared += game.step(action).rows_cleared
+            self.assertEqual(features.as_tuple(), features_from_scratch(game.grid))
+            if game.game_over:
+                break
+        self.assertGreater(cleared, 0)
+
+    def test_cell_edits_are_tracked(self):
+        grid = Grid(10, 20)
+        features = BoardFeatures(grid)
+        grid.grid[19] = [(1, (255, 255, 255))] * 9 + [(0, None)]
+        grid.grid[17][9] = (1, (255, 255, 255))
+        self.assertEqual(features.as_tuple(), features_from_scratch(grid))
+        self.assertEqual(features.holes, 2)
+    def test_clone_copies_tracker(self):
+        game = HeadlessGame(seed=3)
+        features = BoardFeatures(game.grid)
+        for _ in range(4):
+            game.step('drop')
+        before = features.as_tuple()
+        clone = game.clone()
+        self.assertIsNot(clone.grid.features, features)
+        for _ in range(4):
+            clone.step('drop')
+        self.assertEqual(features.as_tuple(), before)
+        self.assertEqual(clone.grid.features.as_tuple(), features_from_scratch(clone.grid))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,67 @@
+import sys
+import os
+
+# Ensure the base directory is in the Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+import unittest
+from unittest.mock import Mock
+from game_engine.events import EventBus, PieceLocked, LinesCleared, LevelUp, GameOver, Paused, GameStarted
+from game_engine.game import Game
+from game_engine.tetromino_manager import Tetromino
+
+
+class TestEventBus(unittest.TestCase):
+    def test_emit_reaches_subscribers_of_that_type(self):
+        bus = EventBus()
+        locked = []
+        paused = []
+        bus.subscribe(PieceLocked, locked.append)
+        bus.subscribe(Paused, paused.append)
+        bus.emit(PieceLocked, 'T', 40)
+        self.assertEqual(locked, [PieceLocked('T', 40)])
+        self.assertEqual(paused, [])
+        bus.unsubscribe(PieceLocked, locked.append)
+        bus.emit(PieceLocked, 'I', 80)
+        self.assertEqual(len(locked), 1)
+
+    def test_unknown_event_type(self):
+        with self.assertRaises(ValueError):
+            EventBus().subscribe(dict, print)
+
+
+class TestGameEvents(unittest.TestCase):
+    def setUp(self):
+        self.control_panel = Mock()
+        self.game = Game(10, 20, self.control_panel, Mock(), Mock(), seed=1)
+        self.events = []
+        for event_type in (PieceLocked, LinesCleared, LevelUp, GameOver, Paused, GameStarted):
+            self.game.events.subscribe(event_type, self.events.append)
+
+    def test_line_clear_emits_lock_clear_and_level_up(self):
+        self.game.grid.grid[19] = [(1, (255, 255, 255))] * 6 + [(0, None)] * 4
+        self.game.tetromino = Tetromino('I')
+        for _ in range(3):
+            self.game.apply_action('right')
+        self.game.apply_action('drop')
+        self.assertEqual(self.events, [PieceLocked('I', 40), LinesCleared(1, 40), LevelUp(2)])
+
+    def test_pause_start_and_game_over(self):
+        self.game.toggle_pause()
+        self.game.start_new_game()
+        while not self.game.game_over:
+            self.game.apply_action('drop')
+            self.game.handle_natural_falling()
+        types = [type(event) for event in self.events]
+        self.assertEqual(types[:2], [Paused, GameStarted])
+        self.assertEqual(types[-1], GameOver)
+        self.assertEqual(types.count(GameOver), 1)
+
+    def test_game_does_not_update_control_panel(self):
+        for _ in range(5):
+            self.game.apply_action('drop')
+        self.game.toggle_pause()
+        self.control_panel.update.assert_not_called()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,122 @@
+import sys
+import os
+
+# Ensure the base directory is in the Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+import unittest
+from unittest.mock import Mock
+from game_engine.game import Game
+from game_engine.gravity import GravityController
+from game_engine.level_manager import LevelManager, GRAVITY_TABLE, MAX_G
+from game_engine.replay import ReplayRecorder, play_replay
+from game_engine.tetromino_manager import Tetromino
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestGravityController(unittest.TestCase):
+    def setUp(self):
+        self.clock = FakeClock()
+        self.recorder = ReplayRecorder(self.clock)
+        self.game = Game(10, 20, Mock(), Mock(), Mock(), seed=3, replay_recorder=self.recorder,
+                         gravity='guideline')
+        self.game.tetromino = Tetromino('O')
+        self.gravity = GravityController(self.game, tick_rate=60, lock_delay_ms=500, clock=self.clock)
+
+    def run_ticks(self, count, seconds_per_tick=1 / 60):
+        locked = 0
+        for _ in range(count):
+            self.clock.now += seconds_per_tick
+            locked += self.gravity.tick()
+        return locked
+
+    def test_level_one_moves_a_row_per_second(self):
+        self.run_ticks(60)
+        self.assertEqual(self.game.tetromino.position, (3, 1))
+
+    def test_classic_gravity_keeps_the_original_speeds(self):
+        game = Game(10, 20, Mock(), Mock(), Mock(), seed=3)
+        game.tetromino = Tetromino('O')
+        gravity = GravityController(game, tick_rate=60, clock=self.clock)
+        for _ in range(46):
+            gravity.tick()
+        self.assertEqual(game.tetromino.position, (3, 1))  # 750 ms per row at level 1
+        game.level_manager.update(1200)  # a Tetris
+        self.assertEqual(game.level_manager.get_gravity(60), 1000 / (100 * 60))
+
+    def test_twenty_g_reaches_the_stack_in_one_tick(self):
+        self.game.level_manager.level = 25
+        self.run_ticks(1)
+        self.assertEqual(self.game.tetromino.position, (3, 18))
+
+    def test_lock_delay(self):
+        self.game.level_manager.level = 25
+        self.assertEqual(self.run_ticks(20), 0)  # landed, a third of a second ago
+        self.assertEqual(self.game.grid.rows[19], 0)
+        self.assertEqual(self.run_ticks(15), 1)
+        self.assertEqual(self.game.grid.rows[19], 0b11 << 4)
+
+    def test_moving_restarts_lock_delay(self):
+        self.game.level_manager.level = 25
+        self.run_ticks(20)
+        self.game.apply_action('left')
+        self.assertEqual(self.run_ticks(20), 0)
+        self.assertEqual(self.run_ticks(15), 1)
+
+    def test_lock_delay_resets_are_capped(self):
+        self.game.level_manager.level = 25
+        self.game.tetromino = Tetromino('T')
+        self.run_ticks(1)
+        locked = 0
+        # Spinning on the stack keeps restarting the delay, but only 15 times.
+        for _ in range(60):
+            self.game.apply_action('rotate')
+            locked += self.run_ticks(1)
+            if locked:
+                break
+        self.assertEqual(locked, 1)
+        self.assertEqual(self.gravity.resets, 15)
+
+    def test_pausing_freezes_lock_delay(self):
+        self.game.level_manager.level = 25
+        self.run_ticks(20)
+        self.gravity.pause()
+        self.clock.now += 10.0
+        self.gravity.pause()
+        self.gravity.resume()
+        self.assertEqual(self.run_ticks(1), 0)
+        self.assertEqual(self.run_ticks(14), 1)
+
+    def test_high_gravity_replays_exactly(self):
+        self.game.level_manager.level = 20
+        while not self.game.game_over:
+            self.run_ticks(1)
+            if self.gravity.landed_at is not None:
+                self.game.apply_action('rotate')
+        replayed, claimed = play_replay(self.recorder.getvalue())
+        self.assertEqual(replayed.grid.rows, self.game.grid.rows)
+        self.assertEqual(claimed.board_hash, self.game.grid.board_hash)
+
+
+class TestGravityTable(unittest.TestCase):
+    def test_table_speeds_up_to_twenty_g(self):
+        self.assertAlmostEqual(GRAVITY_TABLE[0], 1 / 60)
+        self.assertEqual(list(GRAVITY_TABLE), sorted(GRAVITY_TABLE))
+        self.assertEqual(GRAVITY_TABLE[19], MAX_G)
+        level_manager = LevelManager(gravity='guideline')
+        level_manager.level = 99
+        self.assertEqual(level_manager.get_gravity(120), MAX_G / 2)
+
+    def test_unknown_gravity_model(self):
+        with self.assertRaises(ValueError):
+            LevelManager(gravity='instant')
+
+
+if __name__ == '__main__':
+    unittest.main()
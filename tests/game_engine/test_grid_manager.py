@@ -3,8 +3,10 @@ import os
 
 # Ensure the base directory is in the Python path
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+import random
 import unittest
-from game_engine.grid_manager import Grid
+from game_engine.grid_manager import Grid, piece_mask
+from game_engine.tetromino_manager import PALETTE
 
 class Tetromino:
     def __init__(self, blocks, color=(255, 255, 255)):
@@ -122,5 +124,161 @@ class TestGridManager(unittest.TestCase):
         self.grid.grid = [[(1, (255, 255, 255))] * 10 for _ in range(20)]
         self.assertTrue(self.grid.is_game_over())
 
+    def test_row_bitmasks_track_cells(self):
+        tetromino = Tetromino([(0, 19), (1, 19), (2, 19), (3, 19)])
+        self.grid.place_tetromino(tetromino)
+        self.assertEqual(self.grid.rows[19], 0b1111)
+        self.grid.grid[19][9] = (1, (255, 255, 255))
+        self.assertEqual(self.grid.rows[19], 0b1000001111)
+        self.grid.grid[19][0] = (0, None)
+        self.assertEqual(self.grid.rows[19], 0b1000001110)
+        self.assertEqual(self.grid.colors[19][0], None)
+
+    def test_fits_matches_cell_checks(self):
+        mask = piece_mask([(1, 0), (0, 1), (1, 1), (2, 1)])  # T-shape
+        self.grid.grid[19][4] = (1, (255, 255, 255))
+        self.assertTrue(self.grid.fits(mask, 0, 0))
+        self.assertFalse(self.grid.fits(mask, -1, 0))
+        self.assertFalse(self.grid.fits(mask, 8, 0))
+        self.assertFalse(self.grid.fits(mask, 0, 19))
+        self.assertFalse(self.grid.fits(mask, 3, 18))
+        self.assertTrue(self.grid.fits(mask, 5, 18))
+
+    def test_clear_rows_keeps_colors_with_their_rows(self):
+        self.grid.grid[19] = [(1, (255, 255, 255))] * 10
+        self.grid.grid[18][3] = (1, (255, 0, 0))
+        self.assertEqual(self.grid.clear_rows(), 1)
+        self.assertEqual(self.grid.grid[19][3], (1, (255, 0, 0)))
+        self.assertEqual(self.grid.rows[19], 1 << 3)
+        self.assertEqual(self.grid.rows[0], 0)
+
+    def test_heights_follow_placement_and_clears(self):
+        self.grid.grid[19] = [(1, (255, 255, 255))] * 9 + [(0, None)]
+        self.grid.grid[15][2] = (1, (255, 255, 255))
+        self.assertEqual(self.grid.heights[:4], [1, 1, 5, 1])
+        self.grid.place_tetromino(Tetromino([(9, 16), (9, 17), (9, 18), (9, 19)]))
+        self.assertEqual(self.grid.heights[9], 4)
+        self.assertEqual(self.grid.clear_rows(), 1)
+        self.assertEqual(self.grid.heights, [self.grid.column_height(x) for x in range(10)])
+        self.assertEqual(self.grid.heights[:4], [0, 0, 4, 0])
+        self.assertEqual(self.grid.heights[9], 3)
+        self.grid.grid[16][2] = (0, None)
+        self.assertEqual(self.grid.heights[2], 0)
+
+    def test_drop_position_uses_skyline(self):
+        mask = piece_mask([(1, 0), (0, 1), (1, 1), (2, 1)])  # T-shape
+        self.assertEqual(self.grid.drop_position(mask, 3, 0), 18)
+        self.grid.grid[17][4] = (1, (255, 255, 255))
+        self.assertEqual(self.grid.drop_position(mask, 3, 0), 15)
+        self.assertEqual(self.grid.drop_position(mask, 5, 0), 18)
+
+    def test_drop_position_under_overhang(self):
+        mask = piece_mask([(0, 0), (1, 0)])
+        self.grid.grid[10][0] = (1, (255, 255, 255))
+        # Already tucked under the overhang: the skyline would say row 9.
+        self.assertEqual(self.grid.drop_position(mask, 0, 12), 19)
+
+    def test_clone_is_independent(self):
+        self.grid.grid[19] = [(1, (255, 255, 255))] * 9 + [(0, None)]
+        clone = self.grid.clone()
+        self.assertIs(clone.buffer, self.grid.buffer)
+        clone.place_tetromino(Tetromino([(9, 16), (9, 17), (9, 18), (9, 19)], (0, 255, 255)))
+        self.assertEqual(clone.clear_rows(), 1)
+        self.assertEqual(self.grid.rows[19], 0b0111111111)
+        self.assertEqual(self.grid.heights[9], 0)
+        self.assertEqual(self.grid.board_hash, self.grid.compute_board_hash())
+        self.assertEqual(clone.board_hash, clone.compute_board_hash())
+        self.assertEqual(clone.get_cell(9, 19), (1, (0, 255, 255)))
+        # Rows the clear only moved down are still shared.
+        self.assertIs(clone.colors[5], self.grid.colors[4])
+
+        self.grid.grid[0][0] = (1, (255, 0, 0))
+        self.assertEqual(clone.get_cell(0, 0), (0, None))
+
+    def test_clears_on_a_tall_grid(self):
+        grid = Grid(64, 100)
+        almost_full = [(1, (255, 255, 255))] * 63 + [(0, None)]
+        for y in range(50, 100):
+            grid.grid[y] = almost_full
+        # Alternate clears at the bottom (the base moves) and at the stack
+        # top (the stack moves), refilling the garbage so that the window
+        # runs out of room and has to be recentred.
+        for clear in range(300):
+            top = grid.height - grid.heights[0]
+            grid.place_tetromino(Tetromino([(63, 99 if clear % 2 else top)]))
+            self.assertEqual(grid.clear_rows(), 1)
+            grid.grid[top] = almost_full
+        self.assertEqual(grid.rows, [0] * 50 + [(1 << 63) - 1] * 50)
+        self.assertEqual(grid.colors[99], tuple(color for _, color in almost_full))
+        self.assertEqual(grid.heights[:2], [50, 50])
+        self.assertEqual(grid.board_hash, grid.compute_board_hash())
+
+class TestPaletteGrid(unittest.TestCase):
+    def random_play(self, grid, rng, pieces):
+        """Drop vertical bars, mostly into the lowest column, clearing rows as they fill."""
+        cleared = 0
+        for _ in range(pieces):
+            if rng.random() < 0.9:
+                x = grid.heights.index(min(grid.heights))
+            else:
+                x = rng.randrange(grid.width)
+            y = grid.height - 1 - grid.heights[x]
+            length = min(rng.randint(1, 4), y + 1)
+            if length <= 0:
+                break
+            grid.place_tetromino(Tetromino([(x, y - dy) for dy in range(length)], rng.choice(PALETTE[1:])))
+            cleared += grid.clear_rows()
+        return cleared
+
+    def test_matches_color_storage(self):
+        for width, height in ((4, 12), (64, 100)):
+            with self.subTest(width=width, height=height):
+                colors, palette = Grid(width, height), Grid(width, height, PALETTE)
+                cleared = self.random_play(colors, random.Random(5), 3000)
+                self.assertEqual(self.random_play(palette, random.Random(5), 3000), cleared)
+                self.assertGreater(cleared, 20)
+                self.assertEqual(palette.rows, colors.rows)
+                self.assertEqual(palette.colors, colors.colors)
+                self.assertEqual(palette.heights, colors.heights)
+                self.assertEqual(palette.board_hash, colors.board_hash)
+                self.assertEqual(palette.grid, colors.grid)
+
+    def test_numpy_view_follows_the_board(self):
+        grid = Grid(4, 6, PALETTE)
+        view = grid.as_numpy()
+        self.assertFalse(view.flags.writeable)
+        grid.set_row(5, [(1, PALETTE[1])] * 3 + [(0, None)])
+        grid.set_cell(1, 4, (1, PALETTE[7]))
+        grid.place_tetromino(Tetromino([(3, 5)], PALETTE[2]))
+        self.assertEqual(grid.clear_rows(), 1)
+        # The view made before the changes still shows the live cells.
+        self.assertEqual(view.tolist(), [[0] * 4] * 5 + [[0, 7, 0, 0]])
+        self.assertEqual(bytes(memoryview(grid.cells)), bytes(view.ravel()))
+        self.assertEqual(grid.get_cell(1, 5), (1, PALETTE[7]))
+
+    def test_clone_has_its_own_cells(self):
+        grid = Grid(4, 4, PALETTE)
+        grid.set_cell(0, 3, (1, PALETTE[3]))
+        clone = grid.clone()
+        clone.set_cell(1, 3, (1, PALETTE[4]))
+        self.assertEqual(grid.as_numpy()[3].tolist(), [3, 0, 0, 0])
+        self.assertEqual(clone.as_numpy()[3].tolist(), [3, 4, 0, 0])
+
+    def test_rejects_colors_outside_the_palette(self):
+        grid = Grid(4, 4, PALETTE)
+        with self.assertRaises(ValueError):
+            grid.set_cell(0, 0, (1, (1, 2, 3)))
+        with self.assertRaises(ValueError):
+            grid.place_tetromino(Tetromino([(0, 3)], (1, 2, 3)))
+        self.assertEqual(grid.rows, [0] * 4)
+        with self.assertRaises(ValueError):
+            Grid(4, 4).as_numpy()
+
+    @unittest.skipIf(sys.version_info < (3, 12), "Python classes export buffers from 3.12 on")
+    def test_buffer_protocol(self):
+        grid = Grid(3, 2, PALETTE)
+        grid.set_cell(2, 1, (1, PALETTE[5]))
+        self.assertEqual(bytes(memoryview(grid)), bytes([0, 0, 0, 0, 0, 5]))
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,139 @@
+import sys
+import os
+import subprocess
+
+# Ensure the base directory is in the Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+import unittest
+from game_engine.headless_game import HeadlessGame, ACTIONS
+from game_engine.tetromino_manager import Tetromino
+
+BASE_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '../..'))
+
+
+class TestHeadlessGame(unittest.TestCase):
+    def play(self, seed, actions):
+        game = HeadlessGame(seed=seed)
+        for action in actions:
+            game.step(action)
+        return game
+
+    def test_does_not_import_pygame(self):
+        code = "import sys, game_engine.headless_game; sys.exit('pygame' in sys.modules)"
+        result = subprocess.run([sys.executable, '-c', code], cwd=BASE_DIR)
+        self.assertEqual(result.returncode, 0)
+
+    def test_same_seed_same_game(self):
+        actions = ['left', 'rotate', 'drop', 'right', 'right', 'drop', 'down'] * 20
+        first = self.play(7, actions)
+        second = self.play(7, actions)
+        self.assertEqual(first.grid.rows, second.grid.rows)
+        self.assertEqual(first.tetromino.shape, second.tetromino.shape)
+        self.assertEqual(first.get_score(), second.get_score())
+
+    def test_reset_restarts_the_sequence(self):
+        game = HeadlessGame(seed=3)
+        shapes = []
+        for _ in range(5):
+            shapes.append(game.tetromino.shape)
+            game.step('drop')
+        game.reset(3)
+        self.assertEqual(game.pieces_placed, 0)
+        self.assertEqual(game.grid.rows, [0] * 20)
+        replayed = []
+        for _ in range(5):
+            replayed.append(game.tetromino.shape)
+            game.step('drop')
+        self.assertEqual(shapes, replayed)
+
+    def test_preview_matches_spawned_pieces(self):
+        game = HeadlessGame(seed=6, randomizer='bag', preview_size=3)
+        for _ in range(14):
+            upcoming = game.get_next_shapes()
+            self.assertEqual(len(upcoming), 3)
+            game.step('drop')
+            if game.game_over:
+                break
+            self.assertEqual(game.tetromino.shape, upcoming[0])
+
+    def test_drop_locks_piece(self):
+        game = HeadlessGame(seed=1)
+        result = game.step('drop')
+        self.assertTrue(result.piece_locked)
+        self.assertEqual(game.pieces_placed, 1)
+        self.assertNotEqual(game.grid.rows[19], 0)
+
+    def test_moves_do_not_lock(self):
+        game = HeadlessGame(seed=1)
+        for action in ('left', 'right', 'rotate', None):
+            self.assertFalse(game.step(action).piece_locked)
+
+    def test_unknown_action(self):
+        with self.assertRaises(ValueError):
+            HeadlessGame(seed=1).step('hold')
+
+    def test_reward_matches_score(self):
+        game = HeadlessGame(seed=11)
+        game.grid.grid[19] = [(1, (255, 255, 255))] * 6 + [(0, None)] * 4
+        game.tetromino = Tetromino('I')
+        for _ in range(3):
+            game.step('right')
+        result = game.step('drop')
+        self.assertEqual(result.rows_cleared, 1)
+        self.assertEqual(result.reward, 40)
+        self.assertEqual(game.get_score(), 40)
+
+    def test_game_ends(self):
+        game = HeadlessGame(seed=5)
+        for _ in range(1000):
+            if game.step('drop').game_over:
+                break
+        self.assertTrue(game.game_over)
+        self.assertFalse(game.step('drop').piece_locked)
+        self.assertIn('drop', ACTIONS)
+    def test_snapshot_and_restore(self):
+        game = self.play(9, ['left', 'drop', 'rotate', 'drop'])
+        state = game.snapshot()
+        actions = ['right', 'drop', 'rotate', 'left', 'drop'] * 4
+        for action in actions:
+            game.step(action)
+        after = (list(game.grid.rows), game.get_score(), game.pieces_placed, game.tetromino.shape)
+
+        game.restore(state)
+        self.assertEqual(game.pieces_placed, 2)
+        self.assertEqual(game.grid.rows, state.grid.rows)
+        for action in actions:
+            game.step(action)
+        self.assertEqual((game.grid.rows, game.get_score(), game.pieces_placed, game.tetromino.shape), after)
+
+    def test_clone_does_not_touch_original(self):
+        game = self.play(4, ['drop'] * 3)
+        rows = list(game.grid.rows)
+        shapes = game.get_next_shapes()
+        clone = game.clone()
+        for _ in range(5):
+            clone.step('drop')
+        self.assertEqual(game.grid.rows, rows)
+        self.assertEqual(game.get_next_shapes(), shapes)
+        self.assertEqual(game.pieces_placed, 3)
+        self.assertEqual(clone.pieces_placed, 8)
+
+    def test_palette_storage_plays_the_same_game(self):
+        actions = ['left', 'rotate', 'drop', 'right', 'drop', 'rotate', 'rotate', 'drop'] * 30
+        colors = self.play(2, actions)
+        palette = HeadlessGame(seed=2, storage='palette')
+        for action in actions:
+            palette.step(action)
+        self.assertEqual(palette.grid.rows, colors.grid.rows)
+        self.assertEqual(palette.grid.colors, colors.grid.colors)
+        self.assertEqual(palette.get_score(), colors.get_score())
+        cells = palette.grid.as_numpy()
+        self.assertEqual((cells != 0).sum(), sum(bits.bit_count() for bits in colors.grid.rows))
+        self.assertEqual(palette.clone().storage, 'palette')
+
+    def test_unknown_storage(self):
+        with self.assertRaises(ValueError):
+            HeadlessGame(storage='bits')
+
+if __name__ == '__main__':
+    unittest.main()
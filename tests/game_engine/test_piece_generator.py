@@ -0,0 +1,62 @@
+import sys
+import os
+
+# Ensure the base directory is in the Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+import unittest
+from game_engine.piece_generator import PieceGenerator
+from game_engine.tetromino_manager import SHAPE_NAMES
+
+
+class TestPieceGenerator(unittest.TestCase):
+    def test_bag_deals_every_shape_once_per_bag(self):
+        generator = PieceGenerator(seed=1, mode='bag')
+        for _ in range(20):
+            self.assertEqual(sorted(generator.next() for _ in range(7)), sorted(SHAPE_NAMES))
+
+    def test_random_mode_uses_all_shapes(self):
+        generator = PieceGenerator(seed=1)
+        self.assertEqual(set(generator.next() for _ in range(500)), set(SHAPE_NAMES))
+
+    def test_preview_predicts_next(self):
+        for mode in ('random', 'bag'):
+            with self.subTest(mode=mode):
+                generator = PieceGenerator(seed=3, mode=mode, preview_size=4)
+                for _ in range(30):
+                    upcoming = generator.preview()
+                    self.assertEqual(len(upcoming), 4)
+                    self.assertEqual(generator.peek(1), upcoming[1])
+                    self.assertEqual(generator.next(), upcoming[0])
+                    self.assertEqual(generator.preview(3), upcoming[1:])
+
+    def test_seeded_streams_are_independent_and_repeatable(self):
+        first = PieceGenerator(seed=42, mode='bag')
+        second = PieceGenerator(seed=42, mode='bag')
+        other = PieceGenerator(seed=43, mode='bag')
+        sequence = [first.next() for _ in range(50)]
+        self.assertEqual(sequence, [second.next() for _ in range(50)])
+        self.assertNotEqual(sequence, [other.next() for _ in range(50)])
+
+    def test_invalid_arguments(self):
+        with self.assertRaises(ValueError):
+            PieceGenerator(mode='tgm')
+        with self.assertRaises(IndexError):
+            PieceGenerator(preview_size=2).peek(2)
+    def test_state_round_trip(self):
+        generator = PieceGenerator(seed=8, mode='bag', preview_size=3)
+        for _ in range(4):
+            generator.next()
+        state = generator.get_state()
+        expected = [generator.next() for _ in range(20)]
+        restored = PieceGenerator(seed=0, mode='bag', preview_size=3)
+        restored.set_state(state)
+        self.assertEqual([restored.next() for _ in range(20)], expected)
+    def test_clone_deals_the_same_shapes_independently(self):
+        generator = PieceGenerator(seed=12, mode='bag')
+        clone = generator.clone()
+        expected = [clone.next() for _ in range(30)]
+        self.assertEqual([generator.next() for _ in range(30)], expected)
+        self.assertIsNot(generator.random, clone.random)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,83 @@
+import sys
+import os
+
+# Ensure the base directory is in the Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+import unittest
+from game_engine.placement_finder import find_placements, find_drop_placements, PlacementCache
+from game_engine.grid_manager import Grid
+from game_engine.tetromino_manager import Tetromino
+
+
+class TestPlacementFinder(unittest.TestCase):
+    def test_counts_on_empty_board(self):
+        expected = {'I': 17, 'O': 9, 'T': 34, 'S': 17, 'Z': 17, 'J': 34, 'L': 34}
+        grid = Grid(10, 20)
+        for shape, count in expected.items():
+            with self.subTest(shape=shape):
+                placements = find_placements(grid, shape, cache=None)
+                self.assertEqual(len(placements), count)
+                self.assertTrue(all(max(y for _, y in p.blocks) == 19 for p in placements))
+
+    def test_paths_reach_their_placement(self):
+        grid = Grid(10, 20)
+        grid.grid[19] = [(1, (255, 255, 255))] * 4 + [(0, None)] * 6
+        for placement in find_placements(grid, 'J', cache=None):
+            with self.subTest(placement=placement.blocks):
+                tetromino = Tetromino('J')
+                for action in placement.path:
+                    if action == 'rotate':
+                        self.assertTrue(tetromino.rotate(grid))
+                    else:
+                        tetromino.move(action, grid)
+                self.assertFalse(tetromino.move('down', grid))
+                self.assertEqual(tuple(sorted(tetromino.get_blocks())), placement.blocks)
+
+    def test_finds_tuck_under_overhang(self):
+        grid = Grid(10, 20)
+        # A roof over columns 0-2 at row 17 leaves a pocket that can only be reached sideways.
+        for x in range(3):
+            grid.grid[17][x] = (1, (255, 255, 255))
+        placements = find_placements(grid, 'I', cache=None)
+        self.assertIn(((0, 19), (1, 19), (2, 19), (3, 19)), [p.blocks for p in placements])
+
+    def test_blocked_spawn_has_no_placements(self):
+        grid = Grid(10, 20)
+        grid.grid[1] = [(1, (255, 255, 255))] * 10
+        self.assertEqual(find_placements(grid, 'T', cache=None), ())
+
+    def test_search_from_a_moved_piece(self):
+        grid = Grid(10, 20)
+        placements = find_placements(grid, 'O', cache=None, start=(0, 10, 0))
+        self.assertEqual(len(placements), 9)
+        straight_down = [p for p in placements if p.blocks[0] == (1, 18)][0]
+        self.assertEqual(straight_down.path, ('down',) * 8)
+
+    def test_drop_placements_are_reachable_drops(self):
+        grid = Grid(10, 20)
+        grid.grid[19] = [(1, (255, 255, 255))] * 4 + [(0, None)] * 6
+        for shape in Tetromino.SHAPES:
+            with self.subTest(shape=shape):
+                drops = find_drop_placements(grid, Tetromino(shape))
+                self.assertEqual({p.blocks for p in drops}, {p.blocks for p in find_placements(grid, shape, cache=None)})
+                for placement in drops:
+                    tetromino = Tetromino(shape)
+                    for action in placement.path:
+                        tetromino.rotate(grid) if action == 'rotate' else tetromino.move(action, grid)
+                    tetromino.hard_drop(grid)
+                    self.assertEqual(tuple(sorted(tetromino.get_blocks())), placement.blocks)
+
+    def test_cache_is_bounded_and_reused(self):
+        cache = PlacementCache(max_entries=2)
+        grid = Grid(10, 20)
+        first = find_placements(grid, 'T', cache=cache)
+        self.assertIs(find_placements(grid, 'T', cache=cache), first)
+        find_placements(grid, 'S', cache=cache)
+        find_placements(grid, 'Z', cache=cache)
+        self.assertEqual(len(cache.entries), 2)
+        self.assertEqual(cache.hits, 1)
+        grid.grid[19][0] = (1, (255, 255, 255))
+        self.assertIsNot(find_placements(grid, 'S', cache=cache), first)
+
+if __name__ == '__main__':
+    unittest.main()
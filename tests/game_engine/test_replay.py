@@ -0,0 +1,165 @@
+import sys
+import os
+
+# Ensure the base directory is in the Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+import random
+import unittest
+from unittest.mock import Mock
+from game_engine.game import Game
+from game_engine.replay import (
+    ReplayRecorder, write_varint, read_varint, read_header, iter_events, play_replay, verify_replay,
+    build_index, seek, encode_index, decode_index,
+)
+from game_engine.headless_game import HeadlessGame
+from game_engine.placement_finder import find_placements
+
+
+class ScriptedInput:
+    """Presses one random key (or none) per frame, like KeyboardInput.is_key_pressed."""
+
+    def __init__(self, seed):
+        self.random = random.Random(seed)
+        self.pressed = None
+
+    def next_frame(self):
+        self.pressed = self.random.choice(['left', 'right', 'down', 'rotate', 'drop', None, None])
+
+    def is_key_pressed(self, action):
+        return action == self.pressed
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestReplay(unittest.TestCase):
+    def play_game(self, seed, recorder, clock, frames=5000):
+        game = Game(10, 20, Mock(), Mock(), Mock(), seed=seed, replay_recorder=recorder)
+        keys = ScriptedInput(seed)
+        for frame in range(frames):
+            if game.game_over:
+                break
+            clock.now += 1 / 60
+            keys.next_frame()
+            if frame % 10 == 0:
+                game.handle_natural_falling()
+            game.update(keys)
+        return game
+
+    def test_varint_round_trip(self):
+        buffer = bytearray()
+        values = [0, 1, 127, 128, 300, 2 ** 63 - 1]
+        for value in values:
+            write_varint(buffer, value)
+        offset = 0
+        for value in values:
+            decoded, offset = read_varint(buffer, offset)
+            self.assertEqual(decoded, value)
+        self.assertEqual(offset, len(buffer))
+
+    def test_replay_reproduces_finished_game(self):
+        clock = FakeClock()
+        recorder = ReplayRecorder(clock)
+        game = self.play_game(11, recorder, clock)
+        self.assertTrue(game.game_over)
+        data = recorder.getvalue()
+
+        header, _ = read_header(data)
+        self.assertEqual((header.grid_width, header.grid_height, header.seed), (10, 20, 11))
+        replayed, claimed = play_replay(data)
+        self.assertEqual(claimed, (game.get_score(), game.grid.board_hash))
+        self.assertEqual(replayed.grid.rows, game.grid.rows)
+        self.assertTrue(replayed.game_over)
+        self.assertTrue(verify_replay(data))
+
+    def test_negative_seed_round_trips(self):
+        clock = FakeClock()
+        recorder = ReplayRecorder(clock)
+        game = self.play_game(-7, recorder, clock)
+        data = recorder.getvalue()
+        self.assertEqual(read_header(data)[0].seed, -7)
+        replayed, _ = play_replay(data)
+        self.assertEqual(replayed.grid.rows, game.grid.rows)
+
+    def test_reads_version_one_header(self):
+        data = bytearray(b'TRP1')
+        for value in (10, 20, 11, 0):
+            write_varint(data, value)
+        self.assertEqual(read_header(bytes(data))[0][:3], (10, 20, 11))
+
+    def test_events_are_timestamped_and_compact(self):
+        clock = FakeClock()
+        recorder = ReplayRecorder(clock)
+        self.play_game(5, recorder, clock, frames=600)
+        events = list(iter_events(recorder.getvalue()))
+        self.assertIn('gravity', [event for _, event in events])
+        times = [time_ms for time_ms, _ in events]
+        self.assertEqual(times, sorted(times))
+        self.assertLess(len(recorder.getvalue()), 3 * len(events))
+
+    def test_tampered_replay_fails_verification(self):
+        clock = FakeClock()
+        recorder = ReplayRecorder(clock)
+        game = self.play_game(2, recorder, clock, frames=60)
+        self.assertFalse(game.game_over)
+        self.assertFalse(verify_replay(recorder.getvalue()))
+        data = recorder.finish(game.get_score() + 40, game.grid.board_hash)
+        self.assertFalse(verify_replay(data))
+
+    def long_replay(self, seed=4, pieces=120):
+        # A headless game recorded directly, placing every piece as low as it goes.
+        game = HeadlessGame(seed=seed)
+        recorder = ReplayRecorder(FakeClock())
+        recorder.start(seed, 10, 20)
+        while game.pieces_placed < pieces and not game.game_over:
+            placements = find_placements(game.grid, game.tetromino.shape, cache=None)
+            lowest = max(placements, key=lambda placement: sum(y for _, y in placement.blocks))
+            for action in lowest.path + ('down',):
+                recorder.record(action)
+                game.step(action)
+        return recorder.getvalue()
+
+    def test_seek_matches_linear_replay(self):
+        data = self.long_replay()
+        keyframes = build_index(data, interval=10)
+        self.assertTrue(keyframes)
+        self.assertEqual([keyframe.pieces_placed for keyframe in keyframes][:2], [10, 20])
+        self.assertGreater(keyframes[-1].rows_cleared, 0)
+
+        for target in (0, 5, 10, 27, keyframes[-1].pieces_placed):
+            header, offset = read_header(data)
+            linear = HeadlessGame(seed=header.seed)
+            for _, event in iter_events(data):
+                if linear.pieces_placed == target:
+                    break
+                linear.step('down' if event == 'gravity' else event)
+            sought = seek(data, keyframes, target)
+            self.assertEqual(sought.pieces_placed, target)
+            self.assertEqual(sought.grid.rows, linear.grid.rows)
+            self.assertEqual(sought.grid.colors, linear.grid.colors)
+            self.assertEqual(sought.grid.board_hash, linear.grid.board_hash)
+            self.assertEqual(sought.get_score(), linear.get_score())
+            self.assertEqual(sought.tetromino.shape, linear.tetromino.shape)
+            self.assertEqual(sought.get_next_shapes(), linear.get_next_shapes())
+
+    def test_resumed_replay_reaches_the_same_end(self):
+        data = self.long_replay()
+        keyframes = build_index(data, interval=25)
+        end, _ = play_replay(data)
+        resumed = seek(data, keyframes, 10 ** 9)
+        self.assertEqual(resumed.grid.rows, end.grid.rows)
+        self.assertEqual(resumed.get_score(), end.get_score())
+
+    def test_index_round_trip(self):
+        data = self.long_replay()
+        keyframes = build_index(data, interval=10)
+        self.assertEqual(decode_index(encode_index(keyframes), 20), keyframes)
+
+
+if __name__ == '__main__':
+    unittest.main()
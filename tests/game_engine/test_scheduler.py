@@ -0,0 +1,57 @@
+import sys
+import os
+
+# Ensure the base directory is in the Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+import unittest
+from game_engine.scheduler import FixedTimestepScheduler
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestFixedTimestepScheduler(unittest.TestCase):
+    def setUp(self):
+        self.clock = FakeClock()
+        self.scheduler = FixedTimestepScheduler(tick_rate=100, max_ticks_per_frame=5, clock=self.clock)
+
+    def test_ticks_follow_elapsed_time_not_frames(self):
+        total = 0
+        # 1 second of uneven frames gives 100 ticks whatever the frame rate.
+        for frame_time in [0.004, 0.016, 0.033, 0.007] * 16:
+            self.clock.now += frame_time
+            total += self.scheduler.advance()
+        self.clock.now = 1.0 + 1e-9
+        total += self.scheduler.advance()
+        self.assertEqual(total, 100)
+
+    def test_fast_frames_run_zero_ticks_and_interpolate(self):
+        self.clock.now += 0.004
+        self.assertEqual(self.scheduler.advance(), 0)
+        self.assertAlmostEqual(self.scheduler.alpha, 0.4)
+        self.clock.now += 0.007
+        self.assertEqual(self.scheduler.advance(), 1)
+        self.assertAlmostEqual(self.scheduler.alpha, 0.1)
+
+    def test_hitch_is_capped(self):
+        self.clock.now += 2.0
+        self.assertEqual(self.scheduler.advance(), 5)
+        self.assertEqual(self.scheduler.dropped_ticks, 195)
+        self.assertEqual(self.scheduler.alpha, 0.0)
+        self.clock.now += 0.01
+        self.assertEqual(self.scheduler.advance(), 1)
+
+    def test_reset_discards_paused_time(self):
+        self.clock.now += 0.5
+        self.scheduler.reset()
+        self.clock.now += 0.02
+        self.assertEqual(self.scheduler.advance(), 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -4,6 +4,7 @@ import os
 # Ensure the base directory is in the Python path
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
 
+import pickle
 import unittest
 from game_engine.tetromino_manager import Tetromino
 from game_engine.grid_manager import Grid
@@ -121,6 +122,97 @@ class TestTetrominoManager(unittest.TestCase):
                 if shape != 'O':
                     self.assertNotEqual(tetromino.blocks, initial_blocks)
 
+    def test_rotation_tables_cycle(self):
+        for shape, states in Tetromino.ROTATIONS.items():
+            with self.subTest(shape=shape):
+                self.assertEqual(len(states), 4)
+                self.assertEqual(list(states[0]), Tetromino.SHAPES[shape])
+                tetromino = Tetromino(shape)
+                tetromino.position = (3, 5)
+                grid = Grid(10, 20)
+                for _ in range(4):
+                    tetromino.rotate(grid)
+                self.assertEqual(tetromino.rotation, 0)
+                self.assertEqual(tetromino.blocks, states[0])
+                self.assertEqual(tetromino.position, (3, 5))
+
+    def test_rotation_stays_in_bounding_box(self):
+        for shape, states in Tetromino.ROTATIONS.items():
+            size = 4 if shape in ('I', 'O') else 3
+            for state in states:
+                with self.subTest(shape=shape, state=state):
+                    self.assertTrue(all(0 <= x < size and 0 <= y < size for x, y in state))
+
+    def test_counter_clockwise_undoes_clockwise(self):
+        tetromino = Tetromino('L')
+        grid = Grid(10, 20)
+        tetromino.position = (4, 5)
+        tetromino.rotate(grid)
+        tetromino.rotate(grid, direction=-1)
+        self.assertEqual(tetromino.rotation, 0)
+        self.assertEqual(tetromino.position, (4, 5))
+
+    def test_wall_kick_off_right_wall(self):
+        tetromino = Tetromino('I')
+        grid = Grid(10, 20)
+        tetromino.position = (3, 5)
+        tetromino.rotate(grid)  # Vertical, occupying column 5
+        for _ in range(grid.width):
+            tetromino.move('right', grid)
+        self.assertEqual(max(x for x, _ in tetromino.get_blocks()), 9)
+        # Rotating back to horizontal in place would leave the grid, so it must kick left.
+        self.assertTrue(tetromino.rotate(grid))
+        self.assertTrue(all(grid.is_valid_position(x, y) for x, y in tetromino.get_blocks()))
+        self.assertNotEqual(tetromino.position[0], 7)
+
+    def test_rotation_blocked_without_valid_kick(self):
+        tetromino = Tetromino('T')
+        grid = Grid(3, 3)
+        grid.grid[2] = [(1, (255, 255, 255))] * 3
+        tetromino.position = (0, 0)
+        self.assertFalse(tetromino.rotate(grid))
+        self.assertEqual(tetromino.rotation, 0)
+
+    def test_hard_drop_matches_stepping_down(self):
+        grid = Grid(10, 20)
+        for x in range(10):
+            grid.grid[19 - x % 5][x] = (1, (255, 255, 255))
+        for shape in Tetromino.SHAPES:
+            with self.subTest(shape=shape):
+                dropped = Tetromino(shape)
+                stepped = Tetromino(shape)
+                ghost = dropped.get_ghost_blocks(grid)
+                rows = dropped.hard_drop(grid)
+                while stepped.move('down', grid):
+                    pass
+                self.assertEqual(dropped.position, stepped.position)
+                self.assertEqual(rows, stepped.position[1])
+                self.assertEqual(ghost, stepped.get_blocks())
+
+    def test_pieces_share_their_prototype(self):
+        first, second = Tetromino('S'), Tetromino('S')
+        self.assertIs(first.prototype, second.prototype)
+        self.assertFalse(hasattr(first, '__dict__'))
+        first.rotation = 3
+        self.assertEqual(first.blocks, Tetromino.ROTATIONS['S'][3])
+        self.assertEqual(first.mask, Tetromino.ROTATION_MASKS['S'][3])
+        self.assertEqual(second.blocks, Tetromino.ROTATIONS['S'][0])
+
+    def test_shape_data_is_read_only(self):
+        tetromino = Tetromino('J')
+        with self.assertRaises(AttributeError):
+            tetromino.blocks = Tetromino.ROTATIONS['J'][2]
+        with self.assertRaises(AttributeError):
+            tetromino.mask = Tetromino.ROTATION_MASKS['J'][2]
+
+    def test_pickle_keeps_the_shared_prototype(self):
+        tetromino = Tetromino('L')
+        tetromino.rotation = 1
+        tetromino.position = (4, 7)
+        copy = pickle.loads(pickle.dumps(tetromino))
+        self.assertIs(copy.prototype, tetromino.prototype)
+        self.assertEqual((copy.rotation, copy.position), (1, (4, 7)))
+
 if __name__ == '__main__':
     unittest.main()
 
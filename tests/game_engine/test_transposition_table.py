@@ -0,0 +1,69 @@
+import sys
+import os
+
+# Ensure the base directory is in the Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+import unittest
+from game_engine.transposition_table import TranspositionTable
+from game_engine.headless_game import HeadlessGame
+from game_engine.grid_manager import Grid
+from game_engine.tetromino_manager import Tetromino
+
+
+class TestBoardHash(unittest.TestCase):
+    def test_incremental_hash_matches_recomputed(self):
+        game = HeadlessGame(seed=8)
+        actions = ['left', 'left', 'drop', 'rotate', 'right', 'drop', 'right', 'right', 'right', 'drop', 'drop']
+        for step in range(400):
+            game.step(actions[step % len(actions)])
+            self.assertEqual(game.grid.board_hash, game.grid.compute_board_hash())
+            if game.game_over:
+                game.reset(step)
+        self.assertGreater(game.rows_cleared + game.pieces_placed, 0)
+
+    def test_hash_follows_line_clears(self):
+        grid = Grid(10, 20)
+        grid.grid[19] = [(1, (255, 255, 255))] * 9 + [(0, None)]
+        grid.grid[18][0] = (1, (255, 0, 0))
+        tetromino = Tetromino('I')
+        tetromino.rotate(grid)
+        tetromino.position = (7, 16)
+        grid.place_tetromino(tetromino)
+        self.assertEqual(grid.clear_rows(), 1)
+        expected = Grid(10, 20)
+        expected.grid[19][0] = (1, (255, 0, 0))
+        for y in (17, 18, 19):
+            expected.grid[y][9] = (1, (0, 255, 255))
+        self.assertEqual(grid.board_hash, expected.board_hash)
+        self.assertNotEqual(grid.board_hash, 0)
+
+    def test_empty_cells_do_not_change_hash(self):
+        grid = Grid(10, 20)
+        grid.grid[5][5] = (0, None)
+        self.assertEqual(grid.board_hash, 0)
+        grid.grid[5][5] = (1, (1, 1, 1))
+        grid.grid[5][5] = (1, (2, 2, 2))
+        self.assertEqual(grid.board_hash, grid.compute_board_hash())
+
+
+class TestTranspositionTable(unittest.TestCase):
+    def test_store_and_lookup(self):
+        table = TranspositionTable(size_bits=4)
+        table.store(1234, 'T', 'I', 9.5, depth=2)
+        self.assertEqual(table.lookup(1234, 'T', 'I'), 9.5)
+        self.assertIsNone(table.lookup(1234, 'T', 'O'))
+        self.assertIsNone(table.lookup(1234, 'T', 'I', depth=3))
+        self.assertEqual((table.hits, table.misses), (1, 2))
+
+    def test_deeper_entries_survive_collisions(self):
+        table = TranspositionTable(size_bits=0)
+        table.store(1, 'T', None, 'deep', depth=3)
+        table.store(2, 'S', None, 'shallow', depth=1)
+        self.assertEqual(table.lookup(1, 'T'), 'deep')
+        self.assertIsNone(table.lookup(2, 'S'))
+        table.store(2, 'S', None, 'deeper', depth=4)
+        self.assertEqual(table.lookup(2, 'S'), 'deeper')
+        self.assertEqual(len(table.slots), 1)
+
+if __name__ == '__main__':
+    unittest.main()
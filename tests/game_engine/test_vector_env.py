@@ -0,0 +1,93 @@
+import sys
+import os
+
+# Ensure the base directory is in the Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+import unittest
+import numpy as np
+from game_engine.vector_env import VectorEnv, COLUMN_RANGES
+from game_engine.tetromino_manager import SHAPE_NAMES
+from game_engine.grid_manager import Grid
+from game_engine.tetromino_manager import Tetromino
+from game_engine.score_manager import ScoreManager
+
+
+class TestVectorEnv(unittest.TestCase):
+    def setUp(self):
+        self.env = VectorEnv(16, seed=0)
+
+    def test_initial_state(self):
+        self.assertEqual(self.env.boards.shape, (16, 20, 10))
+        self.assertEqual(self.env.boards.dtype, np.uint8)
+        self.assertFalse(self.env.boards.any())
+        self.assertTrue(((self.env.pieces >= 0) & (self.env.pieces < 7)).all())
+
+    def test_matches_grid_rules(self):
+        rng = np.random.default_rng(1)
+        grids = [Grid(10, 20) for _ in range(16)]
+        scores = [ScoreManager() for _ in range(16)]
+        for _ in range(60):
+            pieces = self.env.pieces.copy()
+            rotations = rng.integers(0, 4, size=16)
+            columns = rng.integers(-2, 10, size=16)
+            expected_rewards = []
+            for n, grid in enumerate(grids):
+                tetromino = Tetromino(SHAPE_NAMES[pieces[n]])
+                tetromino.rotation = int(rotations[n])
+                low, high = COLUMN_RANGES[pieces[n], rotations[n]]
+                x = int(np.clip(columns[n], low, 9 - high))
+                y = -min(by for _, by in tetromino.blocks)
+                tetromino.position = (x, y)
+                if grid.fits(tetromino.mask, x, y):
+                    while tetromino.move('down', grid):
+                        pass
+                    grid.place_tetromino(tetromino)
+                before = scores[n].get_score()
+                scores[n].add_points(grid.clear_rows())
+                expected_rewards.append(scores[n].get_score() - before)
+
+            boards, _, rewards, dones, _ = self.env.step(rotations, columns)
+            self.assertEqual(list(rewards), expected_rewards)
+            for n in range(16):
+                if dones[n]:
+                    grids[n] = Grid(10, 20)
+                    scores[n] = ScoreManager()
+                    self.assertFalse(boards[n].any())
+                else:
+                    occupancy = [[int(bits >> x & 1) for x in range(10)] for bits in grids[n].rows]
+                    self.assertEqual((boards[n] != 0).astype(int).tolist(), occupancy)
+
+    def test_line_clear_scoring(self):
+        env = VectorEnv(2, seed=0)
+        env.boards[:, 16:, :] = 1
+        env.boards[:, 16:, 0] = 0
+        env.pieces[:] = SHAPE_NAMES.index('I')
+        boards, _, rewards, dones, _ = env.step([1, 1], [-2, -2])
+        self.assertEqual(list(rewards), [1200, 1200])
+        self.assertFalse(dones.any())
+        self.assertFalse(boards.any())
+        self.assertEqual(list(env.scores), [1200, 1200])
+        self.assertEqual(list(env.levels), [31, 31])
+
+    def test_finished_boards_auto_reset(self):
+        env = VectorEnv(3, seed=0)
+        env.boards[1, 1:, :9] = 1
+        env.scores[1] = 500
+        _, _, _, dones, info = env.step([0, 0, 0], [3, 3, 3])
+        self.assertEqual(list(dones), [False, True, False])
+        self.assertEqual(list(info['scores']), [500])
+        self.assertFalse(env.boards[1].any())
+        self.assertEqual(env.scores[1], 0)
+
+    def test_seeded_runs_repeat(self):
+        first = VectorEnv(4, seed=9)
+        second = VectorEnv(4, seed=9)
+        for step in range(30):
+            action = ([step % 4] * 4, [step % 10] * 4)
+            first.step(*action)
+            second.step(*action)
+        self.assertTrue((first.boards == second.boards).all())
+        self.assertTrue((first.scores == second.scores).all())
+
+if __name__ == '__main__':
+    unittest.main()
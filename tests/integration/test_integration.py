@@ -250,5 +250,15 @@ class TestIntegration(unittest.TestCase):
         self.control_panel.handle_events(pygame.event.Event(pygame.MOUSEBUTTONDOWN, {'pos': self.control_panel.high_scores_button.rect.topleft}))
         self.assertTrue(self.game.is_high_scores_open)  # Check if the high scores screen is open
 
+    def test_drop_key_locks_tetromino(self):
+        keyboard_input = Mock()
+        keyboard_input.is_key_pressed.side_effect = lambda action: action == 'drop'
+        tetromino = Tetromino('O')
+        self.game.tetromino = tetromino
+        self.game.update(keyboard_input)
+        self.assertIsNot(self.game.tetromino, tetromino)
+        self.assertEqual(self.game.grid.rows[19], 0b110 << 3)
+        self.sound_effects_manager.play_sound.assert_any_call('block_placed')
+
 if __name__ == '__main__':
     unittest.main()
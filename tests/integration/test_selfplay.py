@@ -0,0 +1,45 @@
+import sys
+import os
+import tempfile
+
+# Ensure the base directory is in the Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+import unittest
+from selfplay import generate, read_shard, shard_path
+from ai_player.policies import create_policy
+
+
+class TestSelfPlay(unittest.TestCase):
+    def read_all(self, output_dir, shards):
+        return [list(read_shard(shard_path(output_dir, index))) for index in range(shards)]
+
+    def test_shards_are_deterministic_across_worker_counts(self):
+        with tempfile.TemporaryDirectory() as first, tempfile.TemporaryDirectory() as second:
+            results = generate(first, shards=3, games_per_shard=2, seed=5, workers=1, max_steps=300)
+            generate(second, shards=3, games_per_shard=2, seed=5, workers=3, max_steps=300)
+            self.assertEqual(self.read_all(first, 3), self.read_all(second, 3))
+            self.assertEqual([result[0] for result in results], [0, 1, 2])
+            self.assertEqual(sum(result[2] for result in results), sum(len(shard) for shard in self.read_all(first, 3)))
+
+    def test_records_describe_the_board_before_the_action(self):
+        with tempfile.TemporaryDirectory() as output_dir:
+            generate(output_dir, shards=1, games_per_shard=1, seed=1, workers=1, max_steps=200)
+            records = list(read_shard(shard_path(output_dir, 0)))
+            rows, shape, rotation, x, y, action, reward = records[0]
+            self.assertEqual(rows, (0,) * 20)
+            self.assertEqual((x, y), (3, 0))
+            self.assertIn(action, ('left', 'right', 'rotate', 'drop'))
+            self.assertTrue(all(record[6] >= 0 for record in records))
+
+    def test_unknown_policy(self):
+        with self.assertRaises(ValueError):
+            create_policy('nope')
+
+    def test_grid_too_tall_for_records(self):
+        with tempfile.TemporaryDirectory() as output_dir:
+            with self.assertRaises(ValueError):
+                generate(output_dir, 1, 1, grid_height=200)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,22 @@
+import sys
+import os
+
+# Ensure the base directory is in the Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+import unittest
+from stress import run_stress
+
+
+class TestStress(unittest.TestCase):
+    def test_stress_scenario_keeps_the_board_consistent(self):
+        # check=True verifies the hash, heights and features after every clear.
+        result = run_stress(width=16, height=400, clears=40, seed=3, check=True)
+        self.assertEqual(result['clears'], 40)
+        self.assertEqual(result['rows_cleared'], 160)
+
+    def test_stress_scenario_stops_when_the_garbage_runs_out(self):
+        result = run_stress(width=10, height=40, depth=8, clears=10)
+        self.assertEqual((result['clears'], result['rows_cleared']), (2, 8))
+
+if __name__ == '__main__':
+    unittest.main()
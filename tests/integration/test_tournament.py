@@ -0,0 +1,68 @@
+import sys
+import os
+import tempfile
+
+# Ensure the base directory is in the Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+import unittest
+from tournament import run_tournament, play_game, read_results, summarize, percentile, format_report, GameResult
+
+
+class TestTournament(unittest.TestCase):
+    def test_streams_results_and_resumes(self):
+        with tempfile.TemporaryDirectory() as output_dir:
+            results_path = os.path.join(output_dir, 'results.jsonl')
+            summary = run_tournament(['random', 'random_drop'], 3, seed=2, workers=2,
+                                     results_path=results_path, max_steps=200)
+            self.assertEqual(len(read_results(results_path)), 6)
+            self.assertEqual(summary['random']['games'], 3)
+            self.assertEqual(sorted(summary), ['random', 'random_drop'])
+
+            # A stopped run leaves complete lines; the rerun plays only the missing games.
+            with open(results_path) as file:
+                lines = file.readlines()
+            with open(results_path, 'w') as file:
+                file.writelines(lines[:4])
+                file.write('{"policy": "ran')
+            played = []
+            resumed = run_tournament(['random', 'random_drop'], 3, seed=2, workers=1,
+                                     results_path=results_path, max_steps=200,
+                                     on_result=lambda result, results: played.append(result))
+            self.assertEqual(len(played), 2)
+            self.assertEqual(resumed, summary)
+
+    def test_other_settings_are_not_resumed(self):
+        with tempfile.TemporaryDirectory() as output_dir:
+            results_path = os.path.join(output_dir, 'results.jsonl')
+            run_tournament(['random'], 2, seed=2, workers=1, results_path=results_path, max_steps=100)
+            played = []
+            summary = run_tournament(['random'], 2, seed=2, workers=1, results_path=results_path, max_steps=200,
+                                     on_result=lambda result, results: played.append(result))
+            self.assertEqual(len(played), 2)
+            self.assertEqual(summary['random']['games'], 2)
+            self.assertEqual({result.max_steps for result in read_results(results_path)}, {100, 200})
+
+    def test_autoplayer_games_repeat(self):
+        task = ('autoplayer', 5, 40, 10, 20)
+        self.assertEqual(play_game(task), play_game(task))
+
+    def test_summary_percentiles(self):
+        results = [GameResult('bot', seed, score, seed, 10 * seed, 100) for seed, score in enumerate([0, 10, 20, 30, 40])]
+        entry = summarize(results)['bot']
+        self.assertEqual(entry['mean_score'], 20)
+        self.assertEqual(entry['p50'], 20)
+        self.assertEqual(entry['p25'], 10)
+        self.assertAlmostEqual(entry['p90'], 36)
+        self.assertEqual(entry['mean_pieces'], 20)
+        self.assertIn('bot', format_report(summarize(results)))
+
+    def test_percentile_of_one_value(self):
+        self.assertEqual(percentile([7], 0.99), 7)
+
+    def test_unknown_policy(self):
+        with self.assertRaises(ValueError):
+            run_tournament(['nope'], 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
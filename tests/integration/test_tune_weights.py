@@ -0,0 +1,50 @@
+import sys
+import os
+import tempfile
+
+# Ensure the base directory is in the Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+import unittest
+from tune_weights import tune, play, ResultCache
+from ai_player.evaluation import DEFAULT_WEIGHTS
+
+
+class TestTuneWeights(unittest.TestCase):
+    def test_resumes_from_the_cache(self):
+        with tempfile.TemporaryDirectory() as output_dir:
+            cache_path = os.path.join(output_dir, 'results.jsonl')
+            first = tune(generations=2, population=4, games=2, seed=7, workers=2, cache_path=cache_path, max_pieces=15)
+            with open(cache_path) as file:
+                played = len(file.readlines())
+            self.assertLessEqual(played, 2 * 4 * 2)
+
+            # Same arguments and a full cache: nothing is replayed and the answer is the same.
+            second = tune(generations=2, population=4, games=2, seed=7, workers=1, cache_path=cache_path, max_pieces=15)
+            with open(cache_path) as file:
+                self.assertEqual(len(file.readlines()), played)
+            self.assertEqual(first, second)
+
+    def test_games_are_deterministic(self):
+        task = (DEFAULT_WEIGHTS, 11, 30, 10, 20)
+        self.assertEqual(play(task), play(task))
+        self.assertEqual(play(task)[4], 30)
+
+    def test_cache_skips_a_truncated_line(self):
+        with tempfile.TemporaryDirectory() as output_dir:
+            cache_path = os.path.join(output_dir, 'results.jsonl')
+            ResultCache(cache_path).add((1.0, 2.0), 3, 40, 1, 12)
+            with open(cache_path, 'a') as file:
+                file.write('{"weights": [1.0')
+            self.assertEqual(ResultCache(cache_path).get((1.0, 2.0), 3), (40, 1, 12))
+
+    def test_cache_only_loads_its_own_setting(self):
+        with tempfile.TemporaryDirectory() as output_dir:
+            cache_path = os.path.join(output_dir, 'results.jsonl')
+            ResultCache(cache_path, max_pieces=100).add((1.0, 2.0), 3, 40, 1, 12)
+            self.assertEqual(ResultCache(cache_path, max_pieces=100).get((1.0, 2.0), 3), (40, 1, 12))
+            self.assertIsNone(ResultCache(cache_path, max_pieces=200).get((1.0, 2.0), 3))
+            self.assertIsNone(ResultCache(cache_path, max_pieces=100, grid_width=12).get((1.0, 2.0), 3))
+
+
+if __name__ == '__main__':
+    unittest.main()
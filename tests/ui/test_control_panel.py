@@ -6,6 +6,7 @@ sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../.
 import unittest
 import pygame
 from ui.control_panel import ControlPanel
+from game_engine.events import EventBus, LinesCleared, GameOver
 from unittest.mock import Mock
 
 class TestControlPanel(unittest.TestCase):
@@ -75,6 +76,28 @@ class TestControlPanel(unittest.TestCase):
         score_text = self.control_panel.font.render('Score: 250', True, (255, 255, 255))
         self.assertEqual(self.control_panel.score_label.image.get_rect(), score_text.get_rect())
 
+    def test_refresh_renders_only_dirty_labels(self):
+        self.mock_game.get_score.return_value = 0
+        self.mock_game.level_manager.get_level.return_value = 1
+        self.control_panel.refresh()
+        self.mock_game.high_scores_persistence_manager.get_top_high_score.reset_mock()
+        level_image = self.control_panel.level_label.image
+
+        events = EventBus()
+        self.control_panel.subscribe(events)
+        self.mock_game.get_score.return_value = 1200
+        events.emit(LinesCleared, 4, 1200)
+        self.control_panel.refresh()
+        score_text = self.control_panel.font.render('Score: 1200', True, (255, 255, 255))
+        self.assertEqual(self.control_panel.score_label.image.get_rect(), score_text.get_rect())
+        self.assertIs(self.control_panel.level_label.image, level_image)
+        self.mock_game.high_scores_persistence_manager.get_top_high_score.assert_not_called()
+
+        events.emit(GameOver, 1200)
+        self.control_panel.refresh()
+        self.control_panel.refresh()
+        self.mock_game.high_scores_persistence_manager.get_top_high_score.assert_called_once()
+
     def test_button_positions(self):
         self.assertEqual(self.control_panel.start_button.rect.topleft, (self.control_panel.grid_width * self.control_panel.cell_size + 10, 10))
         self.assertEqual(self.control_panel.pause_button.rect.topleft, (self.control_panel.grid_width * self.control_panel.cell_size + 10, 70))
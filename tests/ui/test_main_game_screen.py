@@ -38,6 +38,22 @@ class TestMainGameScreen(unittest.TestCase):
         x, y = block[0] * self.cell_size, block[1] * self.cell_size
         self.assertEqual(self.screen.screen.get_at((x + 1, y + 1)), self.tetromino.color + (255,))  # Inside a tetromino block
 
+    def test_draw_tetromino_interpolated_fall(self):
+        self.tetromino = Tetromino('O')
+        self.tetromino.position = (0, 5)
+        self.screen.draw_tetromino(self.tetromino, 0.5)
+        x, y = self.tetromino.get_blocks()[0]
+        top = y * self.cell_size
+        self.assertEqual(self.screen.screen.get_at((x * self.cell_size + 5, top + 5)), (0, 0, 0, 255))
+        self.assertEqual(self.screen.screen.get_at((x * self.cell_size + 5, top + 20)), self.tetromino.color + (255,))
+
+    def test_draw_ghost(self):
+        self.tetromino.position = (0, 0)
+        self.screen.draw_ghost(self.tetromino, self.grid)
+        x, y = self.tetromino.get_ghost_blocks(self.grid)[0]
+        self.assertGreaterEqual(y, 18)
+        self.assertEqual(self.screen.screen.get_at((x * self.cell_size, y * self.cell_size)), self.tetromino.color + (255,))
+
     def test_update(self):
         self.screen.update(self.grid, self.tetromino)
         # Check if the screen was updated by verifying the color of a cell
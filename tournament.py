@@ -0,0 +1,207 @@
+import argparse
+import json
+import os
+import random
+import sys
+from collections import namedtuple
+from game_engine.headless_game import HeadlessGame
+from game_engine.processes import spawn_context
+from ai_player.policies import POLICIES
+
+GameResult = namedtuple('GameResult', [
+    'policy', 'seed', 'score', 'rows_cleared', 'pieces', 'steps', 'max_steps', 'grid_width', 'grid_height',
+], defaults=(None, None, None))
+PERCENTILES = (0.1, 0.25, 0.5, 0.75, 0.9, 0.99)
+# Constructor options that make a registered policy repeatable for benchmarking:
+# the autoplayer searches to its full depth instead of as deep as its time budget allows.
+BENCHMARK_OPTIONS = {'autoplayer': {'time_budget_ms': None}}
+
+
+def tournament_seeds(base_seed, games):
+    """The game seeds every policy plays, in order."""
+    rng = random.Random(f'tournament:{base_seed}')
+    return [rng.getrandbits(64) for _ in range(games)]
+
+
+def play_game(task):
+    """
+    Play one seeded headless game with a registered policy.
+
+    The policy's own random stream is seeded from the game seed and the
+    policy is built with its BENCHMARK_OPTIONS, so it plays every game the
+    same way in every run, whatever the machine or pool load.
+
+    Parameters:
+        task (tuple): (policy name, seed, max_steps, grid_width, grid_height).
+
+    Returns:
+        GameResult: The final score, rows cleared, pieces placed and steps taken.
+    """
+    name, seed, max_steps, grid_width, grid_height = task
+    game = HeadlessGame(grid_width, grid_height, seed=seed)
+    policy = POLICIES[name](seed=seed, **BENCHMARK_OPTIONS.get(name, {}))
+    steps = 0
+    while not game.game_over and steps < max_steps:
+        game.step(policy.choose_action(game))
+        steps += 1
+    return GameResult(
+        name, seed, game.get_score(), game.rows_cleared, game.pieces_placed, steps, max_steps, grid_width, grid_height,
+    )
+
+
+def read_results(path):
+    """Load the GameResults streamed to a results file, skipping a line cut short."""
+    results = []
+    if not os.path.exists(path):
+        return results
+    with open(path) as file:
+        for line in file:
+            try:
+                results.append(GameResult(**json.loads(line)))
+            except (ValueError, TypeError):
+                continue
+    return results
+
+
+def percentile(values, fraction):
+    """Linearly interpolated percentile of a sorted, non-empty list."""
+    position = (len(values) - 1) * fraction
+    lower = int(position)
+    upper = min(lower + 1, len(values) - 1)
+    return values[lower] + (values[upper] - values[lower]) * (position - lower)
+
+
+def summarize(results):
+    """
+    Aggregate game results per policy.
+
+    Returns:
+        dict: policy name -> dict of games, mean score, score percentiles
+        (keyed 'p10', 'p50', ...), mean rows cleared and mean pieces placed.
+    """
+    by_policy = {}
+    for result in results:
+        by_policy.setdefault(result.policy, []).append(result)
+    summary = {}
+    for name, games in sorted(by_policy.items()):
+        scores = sorted(game.score for game in games)
+        entry = {
+            'games': len(games),
+            'mean_score': sum(scores) / len(scores),
+            'mean_rows_cleared': sum(game.rows_cleared for game in games) / len(games),
+            'mean_pieces': sum(game.pieces for game in games) / len(games),
+        }
+        for fraction in PERCENTILES:
+            entry[f'p{round(fraction * 100)}'] = percentile(scores, fraction)
+        summary[name] = entry
+    return summary
+
+
+def format_report(summary):
+    """Render a summary as a plain-text comparison table, best mean score first."""
+    columns = ['games', 'mean_score'] + [f'p{round(fraction * 100)}' for fraction in PERCENTILES]
+    columns += ['mean_rows_cleared', 'mean_pieces']
+    width = max([len('policy')] + [len(name) for name in summary])
+    widths = [max(len(column), 8) + 2 for column in columns]
+    lines = ['policy'.ljust(width) + ''.join(f'{column:>{size}}' for column, size in zip(columns, widths))]
+    for name, entry in sorted(summary.items(), key=lambda item: -item[1]['mean_score']):
+        lines.append(name.ljust(width) + ''.join(
+            f"{entry[column]:>{size}}" if column == 'games' else f"{entry[column]:>{size}.1f}"
+            for column, size in zip(columns, widths)
+        ))
+    return '\n'.join(lines)
+
+
+def run_tournament(policies, games, seed=0, workers=None, results_path=None, max_steps=10000,
+                   grid_width=10, grid_height=20, on_result=None):
+    """
+    Play every policy on the same seeded games across a process pool.
+
+    Each finished game is appended to results_path as one JSON line the
+    moment it arrives, so a run that is stopped early still leaves a usable
+    results file, and rerunning the same command only plays the games the
+    file does not have yet. Results are keyed on the policy, the seed,
+    max_steps and the grid size, so runs with other settings can share the
+    file without being mixed in.
+
+    Parameters:
+        policies (sequence): Names from POLICIES.
+        games (int): Seeded games per policy.
+        on_result (callable): Called with each new GameResult as it arrives
+            and the list of every result of this run so far, resumed ones
+            included.
+
+    Returns:
+        dict: summarize() of every result for these policies and seeds.
+    """
+    for name in policies:
+        if name not in POLICIES:
+            raise ValueError(f"Unknown policy: {name}")
+    seeds = tournament_seeds(seed, games)
+    setting = (max_steps, grid_width, grid_height)
+    wanted = {(name, game_seed, *setting) for name in policies for game_seed in seeds}
+    results = [
+        result for result in (read_results(results_path) if results_path else [])
+        if (result.policy, result.seed, result.max_steps, result.grid_width, result.grid_height) in wanted
+    ]
+    done = {(result.policy, result.seed) for result in results}
+    # Seed-major order, so a partial run has every policy on the same first seeds.
+    tasks = [
+        (name, game_seed, max_steps, grid_width, grid_height)
+        for game_seed in seeds for name in policies if (name, game_seed) not in done
+    ]
+    with spawn_context().Pool(workers) as pool:
+        for result in pool.imap_unordered(play_game, tasks, chunksize=1):
+            results.append(result)
+            if results_path is not None:
+                with open(results_path, 'a') as file:
+                    file.write(json.dumps(result._asdict()) + '\n')
+            if on_result is not None:
+                on_result(result, results)
+    return summarize(results)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Compare bot policies on the same seeded games.')
+    parser.add_argument('--policies', nargs='+', choices=sorted(POLICIES), default=sorted(POLICIES))
+    parser.add_argument('--games', type=int, default=100, help='Seeded games per policy')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--workers', type=int, default=None)
+    parser.add_argument('--max-steps', type=int, default=10000)
+    parser.add_argument('--results', default='tournament-results.jsonl',
+                        help='JSON-lines file games are streamed to; reused to resume a run')
+    parser.add_argument('--report', default=None, help='Also write the final table to this file')
+    parser.add_argument('--progress-every', type=int, default=100,
+                        help='Print the table after this many new games')
+    parser.add_argument('--summarize', action='store_true',
+                        help='Only print the table of the games in the results file played with these '
+                             'policies and --max-steps')
+    args = parser.parse_args(argv)
+
+    if args.summarize:
+        results = [
+            result for result in read_results(args.results)
+            if result.policy in args.policies and result.max_steps == args.max_steps
+        ]
+        print(format_report(summarize(results)))
+        return
+
+    new_results = []
+
+    def progress(result, results):
+        new_results.append(result)
+        if args.progress_every and len(new_results) % args.progress_every == 0:
+            print(f"{len(new_results)} games played", flush=True)
+            print(format_report(summarize(results)), flush=True)
+
+    summary = run_tournament(
+        args.policies, args.games, args.seed, args.workers, args.results, args.max_steps, on_result=progress,
+    )
+    report = format_report(summary)
+    print(report)
+    if args.report:
+        with open(args.report, 'w') as file:
+            file.write(report + '\n')
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,175 @@
+import argparse
+import json
+import math
+import os
+import random
+import sys
+from ai_player.autoplayer import AutoPlayer
+from ai_player.evaluation import Weights, DEFAULT_WEIGHTS
+from game_engine.headless_game import HeadlessGame
+from game_engine.processes import spawn_context
+
+WEIGHT_DIGITS = 4  # Sampled weights are rounded so cache keys compare exactly
+
+
+def game_seeds(base_seed, games):
+    """The fixed seeds every candidate is scored on."""
+    rng = random.Random(f'games:{base_seed}')
+    return [rng.getrandbits(64) for _ in range(games)]
+
+
+def play(task):
+    """
+    Play one seeded headless game with the given weights.
+
+    Parameters:
+        task (tuple): (weights, seed, max_pieces, grid_width, grid_height).
+
+    Returns:
+        tuple: (weights, seed, score, rows cleared, pieces placed).
+    """
+    weights, seed, max_pieces, grid_width, grid_height = task
+    game = HeadlessGame(grid_width, grid_height, seed=seed)
+    # Untimed and one ply deep, so the result depends only on weights and seed.
+    player = AutoPlayer(weights, time_budget_ms=None, max_depth=1)
+    while not game.game_over and game.pieces_placed < max_pieces:
+        game.step(player.choose_action(game))
+    return tuple(weights), seed, game.get_score(), game.rows_cleared, game.pieces_placed
+
+
+class ResultCache:
+    """
+    Game results keyed by (weights, seed), appended to a JSON-lines file.
+
+    Every result is written as soon as it arrives, so an interrupted run
+    loses at most the games still in flight and a rerun with the same
+    arguments replays the finished ones from the file. Each line also
+    records max_pieces and the grid size, and only lines played with the
+    cache's own setting are loaded, so runs with other settings can share
+    the file without being mixed in.
+    """
+
+    def __init__(self, path=None, max_pieces=500, grid_width=10, grid_height=20):
+        self.path = path
+        self.setting = {'max_pieces': max_pieces, 'grid_width': grid_width, 'grid_height': grid_height}
+        self.results = {}
+        if path is not None and os.path.exists(path):
+            with open(path) as file:
+                for line in file:
+                    try:
+                        entry = json.loads(line)
+                    except ValueError:
+                        continue  # A line cut short when the last run was killed
+                    if any(entry.get(name) != value for name, value in self.setting.items()):
+                        continue
+                    self.results[(tuple(entry['weights']), entry['seed'])] = (
+                        entry['score'], entry['rows_cleared'], entry['pieces'],
+                    )
+
+    def get(self, weights, seed):
+        return self.results.get((tuple(weights), seed))
+
+    def add(self, weights, seed, score, rows_cleared, pieces):
+        self.results[(tuple(weights), seed)] = (score, rows_cleared, pieces)
+        if self.path is not None:
+            with open(self.path, 'a') as file:
+                file.write(json.dumps({
+                    'weights': list(weights), 'seed': seed, 'score': score,
+                    'rows_cleared': rows_cleared, 'pieces': pieces, **self.setting,
+                }) + '\n')
+
+
+def sample_population(rng, mean, std, size):
+    """Draw size weight vectors from independent normals; the mean itself comes first."""
+    population = [Weights(*(round(value, WEIGHT_DIGITS) for value in mean))]
+    while len(population) < size:
+        population.append(Weights(*(
+            round(rng.gauss(mu, sigma), WEIGHT_DIGITS) for mu, sigma in zip(mean, std)
+        )))
+    return population
+
+
+def tune(generations=10, population=16, games=8, elite_fraction=0.25, seed=0, workers=None,
+         cache_path=None, initial=DEFAULT_WEIGHTS, initial_std=0.5, min_std=0.02, max_pieces=500,
+         grid_width=10, grid_height=20, report=None):
+    """
+    Tune evaluator weights with the cross-entropy method.
+
+    Each generation samples candidates around the current mean, scores
+    each one by its mean game score over the same fixed seeds, and refits
+    the mean and spread to the elite candidates. Games run on a process
+    pool, and every candidate and seed is derived from `seed`, so the
+    result does not depend on the number of workers and a rerun with a
+    cache file picks up where the last one stopped.
+
+    Parameters:
+        games (int): Seeded games per candidate.
+        elite_fraction (float): Share of each generation the next is fitted to.
+        min_std (float): Floor on the spread, so the search keeps exploring.
+        max_pieces (int): Pieces after which a game is cut off, so strong
+            candidates finish in bounded time.
+        report (callable): Called with (generation, best Weights, best fitness)
+            after each generation.
+
+    Returns:
+        tuple: (best Weights seen, its mean score).
+    """
+    seeds = game_seeds(seed, games)
+    cache = ResultCache(cache_path, max_pieces, grid_width, grid_height)
+    mean = list(initial)
+    std = [initial_std] * len(mean)
+    elite_count = max(1, int(population * elite_fraction))
+    best = (-math.inf, None)
+    with spawn_context().Pool(workers) as pool:
+        for generation in range(generations):
+            rng = random.Random(f'{seed}:{generation}')
+            candidates = sample_population(rng, mean, std, population)
+            tasks = [
+                (weights, game_seed, max_pieces, grid_width, grid_height)
+                for weights in dict.fromkeys(candidates) for game_seed in seeds
+                if cache.get(weights, game_seed) is None
+            ]
+            for result in pool.imap_unordered(play, tasks, chunksize=1):
+                cache.add(*result)
+
+            ranked = sorted(
+                candidates, key=lambda weights: -sum(cache.get(weights, s)[0] for s in seeds) / games
+            )
+            fitness = sum(cache.get(ranked[0], s)[0] for s in seeds) / games
+            if fitness > best[0]:
+                best = (fitness, ranked[0])
+            elite = ranked[:elite_count]
+            mean = [sum(values) / elite_count for values in zip(*elite)]
+            std = [
+                max(min_std, math.sqrt(sum((value - mu) ** 2 for value in values) / elite_count))
+                for values, mu in zip(zip(*elite), mean)
+            ]
+            if report is not None:
+                report(generation, best[1], best[0])
+    return best[1], best[0]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Tune the autoplayer evaluation weights.')
+    parser.add_argument('--generations', type=int, default=10)
+    parser.add_argument('--population', type=int, default=16)
+    parser.add_argument('--games', type=int, default=8, help='Seeded games per candidate')
+    parser.add_argument('--elite-fraction', type=float, default=0.25)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--workers', type=int, default=None)
+    parser.add_argument('--max-pieces', type=int, default=500)
+    parser.add_argument('--cache', default=None, help='JSON-lines file of results; reused to resume a run')
+    args = parser.parse_args(argv)
+
+    def report(generation, weights, fitness):
+        print(f"generation {generation}: best mean score {fitness:.1f} with {weights}", flush=True)
+
+    weights, fitness = tune(
+        args.generations, args.population, args.games, args.elite_fraction, args.seed, args.workers,
+        args.cache, max_pieces=args.max_pieces, report=report,
+    )
+    print(f"best: {fitness:.1f}")
+    print(repr(weights))
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
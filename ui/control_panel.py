@@ -1,5 +1,6 @@
 import pygame
 from pygame.locals import MOUSEBUTTONDOWN
+from game_engine.events import LinesCleared, LevelUp, GameOver, GameStarted
 
 class ControlPanel(pygame.sprite.Sprite):
     def __init__(self, game, cell_size, grid_width, grid_height, control_panel_width):
@@ -13,6 +14,10 @@ class ControlPanel(pygame.sprite.Sprite):
         self.small_font = pygame.font.Font(None, 24)
         self.create_buttons()
         self.create_labels()
+        # Labels to re-render on the next refresh()
+        self.score_dirty = True
+        self.level_dirty = True
+        self.top_score_dirty = True
         self.buttons = pygame.sprite.Group(
             self.start_button, 
             self.pause_button, 
@@ -84,14 +89,54 @@ class ControlPanel(pygame.sprite.Sprite):
                         self.game.toggle_high_scores()  # Close the high scores screen
 
 
+    def subscribe(self, events):
+        """Mark labels dirty from a Game's EventBus instead of polling every frame."""
+        events.subscribe(LinesCleared, self.mark_score_dirty)
+        events.subscribe(LevelUp, self.mark_level_dirty)
+        events.subscribe(GameOver, self.mark_top_score_dirty)
+        events.subscribe(GameStarted, self.mark_all_dirty)
+
+    def mark_score_dirty(self, event=None):
+        self.score_dirty = True
+
+    def mark_level_dirty(self, event=None):
+        self.level_dirty = True
+
+    def mark_top_score_dirty(self, event=None):
+        self.top_score_dirty = True
+
+    def mark_all_dirty(self, event=None):
+        self.score_dirty = self.level_dirty = self.top_score_dirty = True
+
+    def refresh(self):
+        """Re-render only the labels whose values changed since the last refresh."""
+        if self.score_dirty:
+            self.update_score_label()
+        if self.level_dirty:
+            self.update_level_label()
+        if self.top_score_dirty:
+            self.update_top_score_label()
+
     def update(self):
-        level = self.game.level_manager.get_level()
+        """Re-render every label."""
+        self.update_score_label()
+        self.update_level_label()
+        self.update_top_score_label()
+
+    def update_score_label(self):
         self.score_label.image = self.font.render(f'Score: {self.game.get_score()}', True, (255, 255, 255))
+        self.score_dirty = False
+
+    def update_level_label(self):
+        level = self.game.level_manager.get_level()
         self.level_label.image = self.font.render(f'Level: {level}', True, (255, 255, 255))
+        self.level_dirty = False
 
+    def update_top_score_label(self):
         top_score = self.game.high_scores_persistence_manager.get_top_high_score()
         top_score_value = top_score["score"] if top_score else 0
         self.top_score_label.image = self.font.render(f'All-Time Best: {top_score_value}', True, (255, 255, 255))
+        self.top_score_dirty = False
 
     def draw_high_scores(self, surface):
         # Get the screen dimensions
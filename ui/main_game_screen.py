@@ -10,21 +10,34 @@ class MainGameScreen:
         self.screen = screen  # Use the screen passed as an argument
 
     def draw_grid(self, grid):
-        for y in range(grid.height):
-            for x in range(grid.width):
+        # grid.colors resolves palette cells to colors here, at render time.
+        for y, row in enumerate(grid.colors):
+            for x, color in enumerate(row):
                 rect = pygame.Rect(x * self.cell_size, y * self.cell_size, self.cell_size, self.cell_size)
-                if grid.grid[y][x][0] == 0:
-                    pygame.draw.rect(self.screen, (0, 0, 0), rect)
-                else:
-                    pygame.draw.rect(self.screen, grid.grid[y][x][1], rect)
+                pygame.draw.rect(self.screen, (0, 0, 0) if color is None else color, rect)
                 pygame.draw.rect(self.screen, (50, 50, 50), rect, 1)
 
-    def draw_tetromino(self, tetromino):
+    def draw_tetromino(self, tetromino, fall=0.0):
+        """
+        Draw the falling Tetromino.
+
+        Parameters:
+            tetromino (Tetromino): The piece to draw.
+            fall (float): Fraction of a row (0-1) to draw the piece below its
+                cell position, to interpolate between gravity steps.
+        """
+        offset = int(fall * self.cell_size)
         for x, y in tetromino.get_blocks():
-            rect = pygame.Rect(x * self.cell_size, y * self.cell_size, self.cell_size, self.cell_size)
+            rect = pygame.Rect(x * self.cell_size, y * self.cell_size + offset, self.cell_size, self.cell_size)
             pygame.draw.rect(self.screen, tetromino.color, rect)
             pygame.draw.rect(self.screen, (50, 50, 50), rect, 1)
 
+    def draw_ghost(self, tetromino, grid):
+        """Outline where the Tetromino would land if dropped now."""
+        for x, y in tetromino.get_ghost_blocks(grid):
+            rect = pygame.Rect(x * self.cell_size, y * self.cell_size, self.cell_size, self.cell_size)
+            pygame.draw.rect(self.screen, tetromino.color, rect, 2)
+
     def update(self, grid, tetromino):
         self.screen.fill((0, 0, 0))
         self.draw_grid(grid)